@@ -1,11 +1,17 @@
 """Advanced alert system for price monitoring, thesis changes, and research notifications."""
 
+import atexit
+import heapq
 import json
+import logging
+import os
+import queue
 import smtplib
 import requests
+from collections import Counter, defaultdict, deque
 from datetime import datetime, timedelta, time
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable, Union
+from typing import BinaryIO, Deque, Dict, Iterator, List, Any, Optional, Callable, Tuple, Union
 from dataclasses import dataclass, field, asdict
 try:
     from email.mime.text import MimeText
@@ -20,6 +26,24 @@ except ImportError:
     from email import encoders
 import threading
 import time as time_module
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 # Import enhanced webhook integrations
 from .webhook_integrations import WebhookIntegrations, WebhookMessage, WebhookPlatform
@@ -29,6 +53,77 @@ from .finnhub_client import FinnhubClient
 from .saved_research_store import SavedResearchStore
 from .historical_tracker import HistoricalTracker
 
+logger = logging.getLogger(__name__)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize to a newline-terminated JSON Lines record."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, separators=(',', ':')).encode() + b'\n'
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_tail_lines(path: Path, max_lines: int, block_size: int = 131072) -> List[bytes]:
+    """Read up to the last max_lines non-empty lines of a file without reading all of it."""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b''
+        
+        # Read backwards until enough line breaks are buffered or the start is reached
+        while position > 0 and data.count(b'\n') <= max_lines:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+    
+    lines = data.splitlines()
+    if position > 0:
+        # First line may be a partial record
+        lines = lines[1:]
+    
+    return [line for line in lines if line.strip()][-max_lines:]
+
+
+# Managers with possibly unsaved state; flushed at interpreter exit unless
+# closed (or garbage collected) first
+_open_managers: "weakref.WeakSet[AlertManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_managers() -> None:
+    """Flush pending alert state of managers that were never closed."""
+    for manager in list(_open_managers):
+        manager.flush()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write bytes to a temporary file and atomically replace the target."""
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
 
 class AlertType(Enum):
     """Types of alerts supported by the system."""
@@ -67,12 +162,41 @@ class AlertRule:
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     last_triggered: Optional[str] = None
     trigger_count: int = 0
+    # Serialized form reused until a field is reassigned
+    _dict_cache: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name != '_dict_cache':
+            object.__setattr__(self, '_dict_cache', None)
+        object.__setattr__(self, name, value)
     
     def to_dict(self) -> Dict:
+        """Serialize the rule.
+        
+        The serialized form is cached until a field is reassigned or the
+        recipient list is edited in place; each call returns a fresh copy.
+        """
+        cache = self._dict_cache
+        if cache is None or cache['email_recipients'] != self.email_recipients:
+            cache = self._build_dict()
+            self._dict_cache = cache
+        return {**cache, 'email_recipients': list(cache['email_recipients'])}
+    
+    def _build_dict(self) -> Dict:
         return {
-            **asdict(self),
+            'id': self.id,
+            'name': self.name,
             'alert_type': self.alert_type.value if isinstance(self.alert_type, AlertType) else self.alert_type,
-            'trigger': self.trigger.value if isinstance(self.trigger, AlertTrigger) else self.trigger
+            'trigger': self.trigger.value if isinstance(self.trigger, AlertTrigger) else self.trigger,
+            'condition_value': self.condition_value,
+            'ticker': self.ticker,
+            'theme': self.theme,
+            'enabled': self.enabled,
+            'email_recipients': list(self.email_recipients),
+            'webhook_url': self.webhook_url,
+            'created_at': self.created_at,
+            'last_triggered': self.last_triggered,
+            'trigger_count': self.trigger_count
         }
     
     @classmethod
@@ -99,9 +223,27 @@ class AlertEvent:
     additional_data: Dict = field(default_factory=dict)
     delivered: bool = False
     delivery_methods: List[str] = field(default_factory=list)
+    # Epoch seconds parsed once from timestamp, used for ordering and time windows
+    _ts_epoch: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        try:
+            self._ts_epoch = datetime.fromisoformat(self.timestamp).timestamp()
+        except (TypeError, ValueError):
+            self._ts_epoch = 0.0
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            'alert_rule_id': self.alert_rule_id,
+            'timestamp': self.timestamp,
+            'trigger_reason': self.trigger_reason,
+            'current_value': self.current_value,
+            'threshold_value': self.threshold_value,
+            'ticker': self.ticker,
+            'additional_data': dict(self.additional_data),
+            'delivered': self.delivered,
+            'delivery_methods': list(self.delivery_methods)
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'AlertEvent':
@@ -129,6 +271,15 @@ class EmailConfig:
 class AlertNotificationEngine:
     """Handles delivery of alerts via email, webhooks, etc."""
     
+    # Header color of alert emails by alert type
+    ALERT_COLORS = {
+        AlertType.PRICE_ALERT: "#FF6B35",
+        AlertType.THESIS_CHANGE: "#4ECDC4", 
+        AlertType.DAILY_DIGEST: "#45B7D1",
+        AlertType.RESEARCH_UPDATE: "#96CEB4",
+        AlertType.PERFORMANCE_ALERT: "#FECA57"
+    }
+    
     def __init__(self, email_config: Optional[EmailConfig] = None):
         """Initialize notification engine.
         
@@ -138,6 +289,14 @@ class AlertNotificationEngine:
         self.email_config = email_config
         self.webhook_integrations = WebhookIntegrations()
     
+    def update_config(self, email_config: Optional[EmailConfig]) -> None:
+        """Replace the email configuration, keeping the existing engine state.
+        
+        Args:
+            email_config: New email configuration for email alerts
+        """
+        self.email_config = email_config
+    
     def send_email_alert(self, alert_rule: AlertRule, alert_event: AlertEvent, 
                         custom_message: str = None) -> bool:
         """Send alert via email.
@@ -186,8 +345,8 @@ class AlertNotificationEngine:
             
             return True
             
-        except Exception as e:
-            print(f"Failed to send email alert: {e}")
+        except Exception:
+            logger.exception("Failed to send email alert")
             return False
     
     def send_webhook_alert(self, alert_rule: AlertRule, alert_event: AlertEvent) -> bool:
@@ -232,11 +391,65 @@ class AlertNotificationEngine:
                 
                 return self.webhook_integrations.send_message(alert_rule.webhook_url, message)
             
-        except Exception as e:
-            print(f"Failed to send enhanced webhook alert: {e}")
+        except Exception:
+            logger.warning("Failed to send enhanced webhook alert", exc_info=True)
             # Fallback to basic webhook
             return self._send_basic_webhook_alert(alert_rule, alert_event)
     
+    def send_email_alert_batch(self, alert_rule: AlertRule, alert_events: List[AlertEvent]) -> bool:
+        """Send several events for the same rule as a single email.
+        
+        Args:
+            alert_rule: The alert rule that triggered
+            alert_events: Events triggered by the rule, oldest first
+            
+        Returns:
+            True if email sent successfully
+        """
+        if len(alert_events) == 1:
+            return self.send_email_alert(alert_rule, alert_events[0])
+        
+        return self.send_email_alert(
+            alert_rule, alert_events[-1],
+            custom_message=self._generate_batch_email_body(alert_rule, alert_events)
+        )
+    
+    def send_webhook_alert_batch(self, alert_rule: AlertRule, alert_events: List[AlertEvent]) -> bool:
+        """Send several events for the same rule as a single webhook message.
+        
+        Args:
+            alert_rule: The alert rule that triggered
+            alert_events: Events triggered by the rule, oldest first
+            
+        Returns:
+            True if webhook sent successfully
+        """
+        if len(alert_events) == 1:
+            return self.send_webhook_alert(alert_rule, alert_events[0])
+        
+        if not alert_rule.webhook_url:
+            return False
+        
+        try:
+            message = WebhookMessage(
+                title=f"🚨 {len(alert_events)} Alerts: {alert_rule.name}",
+                content="\n".join(f"• {event.trigger_reason}" for event in alert_events),
+                platform=WebhookPlatform.GENERIC,
+                color=self.webhook_integrations.COLORS['alert'],
+                fields=[
+                    {"name": "Type", "value": alert_rule.alert_type.value.title(), "inline": True},
+                    {"name": "Trigger", "value": alert_rule.trigger.value.title(), "inline": True},
+                    {"name": "Events", "value": str(len(alert_events)), "inline": True}
+                ] + ([{"name": "Ticker", "value": alert_rule.ticker, "inline": True}] if alert_rule.ticker else []),
+                footer="Supply Chain Intel Alerts"
+            )
+            
+            return self.webhook_integrations.send_message(alert_rule.webhook_url, message)
+            
+        except Exception:
+            logger.exception("Failed to send batched webhook alert")
+            return False
+    
     def _send_basic_webhook_alert(self, alert_rule: AlertRule, alert_event: AlertEvent) -> bool:
         """Fallback basic webhook alert method."""
         try:
@@ -253,6 +466,9 @@ class AlertNotificationEngine:
                 'timestamp': datetime.now().isoformat()
             }
             
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Basic webhook payload: {json.dumps(payload)}")
+            
             response = requests.post(
                 alert_rule.webhook_url,
                 json=payload,
@@ -262,23 +478,15 @@ class AlertNotificationEngine:
             
             return response.status_code == 200
             
-        except Exception as e:
-            print(f"Failed to send basic webhook alert: {e}")
+        except Exception:
+            logger.exception("Failed to send basic webhook alert")
             return False
     
     def _generate_alert_email_body(self, alert_rule: AlertRule, alert_event: AlertEvent) -> str:
         """Generate HTML email body for alert."""
         
         # Color coding based on alert type
-        color_map = {
-            AlertType.PRICE_ALERT: "#FF6B35",
-            AlertType.THESIS_CHANGE: "#4ECDC4", 
-            AlertType.DAILY_DIGEST: "#45B7D1",
-            AlertType.RESEARCH_UPDATE: "#96CEB4",
-            AlertType.PERFORMANCE_ALERT: "#FECA57"
-        }
-        
-        color = color_map.get(alert_rule.alert_type, "#555555")
+        color = self.ALERT_COLORS.get(alert_rule.alert_type, "#555555")
         
         html = f"""
         <html>
@@ -335,6 +543,44 @@ class AlertNotificationEngine:
         
         return html
     
+    def _generate_batch_email_body(self, alert_rule: AlertRule, alert_events: List[AlertEvent]) -> str:
+        """Generate HTML email body listing several events for one rule."""
+        rows = "".join(f"""
+                        <tr style="border-bottom: 1px solid #eee;">
+                            <td style="padding: 12px; color: #333;">{event.timestamp}</td>
+                            <td style="padding: 12px; color: #333;">{event.ticker or 'N/A'}</td>
+                            <td style="padding: 12px; color: #333;">{event.trigger_reason}</td>
+                            <td style="padding: 12px; color: #333; font-weight: bold;">{event.current_value}</td>
+                            <td style="padding: 12px; color: #333;">{event.threshold_value}</td>
+                        </tr>""" for event in alert_events)
+        
+        html = f"""
+        <html>
+        <body style="font-family: Arial, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5;">
+            <div style="max-width: 600px; margin: 0 auto; background-color: white; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+                <div style="background-color: #555555; color: white; padding: 20px; text-align: center;">
+                    <h1 style="margin: 0; font-size: 24px;">Supply Chain Intel Alerts</h1>
+                    <p style="margin: 10px 0 0 0; font-size: 16px; opacity: 0.9;">{alert_rule.name}</p>
+                </div>
+                <div style="padding: 30px;">
+                    <h2 style="color: #333; margin-top: 0;">{len(alert_events)} Alerts Triggered</h2>
+                    <table style="width: 100%; border-collapse: collapse; margin: 20px 0;">
+                        <tr style="border-bottom: 1px solid #eee; color: #666;">
+                            <th style="padding: 12px; text-align: left;">Time</th>
+                            <th style="padding: 12px; text-align: left;">Ticker</th>
+                            <th style="padding: 12px; text-align: left;">Trigger</th>
+                            <th style="padding: 12px; text-align: left;">Current</th>
+                            <th style="padding: 12px; text-align: left;">Threshold</th>
+                        </tr>{rows}
+                    </table>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+        
+        return html
+    
     def _generate_additional_context(self, alert_rule: AlertRule, alert_event: AlertEvent) -> str:
         """Generate additional context based on alert type."""
         if alert_rule.alert_type == AlertType.DAILY_DIGEST:
@@ -390,19 +636,39 @@ class AlertNotificationEngine:
 class AlertManager:
     """Main alert management system."""
     
-    def __init__(self, data_dir: Path, finnhub_client: FinnhubClient = None):
+    # Number of rule-statistics updates after which a pending save is flushed early
+    RULES_FLUSH_THRESHOLD = 50
+    # Number of events kept when the event log is compacted
+    MAX_EVENTS = 1000
+    # Number of logged events that triggers compaction of the event log
+    EVENTS_COMPACT_THRESHOLD = 2000
+    # Rolling window reported by get_alert_statistics
+    STATS_WINDOW_DAYS = 30
+    # Write buffer size of the persistent event log handle
+    EVENTS_BUFFER_SIZE = 65536
+    # Seconds after a rule notifies during which its further events are
+    # collected and then delivered together
+    DELIVERY_BATCH_WINDOW = 2.0
+    
+    def __init__(self, data_dir: Path, finnhub_client: FinnhubClient = None,
+                 rules_flush_interval: float = 5.0):
         """Initialize alert manager.
         
         Args:
             data_dir: Directory for storing alert data
             finnhub_client: Finnhub client for price data
+            rules_flush_interval: Seconds between background saves of rule statistics
         """
         self.data_dir = data_dir
         self.alerts_dir = data_dir / 'alerts'
         self.alerts_dir.mkdir(parents=True, exist_ok=True)
         
         self.rules_file = self.alerts_dir / 'alert_rules.json'
-        self.events_file = self.alerts_dir / 'alert_events.json'
+        self.events_file = self.alerts_dir / 'alert_events.jsonl'
+        self.legacy_events_file = self.alerts_dir / 'alert_events.json'
+        # zstd-compressed snapshot written on compaction; newer events are appended to events_file
+        self.events_snapshot_file = self.alerts_dir / 'alert_events.jsonl.zst'
+        self._zstd_compressor = zstandard.ZstdCompressor(level=3) if zstandard else None
         self.config_file = self.alerts_dir / 'config.json'
         
         self.finnhub_client = finnhub_client or FinnhubClient()
@@ -410,15 +676,60 @@ class AlertManager:
         self.historical_tracker = HistoricalTracker(data_dir)
         
         # Load configuration and rules
+        self._config_data: Dict = self._load_config_data()
         self.email_config = self._load_email_config()
         self.notification_engine = AlertNotificationEngine(self.email_config)
         self.alert_rules: Dict[str, AlertRule] = self._load_alert_rules()
-        self.alert_events: List[AlertEvent] = self._load_alert_events()
+        # Cached number of enabled rules; None means it must be recounted
+        self._enabled_rule_count: Optional[int] = None
+        # Events are kept oldest-to-newest; the oldest drop off once MAX_EVENTS is reached
+        self.alert_events: Deque[AlertEvent] = deque(
+            sorted(self._load_alert_events(), key=lambda e: e._ts_epoch),
+            maxlen=self.MAX_EVENTS
+        )
+        
+        # Per-rule index over alert_events, in the same oldest-to-newest order
+        self._events_by_rule: Dict[str, Deque[AlertEvent]] = defaultdict(deque)
+        for event in self.alert_events:
+            self._events_by_rule[event.alert_rule_id].append(event)
+        
+        # Rolling statistics window of (epoch, alert type), kept in step with alert_events
+        self._stats_lock = threading.Lock()
+        self._recent_events: Deque[Tuple[float, Optional[str]]] = deque(maxlen=self.MAX_EVENTS)
+        self._recent_events_by_type: Counter = Counter()
+        for event in self.alert_events:
+            self._track_event_stats(event)
+        
+        # Append-only event log; the handle is opened on the first append
+        self._events_lock = threading.Lock()
+        self._events_logged = len(self.alert_events)
+        self._events_fh: Optional[BinaryIO] = None
+        
+        # Email and webhook notifications are delivered concurrently
+        self._delivery_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='alert-delivery')
+        
+        # Events held back while their rule's delivery window is open, and the
+        # monotonic time each rule's window closes; sent by the background saver
+        self._delivery_lock = threading.Lock()
+        self._pending_deliveries: Dict[str, List[AlertEvent]] = {}
+        self._delivery_window_ends: Dict[str, float] = {}
         
         # Background monitoring
         self._monitoring = False
         self._monitor_thread: Optional[threading.Thread] = None
         
+        # Debounced persistence of rule statistics (last_triggered, trigger_count).
+        # Disk writes requested while processing events go through _save_queue and
+        # are performed by the background saver thread.
+        self.rules_flush_interval = rules_flush_interval
+        self._rules_lock = threading.RLock()
+        self._rules_dirty = False
+        self._pending_rule_updates = 0
+        self._save_queue: queue.Queue = queue.Queue()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._closed = False
+        _open_managers.add(self)
+        
     def create_alert_rule(self, name: str, alert_type: AlertType, trigger: AlertTrigger,
                          condition_value: float, ticker: str = None, theme: str = None,
                          email_recipients: List[str] = None, webhook_url: str = None) -> AlertRule:
@@ -452,6 +763,7 @@ class AlertManager:
         )
         
         self.alert_rules[rule_id] = rule
+        self._enabled_rule_count = None
         self._save_alert_rules()
         
         return rule
@@ -517,6 +829,9 @@ class AlertManager:
             if hasattr(rule, key):
                 setattr(rule, key, value)
         
+        if 'enabled' in updates:
+            self._enabled_rule_count = None
+        
         self._save_alert_rules()
         return True
     
@@ -531,6 +846,7 @@ class AlertManager:
         """
         if rule_id in self.alert_rules:
             del self.alert_rules[rule_id]
+            self._enabled_rule_count = None
             self._save_alert_rules()
             return True
         return False
@@ -567,8 +883,8 @@ class AlertManager:
                 try:
                     self.check_all_alerts()
                     time_module.sleep(check_interval)
-                except Exception as e:
-                    print(f"Alert monitoring error: {e}")
+                except Exception:
+                    logger.exception("Alert monitoring error")
                     time_module.sleep(60)  # Sleep 1 minute on error
         
         self._monitor_thread = threading.Thread(target=monitor_loop, daemon=True)
@@ -592,11 +908,8 @@ class AlertManager:
             try:
                 events = self._check_alert_rule(rule)
                 triggered_events.extend(events)
-            except Exception as e:
-                print(f"Error checking alert rule {rule.id}: {e}")
-        
-        if triggered_events:
-            self._save_alert_events()
+            except Exception:
+                logger.exception(f"Error checking alert rule {rule.id}")
         
         return triggered_events
     
@@ -622,10 +935,9 @@ class AlertManager:
         elif rule.alert_type == AlertType.PERFORMANCE_ALERT:
             events = self._check_performance_alert(rule)
         
-        # Process triggered events
-        for event in events:
-            self._process_alert_event(rule, event)
-            self.alert_events.append(event)
+        # Process triggered events, delivering one notification per rule
+        if events:
+            self._process_alert_events(rule, events)
         
         return events
     
@@ -675,8 +987,8 @@ class AlertManager:
                     additional_data=quote
                 )]
             
-        except Exception as e:
-            print(f"Error checking price for {rule.ticker}: {e}")
+        except Exception:
+            logger.warning(f"Error checking price for {rule.ticker}", exc_info=True)
         
         return []
     
@@ -760,32 +1072,267 @@ class AlertManager:
         }
     
     def _process_alert_event(self, rule: AlertRule, event: AlertEvent) -> None:
-        """Process a triggered alert event by sending notifications.
+        """Process a triggered alert event by sending notifications and recording it.
         
         Args:
             rule: AlertRule that triggered
             event: AlertEvent with trigger details
         """
-        delivery_success = []
+        self._process_alert_events(rule, [event])
+    
+    def _process_alert_events(self, rule: AlertRule, events: List[AlertEvent]) -> None:
+        """Process events triggered by one rule, sending a single notification per channel.
         
-        # Send email notification
-        if rule.email_recipients:
-            if self.notification_engine.send_email_alert(rule, event):
-                delivery_success.append('email')
+        The first events for a rule are delivered straight away and open a
+        DELIVERY_BATCH_WINDOW for it. Events triggered while the window is open
+        are queued and delivered together by the background saver when it
+        closes, so an alert storm sends one message per window rather than one
+        per event. Events are recorded once their notification has been sent,
+        so the event log holds their final delivery status.
+        
+        Args:
+            rule: AlertRule that triggered
+            events: AlertEvents with trigger details, oldest first
+        """
+        # Update rule statistics; persisted by the background flusher
+        rule.last_triggered = events[-1].timestamp
+        rule.trigger_count += len(events)
+        self._mark_rules_dirty()
+        
+        if not (rule.email_recipients or rule.webhook_url):
+            self._deliver_alert_events(rule, events)
+            self._record_alert_events(events)
+            return
         
-        # Send webhook notification  
+        with self._delivery_lock:
+            now = time_module.monotonic()
+            if now < self._delivery_window_ends.get(rule.id, 0.0):
+                pending = self._pending_deliveries.setdefault(rule.id, [])
+                first_pending = not pending
+                pending.extend(events)
+            else:
+                self._delivery_window_ends[rule.id] = now + self.DELIVERY_BATCH_WINDOW
+                first_pending = None
+        
+        if first_pending is None:
+            self._deliver_alert_events(rule, events)
+            self._record_alert_events(events)
+        elif first_pending:
+            # Wake the saver so it waits for this window instead of its full interval
+            self._request_save('deliveries')
+    
+    def _deliver_alert_events(self, rule: AlertRule, events: List[AlertEvent]) -> None:
+        """Send one notification per configured channel and record the outcome on the events."""
+        deliveries = {}
+        if rule.email_recipients:
+            deliveries['email'] = self.notification_engine.send_email_alert_batch
         if rule.webhook_url:
-            if self.notification_engine.send_webhook_alert(rule, event):
-                delivery_success.append('webhook')
+            deliveries['webhook'] = self.notification_engine.send_webhook_alert_batch
         
-        # Update event with delivery status
-        event.delivered = len(delivery_success) > 0
-        event.delivery_methods = delivery_success
+        delivery_success = []
         
-        # Update rule statistics
-        rule.last_triggered = event.timestamp
-        rule.trigger_count += 1
-        self._save_alert_rules()
+        if len(deliveries) > 1:
+            # Email and webhook are independent round-trips; send them in parallel
+            futures = {method: self._delivery_pool.submit(send, rule, events)
+                       for method, send in deliveries.items()}
+            for method, future in futures.items():
+                if future.result():
+                    delivery_success.append(method)
+        else:
+            for method, send in deliveries.items():
+                if send(rule, events):
+                    delivery_success.append(method)
+        
+        # Update events with delivery status
+        for event in events:
+            event.delivered = len(delivery_success) > 0
+            event.delivery_methods = list(delivery_success)
+    
+    def _flush_pending_deliveries(self, force: bool = False) -> None:
+        """Deliver queued events whose rule's delivery window has closed.
+        
+        Args:
+            force: Deliver every queued event regardless of its window
+        """
+        with self._delivery_lock:
+            now = time_module.monotonic()
+            due = [rule_id for rule_id in self._pending_deliveries
+                   if force or self._delivery_window_ends.get(rule_id, 0.0) <= now]
+            batches = [(rule_id, self._pending_deliveries.pop(rule_id)) for rule_id in due]
+            for rule_id in due:
+                # A rule still triggering keeps being batched in the next window
+                self._delivery_window_ends[rule_id] = now + self.DELIVERY_BATCH_WINDOW
+            for rule_id in [rule_id for rule_id, ends in self._delivery_window_ends.items()
+                            if ends <= now and rule_id not in self._pending_deliveries]:
+                del self._delivery_window_ends[rule_id]
+        
+        for rule_id, events in batches:
+            rule = self.alert_rules.get(rule_id)
+            if rule is None:
+                logger.warning(f"Not sending {len(events)} queued alerts for deleted rule {rule_id}")
+            else:
+                try:
+                    self._deliver_alert_events(rule, events)
+                except Exception:
+                    logger.exception(f"Error delivering queued alerts for rule {rule_id}")
+            # Recorded after the attempt so the log holds the final delivery status
+            self._record_alert_events(events)
+    
+    def _next_save_timeout(self) -> float:
+        """Seconds the saver may wait before the next flush or delivery is due."""
+        with self._delivery_lock:
+            if not self._pending_deliveries:
+                return self.rules_flush_interval
+            due = min(self._delivery_window_ends.get(rule_id, 0.0) for rule_id in self._pending_deliveries)
+        return max(0.0, min(self.rules_flush_interval, due - time_module.monotonic()))
+    
+    def _mark_rules_dirty(self) -> None:
+        """Schedule a save of alert rules instead of writing immediately."""
+        with self._rules_lock:
+            self._rules_dirty = True
+            self._pending_rule_updates += 1
+            
+            if self._pending_rule_updates >= self.RULES_FLUSH_THRESHOLD:
+                self._request_save('rules')
+            else:
+                self._ensure_saver_thread()
+    
+    def _request_save(self, target: Optional[str]) -> None:
+        """Queue a save for the background saver thread.
+        
+        Args:
+            target: 'rules', 'events' (compaction), 'deliveries' (queued
+                notifications), or None to stop the saver
+        """
+        self._ensure_saver_thread()
+        self._save_queue.put_nowait(target)
+    
+    def _ensure_saver_thread(self) -> None:
+        """Start the background saver thread on first use."""
+        with self._rules_lock:
+            if self._flush_thread is None and not self._closed:
+                self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+                self._flush_thread.start()
+    
+    def _flush_loop(self) -> None:
+        """Background saver: handles queued save requests, sends batched alerts once
+        their window closes and flushes on each interval."""
+        while True:
+            try:
+                requests = {self._save_queue.get(timeout=self._next_save_timeout())}
+                # Let requests arriving in quick succession coalesce into one write
+                time_module.sleep(0.05)
+            except queue.Empty:
+                requests = set()
+            
+            while True:
+                try:
+                    requests.add(self._save_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            self._flush_pending_deliveries(force=None in requests)
+            if 'events' in requests:
+                self._save_alert_events()
+            self.flush()
+            
+            if None in requests:
+                return
+    
+    def flush(self) -> None:
+        """Write any pending alert rule changes and logged events to storage."""
+        with self._rules_lock:
+            if self._rules_dirty:
+                self._save_alert_rules()
+        
+        with self._events_lock:
+            if self._events_fh is not None:
+                self._events_fh.flush()
+    
+    def close(self) -> None:
+        """Flush pending changes and stop background persistence."""
+        self._closed = True
+        _open_managers.discard(self)
+        if self._flush_thread:
+            self._save_queue.put_nowait(None)
+            self._flush_thread.join(timeout=5)
+            self._flush_thread = None
+        self._flush_pending_deliveries(force=True)
+        self._delivery_pool.shutdown(wait=True)
+        self.flush()
+        
+        with self._events_lock:
+            if self._events_fh is not None:
+                self._events_fh.close()
+                self._events_fh = None
+    
+    def _record_alert_event(self, event: AlertEvent) -> None:
+        """Add a triggered event to memory and append it to the event log."""
+        self._record_alert_events([event])
+    
+    def _record_alert_events(self, events: List[AlertEvent]) -> None:
+        """Add triggered events to memory and append them to the event log in one write."""
+        with self._events_lock:
+            for event in events:
+                if len(self.alert_events) == self.alert_events.maxlen:
+                    # The oldest event is about to be evicted; drop it from the rule index too
+                    oldest = self.alert_events[0]
+                    rule_events = self._events_by_rule.get(oldest.alert_rule_id)
+                    if rule_events and rule_events[0] is oldest:
+                        rule_events.popleft()
+                
+                self.alert_events.append(event)
+                self._events_by_rule[event.alert_rule_id].append(event)
+                self._track_event_stats(event)
+            
+            # Logged under the same lock, so compaction on the saver thread sees
+            # these events either in memory and the log together or in neither
+            compact = self._append_alert_events(events)
+        
+        if compact:
+            # Compaction rewrites the whole log; leave it to the saver thread
+            self._request_save('events')
+    
+    def _track_event_stats(self, event: AlertEvent) -> None:
+        """Add an event to the rolling statistics window."""
+        rule = self.alert_rules.get(event.alert_rule_id)
+        event_type = rule.alert_type.value if rule else None
+        
+        with self._stats_lock:
+            if len(self._recent_events) == self._recent_events.maxlen:
+                self._discount_event_type(self._recent_events[0][1])
+            
+            self._recent_events.append((event._ts_epoch, event_type))
+            if event_type:
+                self._recent_events_by_type[event_type] += 1
+    
+    def _discount_event_type(self, event_type: Optional[str]) -> None:
+        """Remove one event of the given type from the rolling counts."""
+        if not event_type:
+            return
+        self._recent_events_by_type[event_type] -= 1
+        if self._recent_events_by_type[event_type] <= 0:
+            del self._recent_events_by_type[event_type]
+    
+    def _append_alert_events(self, events: List[AlertEvent]) -> bool:
+        """Append events to the JSON Lines event log; call with _events_lock held.
+        
+        Writes go through a persistent buffered handle, opened on the first
+        append, and reach disk when the buffer fills, on flush() (run by the
+        background flusher) or on compaction.
+        
+        Returns:
+            True if the log has grown enough to be compacted
+        """
+        try:
+            if self._events_fh is None:
+                self._events_fh = open(self.events_file, 'ab', buffering=self.EVENTS_BUFFER_SIZE)
+            self._events_fh.write(b''.join(_dumps_line(event.to_dict()) for event in events))
+            self._events_logged += len(events)
+            return self._events_logged > self.EVENTS_COMPACT_THRESHOLD
+        except Exception:
+            logger.exception("Error appending alert event")
+            return False
     
     def get_alert_events(self, rule_id: str = None, limit: int = 100) -> List[AlertEvent]:
         """Get alert events, optionally filtered by rule.
@@ -797,13 +1344,39 @@ class AlertManager:
         Returns:
             List of AlertEvent objects
         """
-        events = self.alert_events
-        
         if rule_id:
-            events = [e for e in events if e.alert_rule_id == rule_id]
+            # Rule index is already ordered oldest-to-newest
+            return list(islice(reversed(self._events_by_rule.get(rule_id, ())), limit))
+        
+        # Top-k selection instead of sorting every event
+        return heapq.nlargest(limit, self.alert_events, key=lambda e: e._ts_epoch)
+    
+    def iter_events(self, rule_id: str = None) -> Iterator[AlertEvent]:
+        """Stream alert events from the event log on disk, oldest first.
+        
+        Args:
+            rule_id: Optional rule ID to filter by
+            
+        Yields:
+            AlertEvent objects, including any not held in memory
+        """
+        self.flush()
         
-        events = sorted(events, key=lambda e: e.timestamp, reverse=True)
-        return events[:limit]
+        for line in self._iter_event_log_lines():
+            data = _loads(line)
+            if rule_id and data.get('alert_rule_id') != rule_id:
+                continue
+            yield AlertEvent.from_dict(data)
+    
+    def _iter_event_log_lines(self) -> Iterator[bytes]:
+        """Yield raw event records from the compressed snapshot, then the append log."""
+        yield from self._read_snapshot_lines()
+        
+        if self.events_file.exists():
+            with open(self.events_file, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        yield line
     
     def get_alert_statistics(self) -> Dict:
         """Get alert system statistics.
@@ -812,40 +1385,49 @@ class AlertManager:
             Dictionary with alert statistics
         """
         total_rules = len(self.alert_rules)
-        enabled_rules = len([r for r in self.alert_rules.values() if r.enabled])
+        if self._enabled_rule_count is None:
+            self._enabled_rule_count = sum(1 for r in self.alert_rules.values() if r.enabled)
+        enabled_rules = self._enabled_rule_count
         total_events = len(self.alert_events)
         
-        # Events by type in last 30 days
-        cutoff = datetime.now() - timedelta(days=30)
-        recent_events = [e for e in self.alert_events 
-                        if datetime.fromisoformat(e.timestamp) > cutoff]
+        # Events by type in last 30 days; expire entries that left the window
+        cutoff_ts = (datetime.now() - timedelta(days=self.STATS_WINDOW_DAYS)).timestamp()
         
-        events_by_type = {}
-        for event in recent_events:
-            rule = self.alert_rules.get(event.alert_rule_id)
-            if rule:
-                event_type = rule.alert_type.value
-                events_by_type[event_type] = events_by_type.get(event_type, 0) + 1
+        with self._stats_lock:
+            while self._recent_events and self._recent_events[0][0] <= cutoff_ts:
+                _, event_type = self._recent_events.popleft()
+                self._discount_event_type(event_type)
+            
+            events_last_30_days = len(self._recent_events)
+            events_by_type = dict(self._recent_events_by_type)
         
         return {
             'total_rules': total_rules,
             'enabled_rules': enabled_rules,
             'total_events': total_events,
-            'events_last_30_days': len(recent_events),
+            'events_last_30_days': events_last_30_days,
             'events_by_type': events_by_type,
             'monitoring_active': self._monitoring
         }
     
-    def _load_email_config(self) -> Optional[EmailConfig]:
-        """Load email configuration from file."""
+    def _load_config_data(self) -> Dict:
+        """Load the alert configuration file once; later changes update it in memory."""
         try:
             if self.config_file.exists():
                 with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
-                    if 'email' in config_data:
-                        return EmailConfig.from_dict(config_data['email'])
-        except Exception as e:
-            print(f"Error loading email config: {e}")
+                    return json.load(f)
+        except Exception:
+            logger.exception("Error loading alert config")
+        
+        return {}
+    
+    def _load_email_config(self) -> Optional[EmailConfig]:
+        """Load email configuration from the cached config data."""
+        try:
+            if 'email' in self._config_data:
+                return EmailConfig.from_dict(self._config_data['email'])
+        except Exception:
+            logger.exception("Error loading email config")
         
         return None
     
@@ -853,54 +1435,95 @@ class AlertManager:
         """Load alert rules from storage."""
         try:
             if self.rules_file.exists():
-                with open(self.rules_file, 'r') as f:
-                    rules_data = json.load(f)
-                    return {rule_id: AlertRule.from_dict(data) 
-                           for rule_id, data in rules_data.items()}
-        except Exception as e:
-            print(f"Error loading alert rules: {e}")
+                rules_data = _loads(self.rules_file.read_bytes())
+                return {rule_id: AlertRule.from_dict(data) 
+                       for rule_id, data in rules_data.items()}
+        except Exception:
+            logger.exception("Error loading alert rules")
         
         return {}
     
     def _save_alert_rules(self) -> None:
         """Save alert rules to storage."""
         try:
-            rules_data = {rule_id: rule.to_dict() 
-                         for rule_id, rule in self.alert_rules.items()}
-            
-            with open(self.rules_file, 'w') as f:
-                json.dump(rules_data, f, indent=2)
-        except Exception as e:
-            print(f"Error saving alert rules: {e}")
+            with self._rules_lock:
+                rules_data = {rule_id: rule.to_dict() 
+                             for rule_id, rule in list(self.alert_rules.items())}
+                
+                _write_atomic(self.rules_file, _dumps(rules_data))
+                
+                self._rules_dirty = False
+                self._pending_rule_updates = 0
+        except Exception:
+            logger.exception("Error saving alert rules")
     
     def _load_alert_events(self) -> List[AlertEvent]:
         """Load alert events from storage."""
         try:
-            if self.events_file.exists():
-                with open(self.events_file, 'r') as f:
-                    events_data = json.load(f)
-                    return [AlertEvent.from_dict(data) for data in events_data]
-        except Exception as e:
-            print(f"Error loading alert events: {e}")
+            if self.events_snapshot_file.exists() or self.events_file.exists():
+                lines = self._read_snapshot_lines()
+                if self.events_file.exists():
+                    # Only the newest MAX_EVENTS are kept in memory; older lines are left on disk
+                    lines += _read_tail_lines(self.events_file, self.MAX_EVENTS)
+                return [AlertEvent.from_dict(_loads(line)) for line in lines[-self.MAX_EVENTS:]]
+            
+            if self.legacy_events_file.exists():
+                # Migrate events saved by older versions as a single JSON array
+                events = deque(self._iter_legacy_events(), maxlen=self.MAX_EVENTS)
+                _write_atomic(self.events_file, b''.join(_dumps_line(e.to_dict()) for e in events))
+                self.legacy_events_file.unlink()
+                return list(events)
+        except Exception:
+            logger.exception("Error loading alert events")
         
         return []
     
+    def _read_snapshot_lines(self) -> List[bytes]:
+        """Decompress the compacted event snapshot into JSON Lines records."""
+        if not self.events_snapshot_file.exists():
+            return []
+        
+        if zstandard is None:
+            logger.error(f"zstandard is required to read {self.events_snapshot_file}")
+            return []
+        
+        data = zstandard.ZstdDecompressor().decompress(self.events_snapshot_file.read_bytes())
+        return [line for line in data.splitlines() if line.strip()]
+    
+    def _iter_legacy_events(self) -> Iterator[AlertEvent]:
+        """Decode events from the legacy JSON array file one at a time."""
+        with open(self.legacy_events_file, 'rb') as f:
+            if ijson is not None:
+                # Stream array items instead of materializing the whole document
+                for data in ijson.items(f, 'item', use_float=True):
+                    yield AlertEvent.from_dict(data)
+            else:
+                for data in _loads(f.read()):
+                    yield AlertEvent.from_dict(data)
+    
     def _save_alert_events(self) -> None:
-        """Save alert events to storage."""
+        """Rewrite the event log with the most recent events (compaction)."""
         try:
-            # Keep only last 1000 events to prevent file from growing too large
-            events_to_save = sorted(self.alert_events, 
-                                  key=lambda e: e.timestamp, 
-                                  reverse=True)[:1000]
-            
-            events_data = [event.to_dict() for event in events_to_save]
-            
-            with open(self.events_file, 'w') as f:
-                json.dump(events_data, f, indent=2)
+            with self._events_lock:
+                # alert_events is bounded at MAX_EVENTS, so the log shrinks back to that size
+                data = b''.join(_dumps_line(event.to_dict()) for event in self.alert_events)
                 
-            self.alert_events = events_to_save
-        except Exception as e:
-            print(f"Error saving alert events: {e}")
+                if self._events_fh is not None:
+                    # Reopened by the next append
+                    self._events_fh.close()
+                    self._events_fh = None
+                if self._zstd_compressor is not None:
+                    # Retained events go to the compressed snapshot; the append log restarts empty
+                    _write_atomic(self.events_snapshot_file, self._zstd_compressor.compress(data))
+                    _write_atomic(self.events_file, b'')
+                    self._events_logged = 0
+                else:
+                    _write_atomic(self.events_file, data)
+                    if self.events_snapshot_file.exists():
+                        self.events_snapshot_file.unlink()
+                    self._events_logged = len(self.alert_events)
+        except Exception:
+            logger.exception("Error saving alert events")
     
     def configure_email(self, smtp_server: str, smtp_port: int, 
                        username: str, password: str, use_tls: bool = True) -> bool:
@@ -925,22 +1548,16 @@ class AlertManager:
                 use_tls=use_tls
             )
             
-            # Save configuration
-            config_data = {}
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
-            
-            config_data['email'] = email_config.to_dict()
-            
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            # Save configuration from the in-memory copy; no need to re-read the file
+            config_data = {**self._config_data, 'email': email_config.to_dict()}
+            _write_atomic(self.config_file, json.dumps(config_data, indent=2).encode())
             
+            self._config_data = config_data
             self.email_config = email_config
-            self.notification_engine = AlertNotificationEngine(email_config)
+            self.notification_engine.update_config(email_config)
             
             return True
             
-        except Exception as e:
-            print(f"Error configuring email: {e}")
+        except Exception:
+            logger.exception("Error configuring email")
             return False
\ No newline at end of file
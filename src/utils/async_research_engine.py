@@ -2,37 +2,44 @@
 
 import asyncio
 import aiohttp
+import functools
+import hashlib
+import heapq
+import itertools
 import json
+import time
+import uuid
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Callable, Set, Tuple
+from dataclasses import dataclass, field
 import logging
 
-from .performance_optimizer import timed, cached, AsyncExecutor, BatchProcessor
+from .performance_optimizer import timed, AsyncExecutor, BatchProcessor, MemoryCache
 from .finnhub_client import FinnhubClient
 from .tavily_client import TavilyClient
+from .http_session import close_session
 from ..agents.explore_agent import ExploreAgent
 
 logger = logging.getLogger(__name__)
 
+# Weight of the newest task in the smoothed recent duration
+DURATION_EMA_ALPHA = 0.2
 
-@dataclass
+
+@dataclass(slots=True)
 class ResearchTask:
     """Represents a research task to be processed asynchronously."""
     task_id: str
     query: str
     depth: int = 2
-    tickers: List[str] = None
+    tickers: List[str] = field(default_factory=list)
     priority: int = 0  # Higher values = higher priority
     callback: Optional[Callable] = None
-    
-    def __post_init__(self):
-        if self.tickers is None:
-            self.tickers = []
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchResult:
     """Result of an asynchronous research operation."""
     task_id: str
@@ -40,40 +47,143 @@ class ResearchResult:
     result: Optional[Dict] = None
     error: Optional[str] = None
     duration: float = 0.0
-    generated_at: str = None
+    generated_at: float = field(default_factory=time.time)  # Unix timestamp
+
+
+class ResearchBatcher:
+    """Coalesces concurrent research requests into batched upstream calls."""
+    
+    def __init__(self, batch_func: Callable[[List[Any]], List[Any]],
+                 executor: AsyncExecutor, max_batch_size: int = 8,
+                 max_queue_time: float = 0.05):
+        """Initialize research batcher.
+        
+        Args:
+            batch_func: Blocking function mapping a list of items to a list of
+                results (an Exception in the list fails only that item)
+            executor: Executor used to run batch_func off the event loop
+            max_batch_size: Maximum items per batch
+            max_queue_time: Seconds to wait for a batch to fill
+        """
+        self.batch_func = batch_func
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        
+        self._queue: Optional[asyncio.Queue] = None
+        self._runner: Optional[asyncio.Task] = None
+        self._dispatches: set = set()
+    
+    async def process(self, item: Any) -> Any:
+        """Queue an item and wait for its result from the next batch.
+        
+        Args:
+            item: Item to pass to batch_func
+            
+        Returns:
+            Result for the item
+        """
+        loop = asyncio.get_running_loop()
+        if self._runner is None or self._runner.done() or self._runner.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._runner = asyncio.create_task(self.run())
+        
+        future = loop.create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+    
+    async def run(self) -> None:
+        """Collect queued items into batches and dispatch them."""
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_queue_time
+            
+            try:
+                async with asyncio.timeout_at(deadline):
+                    while len(batch) < self.max_batch_size:
+                        batch.append(await queue.get())
+            except TimeoutError:
+                pass
+            
+            dispatch = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(dispatch)
+            dispatch.add_done_callback(self._dispatches.discard)
+    
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Run one batch and resolve its futures."""
+        try:
+            results = await self.executor.run_in_thread(
+                self.batch_func, [item for item, _ in batch]
+            )
+        except Exception as e:
+            results = [e] * len(batch)
+        
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
     
-    def __post_init__(self):
-        if self.generated_at is None:
-            self.generated_at = datetime.now().isoformat()
+    async def close(self) -> None:
+        """Stop collecting new batches."""
+        if self._runner is not None and not self._runner.done():
+            self._runner.cancel()
+        self._runner = None
 
 
 class AsyncResearchEngine:
     """High-performance asynchronous research engine."""
     
     def __init__(self, data_dir: Path, max_workers: int = 8, 
-                 enable_caching: bool = True):
+                 enable_caching: bool = True, max_completed: int = 1000):
         """Initialize async research engine.
         
         Args:
             data_dir: Data directory for outputs and caching
             max_workers: Maximum concurrent workers
             enable_caching: Whether to enable result caching
+            max_completed: Maximum completed results kept; oldest are evicted first
         """
         self.data_dir = data_dir
         self.max_workers = max_workers
         self.enable_caching = enable_caching
+        self.max_completed = max_completed
         
         # Initialize async components
         self.executor = AsyncExecutor(max_workers)
         self.batch_processor = BatchProcessor(batch_size=5, max_workers=max_workers)
+        self._batcher = ResearchBatcher(
+            self._sync_batch_research, self.executor, max_batch_size=max_workers
+        )
         
         # Initialize research agents and clients
         self.explore_agent = ExploreAgent(data_dir)
+        self._finnhub = FinnhubClient()
+        self._tavily = TavilyClient()
+        
+        # Results keyed by (query, depth, tickers), shared across task ids
+        self._result_cache = MemoryCache(default_ttl_seconds=3600, max_size=1024)
+        self._inflight: Dict[str, asyncio.Future] = {}
         
         # Task queue and results
-        self.pending_tasks: List[ResearchTask] = []
-        self.completed_results: Dict[str, ResearchResult] = {}
+        # Heap of (-priority, sequence, task); sequence keeps FIFO order within a priority
+        self.pending_tasks: List[Tuple[int, int, ResearchTask]] = []
+        self._task_seq = itertools.count()
+        self.completed_results: OrderedDict[str, ResearchResult] = OrderedDict()
         self.active_tasks: Dict[str, asyncio.Task] = {}
+        self._task_callbacks: Dict[str, Callable] = {}
+        
+        # Completion events signalled from _on_task_completed
+        self._result_events: Dict[str, asyncio.Event] = {}
+        
+        # One event per active wait_for_all_tasks call, set whenever a task finishes;
+        # created per call so the engine is not tied to a single event loop
+        self._done_waiters: Set[asyncio.Event] = set()
         
         # Performance tracking
         self.stats = {
@@ -83,6 +193,9 @@ class AsyncResearchEngine:
             'cache_hits': 0,
             'cache_misses': 0
         }
+        # Smoothed recent task duration; derived stats are cached until counters change
+        self._duration_ema = 0.0
+        self._stats_snapshot: Optional[Dict] = None
     
     async def submit_research_task(self, task: ResearchTask) -> str:
         """Submit a research task for async processing.
@@ -93,11 +206,12 @@ class AsyncResearchEngine:
         Returns:
             Task ID for tracking
         """
-        self.pending_tasks.append(task)
+        self._result_events[task.task_id] = asyncio.Event()
+        self._push_pending(task)
         
         # Start processing if not at capacity
         if len(self.active_tasks) < self.max_workers:
-            await self._process_next_task()
+            self._process_next_task()
         
         return task.task_id
     
@@ -115,8 +229,10 @@ class AsyncResearchEngine:
         tasks = []
         task_ids = []
         
+        # One timestamp per submission; the random part keeps same-second batches apart
+        prefix = f"bulk_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}_"
         for i, query in enumerate(queries):
-            task_id = f"bulk_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{i:03d}"
+            task_id = f"{prefix}{i:03d}"
             task = ResearchTask(
                 task_id=task_id,
                 query=query,
@@ -125,12 +241,14 @@ class AsyncResearchEngine:
             )
             tasks.append(task)
             task_ids.append(task_id)
+            self._result_events[task_id] = asyncio.Event()
         
         # Add to pending queue
-        self.pending_tasks.extend(tasks)
+        for task in tasks:
+            self._push_pending(task)
         
         # Process tasks in batches
-        await self._process_pending_tasks()
+        self._process_pending_tasks()
         
         return task_ids
     
@@ -150,27 +268,42 @@ class AsyncResearchEngine:
         if task_id in self.completed_results:
             return self.completed_results[task_id]
         
-        if not wait:
+        if not wait or not await self.wait_for_results([task_id], timeout):
             return None
         
-        # Wait for completion
-        start_time = asyncio.get_event_loop().time()
+        return self.completed_results.get(task_id)
+    
+    async def wait_for_results(self, task_ids: List[str], 
+                               timeout: float = 300) -> bool:
+        """Wait until every given task has a completed result.
         
-        while asyncio.get_event_loop().time() - start_time < timeout:
-            if task_id in self.completed_results:
-                return self.completed_results[task_id]
-            
-            if task_id in self.active_tasks:
-                try:
-                    await asyncio.wait_for(self.active_tasks[task_id], timeout=1.0)
-                except asyncio.TimeoutError:
-                    continue
-                except Exception:
-                    break
+        Args:
+            task_ids: Task IDs to wait for
+            timeout: Maximum wait time in seconds
             
-            await asyncio.sleep(0.1)
+        Returns:
+            True if all tasks completed, False on timeout or unknown task
+        """
+        events = []
+        for task_id in task_ids:
+            if task_id in self.completed_results:
+                continue
+            event = self._result_events.get(task_id)
+            if event is None:
+                return False
+            events.append(event)
+        
+        if not events:
+            return True
         
-        return None
+        try:
+            async with asyncio.timeout(timeout):
+                for event in events:
+                    await event.wait()
+        except TimeoutError:
+            return False
+        
+        return True
     
     async def wait_for_all_tasks(self, timeout: float = 600) -> Dict[str, ResearchResult]:
         """Wait for all pending and active tasks to complete.
@@ -181,39 +314,27 @@ class AsyncResearchEngine:
         Returns:
             Dictionary of all completed results
         """
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
         
-        while (self.pending_tasks or self.active_tasks) and \
-              (asyncio.get_event_loop().time() - start_time < timeout):
-            
-            # Process pending tasks
-            await self._process_pending_tasks()
-            
-            # Wait for active tasks
-            if self.active_tasks:
-                done, pending = await asyncio.wait(
-                    list(self.active_tasks.values()),
-                    timeout=1.0,
-                    return_when=asyncio.FIRST_COMPLETED
-                )
-                
-                # Clean up completed tasks
-                for task in done:
-                    task_id = None
-                    for tid, active_task in list(self.active_tasks.items()):
-                        if active_task == task:
-                            task_id = tid
-                            break
-                    
-                    if task_id:
-                        del self.active_tasks[task_id]
-            
-            await asyncio.sleep(0.1)
+        task_done = asyncio.Event()
+        self._done_waiters.add(task_done)
+        try:
+            async with asyncio.timeout_at(deadline):
+                while True:
+                    task_done.clear()
+                    self._process_pending_tasks()
+                    if not (self.pending_tasks or self.active_tasks):
+                        break
+                    await task_done.wait()
+        except TimeoutError:
+            pass
+        finally:
+            self._done_waiters.discard(task_done)
         
         return dict(self.completed_results)
     
     @timed('async_research_execution')
-    @cached(ttl_seconds=3600)  # Cache results for 1 hour
     async def _execute_research_task(self, task: ResearchTask) -> ResearchResult:
         """Execute a single research task asynchronously.
         
@@ -226,17 +347,33 @@ class AsyncResearchEngine:
         start_time = asyncio.get_event_loop().time()
         
         try:
-            # Execute research using thread pool to avoid blocking
-            result = await self.executor.run_in_thread(
-                self._sync_research_execution,
-                task
-            )
+            cache_key = self._research_cache_key(task) if self.enable_caching else None
+            result = self._result_cache.get(cache_key) if cache_key else None
+            inflight = self._inflight.get(cache_key) if cache_key else None
+            
+            if result is not None or inflight is not None:
+                self.stats['cache_hits'] += 1
+                self._stats_snapshot = None
+                if result is None:
+                    # Identical research already running; share its outcome
+                    result = await asyncio.shield(inflight)
+            elif cache_key:
+                self.stats['cache_misses'] += 1
+                self._stats_snapshot = None
+                result = await self._run_shared_research(cache_key, task)
+            else:
+                result = await self._run_research(task)
             
             duration = asyncio.get_event_loop().time() - start_time
             
             # Update stats
             self.stats['tasks_completed'] += 1
             self.stats['total_duration'] += duration
+            self._duration_ema = (
+                duration if self.stats['tasks_completed'] == 1
+                else DURATION_EMA_ALPHA * duration + (1 - DURATION_EMA_ALPHA) * self._duration_ema
+            )
+            self._stats_snapshot = None
             
             return ResearchResult(
                 task_id=task.task_id,
@@ -248,6 +385,7 @@ class AsyncResearchEngine:
         except Exception as e:
             duration = asyncio.get_event_loop().time() - start_time
             self.stats['tasks_failed'] += 1
+            self._stats_snapshot = None
             
             logger.error(f"Research task {task.task_id} failed: {str(e)}")
             
@@ -258,6 +396,57 @@ class AsyncResearchEngine:
                 duration=duration
             )
     
+    async def _run_shared_research(self, cache_key: str, task: ResearchTask) -> Dict:
+        """Run research while letting identical concurrent tasks await it.
+        
+        Args:
+            cache_key: Cache key of the task
+            task: Research task to execute
+            
+        Returns:
+            Research result dictionary
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        
+        try:
+            result = await self._run_research(task)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved in case nobody was waiting
+            raise
+        else:
+            future.set_result(result)
+            self._result_cache.set(cache_key, result)
+            return result
+        finally:
+            del self._inflight[cache_key]
+    
+    async def _run_research(self, task: ResearchTask) -> Dict:
+        """Run one research task on the executor's thread pool.
+        
+        Agents with batch_explore get concurrent tasks coalesced into batched
+        calls; otherwise each task explores in its own worker thread.
+        
+        Args:
+            task: Research task to execute
+            
+        Returns:
+            Research result dictionary
+        """
+        if hasattr(self.explore_agent, 'batch_explore'):
+            return await self._batcher.process(task)
+        return await self.executor.run_in_thread(self._sync_research_execution, task)
+    
+    @staticmethod
+    def _research_cache_key(task: ResearchTask) -> str:
+        """Build a cache key from the fields that determine a research result."""
+        payload = json.dumps([task.query, task.depth, sorted(task.tickers)])
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    
     def _sync_research_execution(self, task: ResearchTask) -> Dict:
         """Synchronous research execution (runs in thread pool).
         
@@ -282,61 +471,120 @@ class AsyncResearchEngine:
             'timestamp': datetime.now().isoformat()
         }
     
-    async def _process_next_task(self) -> None:
+    def _sync_batch_research(self, tasks: List[ResearchTask]) -> List[Any]:
+        """Synchronous batched research execution (runs in thread pool).
+        
+        Calls the agent's batch_explore once per depth present in the batch.
+        
+        Args:
+            tasks: Research tasks to execute
+            
+        Returns:
+            Result dictionary or Exception for each task, in order
+        """
+        batch_explore = self.explore_agent.batch_explore
+        
+        by_depth = defaultdict(list)
+        for index, task in enumerate(tasks):
+            by_depth[task.depth].append(index)
+        
+        results: List[Any] = [None] * len(tasks)
+        for depth, indices in by_depth.items():
+            try:
+                contents = batch_explore(
+                    [tasks[i].query for i in indices],
+                    depth=depth,
+                    use_cache=self.enable_caching
+                )
+            except Exception as e:
+                contents = [e] * len(indices)
+            
+            timestamp = datetime.now().isoformat()
+            for i, content in zip(indices, contents):
+                if isinstance(content, Exception):
+                    results[i] = content
+                    continue
+                task = tasks[i]
+                results[i] = {
+                    'query': task.query,
+                    'depth': task.depth,
+                    'content': content,
+                    'tickers': task.tickers,
+                    'timestamp': timestamp
+                }
+        return results
+    
+    def _process_next_task(self) -> None:
         """Process the next pending task if workers are available."""
         if not self.pending_tasks or len(self.active_tasks) >= self.max_workers:
             return
         
-        # Sort by priority (highest first)
-        self.pending_tasks.sort(key=lambda t: t.priority, reverse=True)
-        task = self.pending_tasks.pop(0)
+        # Highest priority first
+        _, _, task = heapq.heappop(self.pending_tasks)
         
-        # Start async task
-        async_task = asyncio.create_task(self._execute_research_task(task))
+        # Start async task, named after the research task id
+        async_task = asyncio.create_task(
+            self._execute_research_task(task), name=task.task_id
+        )
         self.active_tasks[task.task_id] = async_task
+        if task.callback is not None:
+            self._task_callbacks[task.task_id] = task.callback
         
-        # Set up completion callback
-        async_task.add_done_callback(
-            lambda t: asyncio.create_task(self._on_task_completed(task.task_id, t))
-        )
+        # Handle completion directly in the done callback
+        async_task.add_done_callback(self._on_task_completed)
     
-    async def _process_pending_tasks(self) -> None:
+    def _push_pending(self, task: ResearchTask) -> None:
+        """Queue a task by priority, preserving submission order for ties."""
+        heapq.heappush(self.pending_tasks, (-task.priority, next(self._task_seq), task))
+    
+    def _process_pending_tasks(self) -> None:
         """Process all pending tasks up to worker limit."""
         while self.pending_tasks and len(self.active_tasks) < self.max_workers:
-            await self._process_next_task()
+            self._process_next_task()
     
-    async def _on_task_completed(self, task_id: str, async_task: asyncio.Task) -> None:
-        """Handle task completion.
+    def _on_task_completed(self, async_task: asyncio.Task) -> None:
+        """Handle task completion (runs as the task's done callback).
         
         Args:
-            task_id: ID of completed task
-            async_task: Completed asyncio task
+            async_task: Completed asyncio task, named after its research task id
         """
+        task_id = async_task.get_name()
+        callback = self._task_callbacks.pop(task_id, None)
+        
         try:
-            result = await async_task
-            self.completed_results[task_id] = result
-            
-            # Execute callback if provided
-            if hasattr(result, 'callback') and result.callback:
-                try:
-                    result.callback(result)
-                except Exception as e:
-                    logger.error(f"Callback for task {task_id} failed: {e}")
-            
-        except Exception as e:
-            logger.error(f"Task {task_id} completion handling failed: {e}")
-            self.completed_results[task_id] = ResearchResult(
+            result = async_task.result()
+        except (Exception, asyncio.CancelledError) as e:
+            logger.error(f"Task {task_id} completion handling failed: {e!r}")
+            result = ResearchResult(
                 task_id=task_id,
                 success=False,
                 error=str(e)
             )
-        finally:
-            # Remove from active tasks
-            if task_id in self.active_tasks:
-                del self.active_tasks[task_id]
-            
-            # Process next task if available
-            await self._process_next_task()
+        
+        # Complete inline, without another trip through the event loop
+        self.completed_results[task_id] = result
+        self.active_tasks.pop(task_id, None)
+        while len(self.completed_results) > self.max_completed:
+            self.completed_results.popitem(last=False)
+        self._signal_result(task_id)
+        for task_done in self._done_waiters:
+            task_done.set()
+        
+        # Execute callback if provided
+        if callback is not None:
+            try:
+                callback(result)
+            except Exception as e:
+                logger.error(f"Callback for task {task_id} failed: {e}")
+        
+        # Start the next task once this callback returns
+        async_task.get_loop().call_soon(self._process_pending_tasks)
+    
+    def _signal_result(self, task_id: str) -> None:
+        """Wake up anyone waiting on a task's result."""
+        event = self._result_events.pop(task_id, None)
+        if event is not None:
+            event.set()
     
     async def get_parallel_market_data(self, tickers: List[str]) -> Dict[str, Any]:
         """Get market data for multiple tickers in parallel.
@@ -347,34 +595,23 @@ class AsyncResearchEngine:
         Returns:
             Dictionary mapping tickers to market data
         """
-        async def fetch_ticker_data(ticker: str) -> tuple[str, Dict]:
-            try:
-                # Run in thread pool to avoid blocking
-                data = await self.executor.run_in_thread(
-                    self._get_ticker_data_sync, ticker
-                )
-                return ticker, data
-            except Exception as e:
-                logger.error(f"Failed to fetch data for {ticker}: {e}")
-                return ticker, {'error': str(e)}
-        
-        # Create tasks for all tickers
-        tasks = [fetch_ticker_data(ticker) for ticker in tickers]
+        limit = asyncio.Semaphore(10)
         
-        # Execute in parallel with limit
-        results = await self.executor.gather_with_limit(tasks, limit=10)
+        async def fetch_ticker_data(ticker: str) -> tuple[str, Dict]:
+            async with limit:
+                try:
+                    quote, profile = await asyncio.gather(
+                        self._finnhub.aget_quote(ticker),
+                        self._finnhub.aget_company_profile(ticker)
+                    )
+                    return ticker, {'quote': quote, 'profile': profile}
+                except Exception as e:
+                    logger.error(f"Failed to fetch data for {ticker}: {e}")
+                    return ticker, {'error': str(e)}
         
+        results = await asyncio.gather(*(fetch_ticker_data(t) for t in tickers))
         return dict(results)
     
-    def _get_ticker_data_sync(self, ticker: str) -> Dict:
-        """Synchronous ticker data retrieval."""
-        # Use existing FinnhubClient
-        client = FinnhubClient()
-        return {
-            'quote': client.get_quote(ticker),
-            'profile': client.get_company_profile(ticker)
-        }
-    
     async def parallel_web_research(self, queries: List[str], 
                                   max_results: int = 5) -> Dict[str, Any]:
         """Perform web research for multiple queries in parallel.
@@ -386,68 +623,51 @@ class AsyncResearchEngine:
         Returns:
             Dictionary mapping queries to search results
         """
-        async def search_query(query: str) -> tuple[str, Dict]:
-            try:
-                # Use thread pool for web requests
-                results = await self.executor.run_in_thread(
-                    self._web_search_sync, query, max_results
-                )
-                return query, results
-            except Exception as e:
-                logger.error(f"Web search failed for '{query}': {e}")
-                return query, {'error': str(e)}
-        
-        # Create search tasks
-        search_tasks = [search_query(query) for query in queries]
+        limit = asyncio.Semaphore(5)
         
-        # Execute with concurrency limit
-        results = await self.executor.gather_with_limit(search_tasks, limit=5)
+        async def search_query(query: str) -> tuple[str, Dict]:
+            async with limit:
+                try:
+                    results = await self._tavily.asearch(query, max_results=max_results)
+                    return query, results
+                except Exception as e:
+                    logger.error(f"Web search failed for '{query}': {e}")
+                    return query, {'error': str(e)}
         
+        results = await asyncio.gather(*(search_query(q) for q in queries))
         return dict(results)
     
-    def _web_search_sync(self, query: str, max_results: int) -> Dict:
-        """Synchronous web search."""
-        # Use existing TavilyClient
-        client = TavilyClient()
-        return client.search(query, max_results=max_results)
-    
     async def batch_analyze_documents(self, file_paths: List[Path],
-                                    analyzer_func: Callable) -> List[Any]:
+                                    analyzer_func: Callable,
+                                    cpu_bound: bool = False) -> List[Any]:
         """Analyze multiple documents in batches for performance.
         
         Args:
             file_paths: List of document paths to analyze
             analyzer_func: Function to analyze each document
+            cpu_bound: Run analyzer_func in the process pool instead of a
+                thread; it must then be a picklable module-level function
             
         Returns:
             List of analysis results
         """
-        def process_batch(batch_paths: List[Path]) -> List[Any]:
-            results = []
-            for path in batch_paths:
-                try:
-                    if path.exists():
-                        with open(path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        result = analyzer_func(content, str(path))
-                        results.append(result)
-                    else:
-                        results.append({'error': 'File not found', 'path': str(path)})
-                except Exception as e:
-                    results.append({'error': str(e), 'path': str(path)})
-            return results
-        
-        # Process in batches
-        batch_results = await self.batch_processor.process_batches(
-            file_paths, process_batch
-        )
+        run_analyzer = self.executor.run_in_process if cpu_bound else self.executor.run_in_thread
         
-        # Flatten results
-        all_results = []
-        for batch_result in batch_results:
-            all_results.extend(batch_result)
+        async def analyze_document(path: Path) -> Any:
+            try:
+                # Reads overlap across worker threads instead of running back to back
+                content = await self.executor.run_in_thread(
+                    path.read_text, encoding='utf-8'
+                )
+                return await run_analyzer(analyzer_func, content, str(path))
+            except FileNotFoundError:
+                return {'error': 'File not found', 'path': str(path)}
+            except Exception as e:
+                return {'error': str(e), 'path': str(path)}
         
-        return all_results
+        return await self.executor.gather_with_limit(
+            [analyze_document(path) for path in file_paths]
+        )
     
     def get_performance_stats(self) -> Dict:
         """Get performance statistics for the async engine.
@@ -455,30 +675,31 @@ class AsyncResearchEngine:
         Returns:
             Dictionary with performance metrics
         """
-        total_tasks = self.stats['tasks_completed'] + self.stats['tasks_failed']
-        avg_duration = (
-            self.stats['total_duration'] / self.stats['tasks_completed'] 
-            if self.stats['tasks_completed'] > 0 else 0
-        )
+        if self._stats_snapshot is None:
+            completed = self.stats['tasks_completed']
+            total_tasks = completed + self.stats['tasks_failed']
+            cache_lookups = self.stats['cache_hits'] + self.stats['cache_misses']
+            
+            self._stats_snapshot = {
+                'total_tasks_processed': total_tasks,
+                'successful_tasks': completed,
+                'failed_tasks': self.stats['tasks_failed'],
+                'success_rate': completed / total_tasks * 100 if total_tasks else 0,
+                'average_task_duration': (
+                    self.stats['total_duration'] / completed if completed else 0
+                ),
+                'recent_task_duration': self._duration_ema,
+                'total_processing_time': self.stats['total_duration'],
+                'cache_hit_rate': (
+                    self.stats['cache_hits'] / cache_lookups * 100 if cache_lookups else 0
+                )
+            }
         
         return {
-            'total_tasks_processed': total_tasks,
-            'successful_tasks': self.stats['tasks_completed'],
-            'failed_tasks': self.stats['tasks_failed'],
-            'success_rate': (
-                self.stats['tasks_completed'] / total_tasks * 100 
-                if total_tasks > 0 else 0
-            ),
-            'average_task_duration': avg_duration,
-            'total_processing_time': self.stats['total_duration'],
+            **self._stats_snapshot,
             'pending_tasks': len(self.pending_tasks),
             'active_tasks': len(self.active_tasks),
-            'completed_results': len(self.completed_results),
-            'cache_hit_rate': (
-                self.stats['cache_hits'] / 
-                (self.stats['cache_hits'] + self.stats['cache_misses']) * 100
-                if (self.stats['cache_hits'] + self.stats['cache_misses']) > 0 else 0
-            )
+            'completed_results': len(self.completed_results)
         }
     
     def clear_completed_results(self, keep_recent: int = 100) -> int:
@@ -493,14 +714,13 @@ class AsyncResearchEngine:
         if len(self.completed_results) <= keep_recent:
             return 0
         
-        # Sort by completion time and keep most recent
-        sorted_results = sorted(
+        # Select the most recent results without sorting all of them
+        recent = heapq.nlargest(
+            keep_recent,
             self.completed_results.items(),
-            key=lambda x: x[1].generated_at,
-            reverse=True
+            key=lambda x: x[1].generated_at
         )
-        
-        results_to_keep = dict(sorted_results[:keep_recent])
+        results_to_keep = OrderedDict(reversed(recent))
         cleared_count = len(self.completed_results) - len(results_to_keep)
         
         self.completed_results = results_to_keep
@@ -516,15 +736,15 @@ class AsyncResearchEngine:
         # Wait for active tasks to complete (with timeout)
         if self.active_tasks:
             try:
-                await asyncio.wait_for(
-                    asyncio.gather(*self.active_tasks.values(), return_exceptions=True),
-                    timeout=30.0
-                )
-            except asyncio.TimeoutError:
+                async with asyncio.timeout(30.0):
+                    await asyncio.gather(*self.active_tasks.values(), return_exceptions=True)
+            except TimeoutError:
                 logger.warning("Some tasks did not complete within shutdown timeout")
         
-        # Close executor
+        # Close batcher, executor and pooled HTTP connections
+        await self._batcher.close()
         self.executor.close()
+        await close_session()
         
         logger.info("Async research engine shutdown complete")
 
@@ -532,15 +752,17 @@ class AsyncResearchEngine:
 class ResearchWorkflowManager:
     """Manages complex research workflows with dependencies and priorities."""
     
-    def __init__(self, async_engine: AsyncResearchEngine):
+    def __init__(self, async_engine: AsyncResearchEngine, max_workflow_results: int = 100):
         """Initialize workflow manager.
         
         Args:
             async_engine: Async research engine instance
+            max_workflow_results: Maximum compiled workflow results kept
         """
         self.engine = async_engine
+        self.max_workflow_results = max_workflow_results
         self.workflows = {}
-        self.workflow_results = {}
+        self.workflow_results: OrderedDict[str, Dict] = OrderedDict()
     
     async def create_sector_analysis_workflow(self, sector: str, 
                                             companies: List[str]) -> str:
@@ -553,7 +775,8 @@ class ResearchWorkflowManager:
         Returns:
             Workflow ID for tracking
         """
-        workflow_id = f"sector_{sector}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        created_at = datetime.now()
+        workflow_id = f"sector_{sector}_{created_at.strftime('%Y%m%d_%H%M%S')}"
         
         # Create research tasks for the workflow
         tasks = []
@@ -587,23 +810,35 @@ class ResearchWorkflowManager:
         )
         tasks.append(comp_task)
         
-        # Submit all tasks
-        task_ids = []
-        for task in tasks:
-            task_id = await self.engine.submit_research_task(task)
-            task_ids.append(task_id)
-        
-        self.workflows[workflow_id] = {
+        # Register before submitting so no completion is missed
+        task_ids = [task.task_id for task in tasks]
+        workflow = {
             'type': 'sector_analysis',
             'sector': sector,
             'companies': companies,
             'task_ids': task_ids,
-            'created_at': datetime.now().isoformat(),
-            'status': 'running'
+            'created_at': created_at.isoformat(),
+            'status': 'running',
+            'remaining': set(task_ids),
+            'done_event': asyncio.Event()
         }
+        self.workflows[workflow_id] = workflow
+        
+        # Submit all tasks; each completion counts down the workflow
+        for task in tasks:
+            task.callback = functools.partial(self._on_workflow_task_completed, workflow)
+            await self.engine.submit_research_task(task)
         
         return workflow_id
     
+    @staticmethod
+    def _on_workflow_task_completed(workflow: Dict, result: ResearchResult) -> None:
+        """Count down a workflow's remaining tasks as each one completes."""
+        remaining = workflow['remaining']
+        remaining.discard(result.task_id)
+        if not remaining:
+            workflow['done_event'].set()
+    
     async def get_workflow_status(self, workflow_id: str) -> Dict:
         """Get status of a workflow.
         
@@ -617,30 +852,22 @@ class ResearchWorkflowManager:
             return {'error': 'Workflow not found'}
         
         workflow = self.workflows[workflow_id]
-        task_ids = workflow['task_ids']
-        
-        # Check task completion status
-        completed_tasks = []
-        pending_tasks = []
+        total_tasks = len(workflow['task_ids'])
+        pending_tasks = len(workflow['remaining'])
+        completed_tasks = total_tasks - pending_tasks
         
-        for task_id in task_ids:
-            if task_id in self.engine.completed_results:
-                completed_tasks.append(task_id)
-            else:
-                pending_tasks.append(task_id)
-        
-        completion_percentage = len(completed_tasks) / len(task_ids) * 100
+        completion_percentage = completed_tasks / total_tasks * 100
         
-        status = 'completed' if len(pending_tasks) == 0 else 'running'
+        status = 'completed' if pending_tasks == 0 else 'running'
         
         return {
             'workflow_id': workflow_id,
             'type': workflow['type'],
             'status': status,
             'completion_percentage': completion_percentage,
-            'completed_tasks': len(completed_tasks),
-            'pending_tasks': len(pending_tasks),
-            'total_tasks': len(task_ids),
+            'completed_tasks': completed_tasks,
+            'pending_tasks': pending_tasks,
+            'total_tasks': total_tasks,
             'created_at': workflow['created_at']
         }
     
@@ -661,30 +888,24 @@ class ResearchWorkflowManager:
         workflow = self.workflows[workflow_id]
         task_ids = workflow['task_ids']
         
-        # Wait for all tasks to complete
-        start_time = asyncio.get_event_loop().time()
+        # Wait for the last task to count the workflow down
+        try:
+            async with asyncio.timeout(timeout):
+                await workflow['done_event'].wait()
+        except TimeoutError:
+            return None  # Timeout
         
-        while asyncio.get_event_loop().time() - start_time < timeout:
-            # Check if all tasks are complete
-            all_complete = all(
-                task_id in self.engine.completed_results 
-                for task_id in task_ids
-            )
-            
-            if all_complete:
-                # Compile workflow results
-                results = {}
-                for task_id in task_ids:
-                    results[task_id] = self.engine.completed_results[task_id]
-                
-                self.workflow_results[workflow_id] = results
-                self.workflows[workflow_id]['status'] = 'completed'
-                
-                return results
-            
-            await asyncio.sleep(1.0)
+        # Compile workflow results
+        results = {}
+        for task_id in task_ids:
+            results[task_id] = self.engine.completed_results.get(task_id)
+        
+        self.workflow_results[workflow_id] = results
+        while len(self.workflow_results) > self.max_workflow_results:
+            self.workflow_results.popitem(last=False)
+        self.workflows[workflow_id]['status'] = 'completed'
         
-        return None  # Timeout
+        return results
     
     def get_workflow_results(self, workflow_id: str) -> Optional[Dict]:
         """Get compiled results for a completed workflow.
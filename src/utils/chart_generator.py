@@ -1,20 +1,157 @@
 """Interactive chart generation for research data visualization."""
 
 import json
+import random
 import re
+from collections import Counter
+from itertools import cycle, islice
 from datetime import datetime, timedelta
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .finnhub_client import FinnhubClient
 from .research_analytics import ResearchAnalyticsEngine
 
+# Plotly figures are built as raw dicts via _plotly_raw(); do not pass them
+# through go.Figure / validate=True
+
+# Sample value range per comparison metric: (low, high, rounding digits, unit);
+# None digits means whole numbers
+_SAMPLE_METRIC_RANGES = {
+    'price': (50, 500, 2, '$'),
+    'market_cap': (10, 500, 1, 'B'),  # Billions
+    'pe_ratio': (8, 40, 1, 'x'),
+    'volume': (100000, 10000000, None, ''),
+}
+
+# Charts with more data points than this are exported one dataset at a time
+STREAM_EXPORT_POINTS = 1_000_000
+
+# Default cap on points sent to the browser before downsampling
+DEFAULT_MAX_POINTS = 2000
+
+# Worker threads used to build dashboard charts concurrently
+DASHBOARD_WORKERS = 4
+
+# Dataset colors, assigned in order and repeated when exhausted
+_PALETTE = (
+    '#3b82f6', '#ef4444', '#10b981', '#f59e0b', '#8b5cf6',
+    '#06b6d4', '#84cc16', '#f97316', '#ec4899', '#6366f1'
+)
+
+# Read-only option fragments shared by every chart; copy with dict() at use so
+# each ChartData owns (and can serialize) its options
+_TITLE_FONT = MappingProxyType({'size': 16, 'weight': 'bold'})
+_HIDDEN_LEGEND = MappingProxyType({'display': False})
+_TOP_LEGEND = MappingProxyType({'display': True, 'position': 'top'})
+_NEAREST_X_INTERACTION = MappingProxyType({'mode': 'nearest', 'axis': 'x', 'intersect': False})
+_HIDDEN_AXIS = MappingProxyType({'display': False})
 
-@dataclass
+
+def _chart_options(title: str, **plugins) -> Dict[str, Any]:
+    """Build the Chart.js options scaffold common to every chart.
+    
+    Args:
+        title: Chart title text
+        **plugins: Additional plugin configurations (legend, tooltip, ...)
+        
+    Returns:
+        Options dictionary; callers add scales and interaction as needed
+    """
+    return {
+        'responsive': True,
+        'maintainAspectRatio': False,
+        'plugins': {
+            'title': {'display': True, 'text': title, 'font': dict(_TITLE_FONT)},
+            **plugins
+        }
+    }
+
+
+def _lttb_indices(xs, ys, threshold: int):
+    """Select points with Largest-Triangle-Three-Buckets downsampling.
+    
+    Keeps the first and last points and, for each bucket in between, the
+    point forming the largest triangle with the previously kept point and
+    the next bucket's average, which preserves the visual envelope.
+    
+    Args:
+        xs: X values, sorted ascending
+        ys: Y values
+        threshold: Number of points to keep
+        
+    Returns:
+        Array of selected indices in ascending order
+    """
+    n = len(ys)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    
+    x = np.asarray(xs, dtype=float)
+    y = np.asarray(ys, dtype=float)
+    # threshold - 2 buckets over the points between the fixed endpoints
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    
+    selected = np.empty(threshold, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+            cx = x[next_start:next_end].mean()
+            cy = y[next_start:next_end].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+        areas = np.abs(
+            (x[a] - cx) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (cy - y[a])
+        )
+        a = start + int(areas.argmax())
+        selected[i + 1] = a
+    
+    return selected
+
+
+def _empty_chart_data() -> Dict[str, Any]:
+    """Build the placeholder dataset shown by empty and error charts."""
+    return {
+        'labels': ['No Data'],
+        'datasets': [{
+            'label': 'No Data',
+            'data': [0],
+            'backgroundColor': '#d1d5db',
+            'borderColor': '#9ca3af',
+            'borderWidth': 1
+        }]
+    }
+
+
+# YYYY-MM prefix of an ISO date; anything else is skipped as an invalid date
+_YEAR_MONTH_RE = re.compile(r'^(\d{4}-(?:0[1-9]|1[0-2]))')
+
+
+@dataclass(slots=True)
 class ChartData:
-    """Data structure for chart configuration and data."""
+    """Data structure for chart configuration and data.
+    
+    to_dict() returns the data and options dicts themselves rather than
+    copies; use it instead of dataclasses.asdict(), which deep-copies them.
+    """
     chart_type: str  # 'line', 'bar', 'pie', 'scatter', etc.
     title: str
     data: Dict[str, Any]
@@ -48,13 +185,41 @@ class InteractiveChartGenerator:
         
         self.finnhub_client = finnhub_client or FinnhubClient()
         self.analytics_engine = ResearchAnalyticsEngine(data_dir)
+        
+        # Shared generator for the simulated sample data
+        self._rng = np.random.default_rng() if np is not None else None
+        
+        # Research metrics reused until the research directory changes
+        self._metrics_key: Optional[Tuple[int, int]] = None
+        self._metrics: List = []
+    
+    def _research_metrics_key(self) -> Tuple[int, int]:
+        """Cheap fingerprint of the research directory (file count, newest mtime)."""
+        if not self.research_dir.exists():
+            return (0, 0)
+        mtimes = [path.stat().st_mtime_ns for path in self.research_dir.glob('*.md')]
+        return (len(mtimes), max(mtimes, default=0))
     
-    def generate_price_chart(self, ticker: str, period_days: int = 90) -> ChartData:
+    def _load_research_metrics(self) -> List:
+        """Get research metrics, re-analyzing documents only when files changed.
+        
+        Returns:
+            List of research metrics for all documents
+        """
+        key = self._research_metrics_key()
+        if key != self._metrics_key:
+            self._metrics = self.analytics_engine.analyze_all_documents(force_refresh=True)
+            self._metrics_key = key
+        return self._metrics
+    
+    def generate_price_chart(self, ticker: str, period_days: int = 90,
+                             max_points: int = DEFAULT_MAX_POINTS) -> ChartData:
         """Generate price chart for a ticker.
         
         Args:
             ticker: Stock ticker symbol
             period_days: Number of days of price history
+            max_points: Downsample the series to at most this many points
             
         Returns:
             ChartData object with price chart configuration
@@ -64,27 +229,45 @@ class InteractiveChartGenerator:
             # In production, you'd use the Finnhub historical data API
             
             # For now, simulate some price data
-            import random
-            
             end_date = datetime.now()
             start_date = end_date - timedelta(days=period_days)
             
-            dates = []
-            prices = []
-            volumes = []
-            
             # Generate sample data (replace with actual Finnhub historical data)
-            base_price = 100 + random.uniform(-50, 50)
-            current_date = start_date
-            
-            while current_date <= end_date:
-                dates.append(current_date.strftime('%Y-%m-%d'))
-                # Simple random walk for price
-                base_price += random.uniform(-5, 5)
-                base_price = max(base_price, 10)  # Keep price positive
-                prices.append(round(base_price, 2))
-                volumes.append(random.randint(100000, 5000000))
-                current_date += timedelta(days=1)
+            if np is not None:
+                day_range = np.arange(
+                    np.datetime64(start_date.date(), 'D'),
+                    np.datetime64(end_date.date(), 'D') + np.timedelta64(1, 'D'),
+                    dtype='datetime64[D]'
+                )
+                dates = np.datetime_as_string(day_range).tolist()
+                num_days = day_range.size
+                
+                # Vectorized random walk, floored to keep prices positive
+                rng = self._rng
+                walk = 100 + rng.uniform(-50, 50) + np.cumsum(rng.uniform(-5, 5, num_days))
+                prices = np.maximum(walk, 10).round(2).tolist()
+                volumes = rng.integers(100000, 5000000, num_days, endpoint=True).tolist()
+            else:
+                num_days = period_days + 1
+                dates = [
+                    (start_date + timedelta(days=i)).strftime('%Y-%m-%d')
+                    for i in range(num_days)
+                ]
+                prices = []
+                volumes = []
+                base_price = 100 + random.uniform(-50, 50)
+                for _ in range(num_days):
+                    # Simple random walk for price
+                    base_price += random.uniform(-5, 5)
+                    base_price = max(base_price, 10)  # Keep price positive
+                    prices.append(round(base_price, 2))
+                    volumes.append(random.randint(100000, 5000000))
+            
+            if np is not None and num_days > max_points:
+                keep = _lttb_indices(np.arange(num_days), prices, max_points).tolist()
+                dates = [dates[i] for i in keep]
+                prices = [prices[i] for i in keep]
+                volumes = [volumes[i] for i in keep]
             
             chart_data = {
                 'labels': dates,
@@ -101,42 +284,30 @@ class InteractiveChartGenerator:
                 ]
             }
             
-            chart_options = {
-                'responsive': True,
-                'maintainAspectRatio': False,
-                'plugins': {
-                    'title': {
-                        'display': True,
-                        'text': f'{ticker} Price Chart ({period_days} Days)',
-                        'font': {'size': 16, 'weight': 'bold'}
-                    },
-                    'legend': {'display': False},
-                    'tooltip': {
-                        'mode': 'index',
-                        'intersect': False,
-                        'callbacks': {
-                            'label': 'function(context) { return "$" + context.parsed.y.toFixed(2); }'
-                        }
-                    }
-                },
-                'scales': {
-                    'x': {
-                        'display': True,
-                        'title': {'display': True, 'text': 'Date'},
-                        'grid': {'display': False}
-                    },
-                    'y': {
-                        'display': True,
-                        'title': {'display': True, 'text': 'Price ($)'},
-                        'beginAtZero': False
+            chart_options = _chart_options(
+                f'{ticker} Price Chart ({period_days} Days)',
+                legend=dict(_HIDDEN_LEGEND),
+                tooltip={
+                    'mode': 'index',
+                    'intersect': False,
+                    'callbacks': {
+                        'label': 'function(context) { return "$" + context.parsed.y.toFixed(2); }'
                     }
+                }
+            )
+            chart_options['scales'] = {
+                'x': {
+                    'display': True,
+                    'title': {'display': True, 'text': 'Date'},
+                    'grid': {'display': False}
                 },
-                'interaction': {
-                    'mode': 'nearest',
-                    'axis': 'x',
-                    'intersect': False
+                'y': {
+                    'display': True,
+                    'title': {'display': True, 'text': 'Price ($)'},
+                    'beginAtZero': False
                 }
             }
+            chart_options['interaction'] = dict(_NEAREST_X_INTERACTION)
             
             return ChartData(
                 chart_type='line',
@@ -161,59 +332,42 @@ class InteractiveChartGenerator:
         """
         try:
             if research_metrics is None:
-                research_metrics = self.analytics_engine.analyze_all_documents()
+                research_metrics = self._load_research_metrics()
             
-            # Count research by sector/theme
-            theme_counts = {}
-            for metrics in research_metrics:
-                theme = metrics.theme or 'Unknown'
-                theme_counts[theme] = theme_counts.get(theme, 0) + 1
-            
-            # Sort by count and take top 10
-            sorted_themes = sorted(theme_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+            # Count research by sector/theme and take the top 10
+            theme_counts = Counter(metrics.theme or 'Unknown' for metrics in research_metrics)
+            sorted_themes = theme_counts.most_common(10)
             
             if not sorted_themes:
                 return self._create_empty_chart("No research data available")
             
             labels = [theme for theme, count in sorted_themes]
             data = [count for theme, count in sorted_themes]
-            
-            # Generate colors for each sector
-            colors = [
-                '#3b82f6', '#ef4444', '#10b981', '#f59e0b', '#8b5cf6',
-                '#06b6d4', '#84cc16', '#f97316', '#ec4899', '#6366f1'
-            ]
+            # Baked into the tooltip so hovering doesn't re-sum every slice
+            total = sum(data)
             
             chart_data = {
                 'labels': labels,
                 'datasets': [{
                     'data': data,
-                    'backgroundColor': colors[:len(data)],
+                    'backgroundColor': list(islice(cycle(_PALETTE), len(data))),
                     'borderColor': '#ffffff',
                     'borderWidth': 2
                 }]
             }
             
-            chart_options = {
-                'responsive': True,
-                'maintainAspectRatio': False,
-                'plugins': {
-                    'title': {
-                        'display': True,
-                        'text': 'Research Distribution by Sector/Theme',
-                        'font': {'size': 16, 'weight': 'bold'}
-                    },
-                    'legend': {
-                        'position': 'right',
-                        'labels': {'padding': 20, 'usePointStyle': True}
-                    },
-                    'tooltip': {
-                        'callbacks': {
-                            'label': 'function(context) { return context.label + ": " + context.parsed + " documents (" + Math.round(context.parsed/context.dataset.data.reduce((a,b)=>a+b)*100) + "%)"; }'
-                        }
+            chart_options = _chart_options(
+                'Research Distribution by Sector/Theme',
+                legend={
+                    'position': 'right',
+                    'labels': {'padding': 20, 'usePointStyle': True}
+                },
+                tooltip={
+                    'callbacks': {
+                        'label': f'function(context) {{ return context.label + ": " + context.parsed + " documents (" + Math.round(context.parsed/{total}*100) + "%)"; }}'
                     }
                 }
-            }
+            )
             
             return ChartData(
                 chart_type='doughnut',
@@ -241,6 +395,12 @@ class InteractiveChartGenerator:
             if not trends['dates']:
                 return self._create_empty_chart("No research quality data available")
             
+            # Scale word counts down for visibility next to the quality score
+            if np is not None:
+                scaled_word_counts = (np.asarray(trends['word_counts'], dtype=np.float64) / 100).tolist()
+            else:
+                scaled_word_counts = [count / 100 for count in trends['word_counts']]
+            
             chart_data = {
                 'labels': trends['dates'],
                 'datasets': [
@@ -255,7 +415,7 @@ class InteractiveChartGenerator:
                     },
                     {
                         'label': 'Avg Word Count (scaled)',
-                        'data': [count / 100 for count in trends['word_counts']],  # Scale down for visibility
+                        'data': scaled_word_counts,
                         'borderColor': '#3b82f6',
                         'backgroundColor': 'rgba(59, 130, 246, 0.1)',
                         'borderWidth': 2,
@@ -266,49 +426,34 @@ class InteractiveChartGenerator:
                 ]
             }
             
-            chart_options = {
-                'responsive': True,
-                'maintainAspectRatio': False,
-                'plugins': {
-                    'title': {
-                        'display': True,
-                        'text': f'Research Quality Trends ({days} Days)',
-                        'font': {'size': 16, 'weight': 'bold'}
-                    },
-                    'legend': {'display': True, 'position': 'top'},
-                    'tooltip': {
-                        'mode': 'index',
-                        'intersect': False
-                    }
+            chart_options = _chart_options(
+                f'Research Quality Trends ({days} Days)',
+                legend=dict(_TOP_LEGEND),
+                tooltip={'mode': 'index', 'intersect': False}
+            )
+            chart_options['scales'] = {
+                'x': {
+                    'display': True,
+                    'title': {'display': True, 'text': 'Date'}
                 },
-                'scales': {
-                    'x': {
-                        'display': True,
-                        'title': {'display': True, 'text': 'Date'}
-                    },
-                    'y': {
-                        'type': 'linear',
-                        'display': True,
-                        'position': 'left',
-                        'title': {'display': True, 'text': 'Quality Score'},
-                        'min': 0,
-                        'max': 1
-                    },
-                    'y1': {
-                        'type': 'linear',
-                        'display': True,
-                        'position': 'right',
-                        'title': {'display': True, 'text': 'Word Count (x100)'},
-                        'grid': {'drawOnChartArea': False},
-                        'min': 0
-                    }
+                'y': {
+                    'type': 'linear',
+                    'display': True,
+                    'position': 'left',
+                    'title': {'display': True, 'text': 'Quality Score'},
+                    'min': 0,
+                    'max': 1
                 },
-                'interaction': {
-                    'mode': 'nearest',
-                    'axis': 'x',
-                    'intersect': False
+                'y1': {
+                    'type': 'linear',
+                    'display': True,
+                    'position': 'right',
+                    'title': {'display': True, 'text': 'Word Count (x100)'},
+                    'grid': {'drawOnChartArea': False},
+                    'min': 0
                 }
             }
+            chart_options['interaction'] = dict(_NEAREST_X_INTERACTION)
             
             return ChartData(
                 chart_type='line',
@@ -335,21 +480,34 @@ class InteractiveChartGenerator:
                 return self._create_empty_chart("Need at least 2 tickers for correlation analysis")
             
             # Generate sample correlation data (replace with actual analysis)
-            import random
-            correlation_matrix = []
-            
-            for i, ticker1 in enumerate(tickers):
-                row = []
-                for j, ticker2 in enumerate(tickers):
-                    if i == j:
-                        correlation = 1.0  # Perfect correlation with self
-                    else:
-                        # Generate realistic correlation values
-                        correlation = random.uniform(-0.8, 0.9)
-                        if abs(correlation) < 0.1:
-                            correlation = random.uniform(-0.3, 0.3)  # Many stocks have low correlation
-                    row.append(round(correlation, 2))
-                correlation_matrix.append(row)
+            if np is not None:
+                n = len(tickers)
+                rng = self._rng
+                matrix = rng.uniform(-0.8, 0.9, (n, n))
+                # Many stocks have low correlation
+                matrix = np.where(np.abs(matrix) < 0.1, rng.uniform(-0.3, 0.3, (n, n)), matrix)
+                # Mirror the upper triangle; perfect correlation with self
+                matrix = np.triu(matrix, 1)
+                matrix = matrix + matrix.T
+                np.fill_diagonal(matrix, 1.0)
+                matrix = matrix.round(2)
+                correlation_matrix = matrix.tolist()
+                cell_text = np.char.mod('%.2f', matrix).tolist()
+            else:
+                correlation_matrix = []
+                for i, ticker1 in enumerate(tickers):
+                    row = []
+                    for j, ticker2 in enumerate(tickers):
+                        if i == j:
+                            correlation = 1.0  # Perfect correlation with self
+                        else:
+                            # Generate realistic correlation values
+                            correlation = random.uniform(-0.8, 0.9)
+                            if abs(correlation) < 0.1:
+                                correlation = random.uniform(-0.3, 0.3)  # Many stocks have low correlation
+                        row.append(round(correlation, 2))
+                    correlation_matrix.append(row)
+                cell_text = [[f'{val:.2f}' for val in row] for row in correlation_matrix]
             
             # Prepare data for Plotly heatmap
             plotly_data = {
@@ -365,7 +523,7 @@ class InteractiveChartGenerator:
                 'zmid': 0,
                 'zmin': -1,
                 'zmax': 1,
-                'text': [[f'{val:.2f}' for val in row] for row in correlation_matrix],
+                'text': cell_text,
                 'texttemplate': '%{text}',
                 'textfont': {'size': 12},
                 'showscale': True,
@@ -396,7 +554,7 @@ class InteractiveChartGenerator:
             return ChartData(
                 chart_type='heatmap',
                 title='Ticker Correlation Heatmap',
-                data={'data': [plotly_data], 'layout': plotly_layout},
+                data=self._plotly_raw([plotly_data], plotly_layout),
                 options={},
                 libraries=['plotly']
             )
@@ -404,29 +562,30 @@ class InteractiveChartGenerator:
         except Exception as e:
             return self._create_error_chart(f"Failed to generate correlation heatmap: {str(e)}")
     
-    def generate_research_volume_chart(self) -> ChartData:
+    def generate_research_volume_chart(self, research_metrics: List = None) -> ChartData:
         """Generate bar chart showing research volume over time.
         
+        Args:
+            research_metrics: Optional list of research metrics
+            
         Returns:
             ChartData object with research volume chart
         """
         try:
             # Get all research metrics
-            all_metrics = self.analytics_engine.analyze_all_documents()
+            all_metrics = research_metrics
+            if all_metrics is None:
+                all_metrics = self._load_research_metrics()
             
             if not all_metrics:
                 return self._create_empty_chart("No research documents found")
             
-            # Group by month
-            monthly_counts = {}
+            # Group by month, read straight from the ISO date prefix
+            monthly_counts = Counter()
             for metrics in all_metrics:
-                if metrics.generated_date:
-                    try:
-                        date = datetime.fromisoformat(metrics.generated_date[:19])
-                        month_key = date.strftime('%Y-%m')
-                        monthly_counts[month_key] = monthly_counts.get(month_key, 0) + 1
-                    except:
-                        continue  # Skip invalid dates
+                match = _YEAR_MONTH_RE.match(metrics.generated_date or '')
+                if match:
+                    monthly_counts[match.group(1)] += 1
             
             # Sort by date
             sorted_months = sorted(monthly_counts.items())
@@ -448,27 +607,16 @@ class InteractiveChartGenerator:
                 }]
             }
             
-            chart_options = {
-                'responsive': True,
-                'maintainAspectRatio': False,
-                'plugins': {
-                    'title': {
-                        'display': True,
-                        'text': 'Research Volume by Month',
-                        'font': {'size': 16, 'weight': 'bold'}
-                    },
-                    'legend': {'display': False}
+            chart_options = _chart_options('Research Volume by Month', legend=dict(_HIDDEN_LEGEND))
+            chart_options['scales'] = {
+                'x': {
+                    'display': True,
+                    'title': {'display': True, 'text': 'Month'}
                 },
-                'scales': {
-                    'x': {
-                        'display': True,
-                        'title': {'display': True, 'text': 'Month'}
-                    },
-                    'y': {
-                        'display': True,
-                        'title': {'display': True, 'text': 'Number of Documents'},
-                        'beginAtZero': True
-                    }
+                'y': {
+                    'display': True,
+                    'title': {'display': True, 'text': 'Number of Documents'},
+                    'beginAtZero': True
                 }
             }
             
@@ -483,41 +631,57 @@ class InteractiveChartGenerator:
         except Exception as e:
             return self._create_error_chart(f"Failed to generate research volume chart: {str(e)}")
     
-    def generate_performance_scatter_plot(self, performance_data: List[Dict] = None) -> ChartData:
+    def generate_performance_scatter_plot(self, performance_data: List[Dict] = None,
+                                          max_points: int = DEFAULT_MAX_POINTS) -> ChartData:
         """Generate scatter plot of thesis performance vs confidence.
         
         Args:
             performance_data: Optional list of performance data
+            max_points: Downsample to at most this many points
             
         Returns:
             ChartData object with performance scatter plot
         """
         try:
-            # Generate sample performance data if none provided
+            # Work column-wise; point dicts are only built for the points kept
             if performance_data is None:
-                import random
-                performance_data = []
+                # Generate sample performance data
+                num_points = 50  # 50 sample data points
+                labels = [f'TICK{i:02d}' for i in range(num_points)]
                 
-                for i in range(50):  # 50 sample data points
-                    performance_data.append({
-                        'confidence': random.uniform(0.3, 0.95),
-                        'return_pct': random.uniform(-30, 50),
-                        'ticker': f'TICK{i:02d}',
-                        'thesis': f'Investment thesis {i}'
-                    })
+                if self._rng is not None:
+                    xs = self._rng.uniform(0.3, 0.95, num_points) * 100  # Convert to percentage
+                    ys = self._rng.uniform(-30, 50, num_points)
+                else:
+                    xs = [random.uniform(0.3, 0.95) * 100 for _ in range(num_points)]
+                    ys = [random.uniform(-30, 50) for _ in range(num_points)]
+            else:
+                xs = [item['confidence'] * 100 for item in performance_data]  # Convert to percentage
+                ys = [item['return_pct'] for item in performance_data]
+                labels = [item.get('ticker', f'Point {i}') for i, item in enumerate(performance_data)]
+            
+            if np is not None and len(labels) > max_points:
+                # LTTB walks points in x order
+                xs = np.asarray(xs, dtype=float)
+                ys = np.asarray(ys, dtype=float)
+                order = np.argsort(xs, kind='stable')
+                keep = order[_lttb_indices(xs[order], ys[order], max_points)]
+                xs, ys = xs[keep], ys[keep]
+                labels = [labels[i] for i in keep.tolist()]
+            
+            if np is not None and isinstance(xs, np.ndarray):
+                xs, ys = xs.tolist(), ys.tolist()
+            
+            points = [
+                {'x': x, 'y': y, 'label': label}
+                for x, y, label in zip(xs, ys, labels)
+            ]
             
             # Prepare data for scatter plot
             chart_data = {
                 'datasets': [{
                     'label': 'Thesis Performance',
-                    'data': [
-                        {
-                            'x': item['confidence'] * 100,  # Convert to percentage
-                            'y': item['return_pct'],
-                            'label': item.get('ticker', f'Point {i}')
-                        }
-                        for i, item in enumerate(performance_data)
-                    ],
+                    'data': points,
                     'backgroundColor': 'rgba(59, 130, 246, 0.6)',
                     'borderColor': '#3b82f6',
                     'borderWidth': 1,
@@ -526,37 +690,29 @@ class InteractiveChartGenerator:
                 }]
             }
             
-            chart_options = {
-                'responsive': True,
-                'maintainAspectRatio': False,
-                'plugins': {
-                    'title': {
-                        'display': True,
-                        'text': 'Investment Thesis Performance vs Confidence',
-                        'font': {'size': 16, 'weight': 'bold'}
-                    },
-                    'legend': {'display': False},
-                    'tooltip': {
-                        'callbacks': {
-                            'title': 'function(context) { return context[0].raw.label; }',
-                            'label': 'function(context) { return "Confidence: " + context.parsed.x.toFixed(1) + "%, Return: " + context.parsed.y.toFixed(1) + "%"; }'
-                        }
+            chart_options = _chart_options(
+                'Investment Thesis Performance vs Confidence',
+                legend=dict(_HIDDEN_LEGEND),
+                tooltip={
+                    'callbacks': {
+                        'title': 'function(context) { return context[0].raw.label; }',
+                        'label': 'function(context) { return "Confidence: " + context.parsed.x.toFixed(1) + "%, Return: " + context.parsed.y.toFixed(1) + "%"; }'
                     }
+                }
+            )
+            chart_options['scales'] = {
+                'x': {
+                    'display': True,
+                    'title': {'display': True, 'text': 'Confidence Level (%)'},
+                    'min': 0,
+                    'max': 100
                 },
-                'scales': {
-                    'x': {
-                        'display': True,
-                        'title': {'display': True, 'text': 'Confidence Level (%)'},
-                        'min': 0,
-                        'max': 100
-                    },
-                    'y': {
-                        'display': True,
-                        'title': {'display': True, 'text': 'Return (%)'},
-                        'grid': {
-                            'drawBorder': False,
-                            'color': 'rgba(229, 231, 235, 0.5)'  # Light gray grid lines
-                        }
+                'y': {
+                    'display': True,
+                    'title': {'display': True, 'text': 'Return (%)'},
+                    'grid': {
+                        'drawBorder': False,
+                        'color': 'rgba(229, 231, 235, 0.5)'  # Light gray grid lines
                     }
                 }
             }
@@ -590,38 +746,31 @@ class InteractiveChartGenerator:
                 metrics = ['price', 'market_cap', 'pe_ratio']
             
             # Generate sample data for each ticker and metric
-            import random
-            
             chart_data = {
                 'labels': tickers,
                 'datasets': []
             }
             
-            colors = ['#3b82f6', '#ef4444', '#10b981', '#f59e0b', '#8b5cf6']
+            # One uniform draw for every (metric, ticker) cell, scaled per metric below
+            if self._rng is not None:
+                samples = self._rng.random((len(metrics), len(tickers))).tolist()
+            else:
+                samples = [[random.random() for _ in tickers] for _ in metrics]
             
             for i, metric in enumerate(metrics):
                 # Generate realistic sample data based on metric
-                if metric == 'price':
-                    data = [round(random.uniform(50, 500), 2) for _ in tickers]
-                    unit = '$'
-                elif metric == 'market_cap':
-                    data = [round(random.uniform(10, 500), 1) for _ in tickers]  # Billions
-                    unit = 'B'
-                elif metric == 'pe_ratio':
-                    data = [round(random.uniform(8, 40), 1) for _ in tickers]
-                    unit = 'x'
-                elif metric == 'volume':
-                    data = [random.randint(100000, 10000000) for _ in tickers]
-                    unit = ''
+                low, high, digits, unit = _SAMPLE_METRIC_RANGES.get(metric, (1, 100, 2, ''))
+                if digits is None:
+                    # Whole numbers in [low, high]
+                    data = [int(low + u * (high - low + 1)) for u in samples[i]]
                 else:
-                    data = [round(random.uniform(1, 100), 2) for _ in tickers]
-                    unit = ''
+                    data = [round(low + u * (high - low), digits) for u in samples[i]]
                 
                 dataset = {
                     'label': f'{metric.replace("_", " ").title()} ({unit})',
                     'data': data,
-                    'backgroundColor': colors[i % len(colors)],
-                    'borderColor': colors[i % len(colors)],
+                    'backgroundColor': _PALETTE[i % len(_PALETTE)],
+                    'borderColor': _PALETTE[i % len(_PALETTE)],
                     'borderWidth': 2,
                     'yAxisID': f'y{i+1}' if i > 0 else 'y'
                 }
@@ -648,24 +797,13 @@ class InteractiveChartGenerator:
                     'grid': {'drawOnChartArea': False}
                 }
             
-            chart_options = {
-                'responsive': True,
-                'maintainAspectRatio': False,
-                'plugins': {
-                    'title': {
-                        'display': True,
-                        'text': 'Multi-Ticker Metrics Comparison',
-                        'font': {'size': 16, 'weight': 'bold'}
-                    },
-                    'legend': {'display': True, 'position': 'top'}
+            chart_options = _chart_options('Multi-Ticker Metrics Comparison', legend=dict(_TOP_LEGEND))
+            chart_options['scales'] = {
+                'x': {
+                    'display': True,
+                    'title': {'display': True, 'text': 'Tickers'}
                 },
-                'scales': {
-                    'x': {
-                        'display': True,
-                        'title': {'display': True, 'text': 'Tickers'}
-                    },
-                    **y_axes
-                }
+                **y_axes
             }
             
             return ChartData(
@@ -679,6 +817,29 @@ class InteractiveChartGenerator:
         except Exception as e:
             return self._create_error_chart(f"Failed to generate multi-ticker comparison: {str(e)}")
     
+    def _plotly_raw(self, traces: List[Dict[str, Any]], layout: Dict[str, Any]) -> Dict[str, Any]:
+        """Assemble a Plotly figure as plain dicts.
+        
+        Plotly charts are shipped to the browser as raw trace/layout dicts; do
+        not pass them through go.Figure (or validate=True), whose per-attribute
+        validation costs far more than building the chart. If a Figure is ever
+        unavoidable, hand over fig.to_plotly_json() rather than
+        json.loads(fig.to_json()).
+        
+        Args:
+            traces: Plotly trace dictionaries
+            layout: Plotly layout dictionary
+            
+        Returns:
+            Figure dictionary with 'data' and 'layout' keys
+            
+        Raises:
+            TypeError: If a trace or the layout is not a plain dict
+        """
+        if not isinstance(layout, dict) or not all(isinstance(t, dict) for t in traces):
+            raise TypeError("Plotly traces and layout must be plain dicts, not graph objects")
+        return {'data': traces, 'layout': layout}
+    
     def _create_empty_chart(self, message: str) -> ChartData:
         """Create an empty chart with a message.
         
@@ -688,38 +849,13 @@ class InteractiveChartGenerator:
         Returns:
             ChartData object with empty chart
         """
-        chart_data = {
-            'labels': ['No Data'],
-            'datasets': [{
-                'label': 'No Data',
-                'data': [0],
-                'backgroundColor': '#d1d5db',
-                'borderColor': '#9ca3af',
-                'borderWidth': 1
-            }]
-        }
-        
-        chart_options = {
-            'responsive': True,
-            'maintainAspectRatio': False,
-            'plugins': {
-                'title': {
-                    'display': True,
-                    'text': message,
-                    'font': {'size': 16, 'weight': 'bold'}
-                },
-                'legend': {'display': False}
-            },
-            'scales': {
-                'y': {'display': False},
-                'x': {'display': False}
-            }
-        }
+        chart_options = _chart_options(message, legend=dict(_HIDDEN_LEGEND))
+        chart_options['scales'] = {'y': dict(_HIDDEN_AXIS), 'x': dict(_HIDDEN_AXIS)}
         
         return ChartData(
             chart_type='bar',
             title='No Data Available',
-            data=chart_data,
+            data=_empty_chart_data(),
             options=chart_options,
             libraries=['chartjs']
         )
@@ -745,22 +881,32 @@ class InteractiveChartGenerator:
         
         try:
             # Load research metrics once for efficiency
-            research_metrics = self.analytics_engine.analyze_all_documents()
-            
-            # Generate various charts
-            charts['sector_distribution'] = self.generate_sector_distribution_chart(research_metrics)
-            charts['quality_trends'] = self.generate_quality_trends_chart(days=30)
-            charts['research_volume'] = self.generate_research_volume_chart()
-            charts['performance_scatter'] = self.generate_performance_scatter_plot()
+            research_metrics = self._load_research_metrics()
+            
+            # Chart name -> (generator, args); each chart is built independently
+            tasks = {
+                'sector_distribution': (self.generate_sector_distribution_chart, (research_metrics,)),
+                'quality_trends': (self.generate_quality_trends_chart, (30,)),
+                'research_volume': (self.generate_research_volume_chart, (research_metrics,)),
+                'performance_scatter': (self.generate_performance_scatter_plot, ()),
+            }
             
             # Add sample ticker charts
             sample_tickers = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA'][:3]  # Limit for performance
             if sample_tickers:
-                charts['price_chart'] = self.generate_price_chart(sample_tickers[0])
-                charts['ticker_comparison'] = self.generate_multi_ticker_comparison(sample_tickers)
+                tasks['price_chart'] = (self.generate_price_chart, (sample_tickers[0],))
+                tasks['ticker_comparison'] = (self.generate_multi_ticker_comparison, (sample_tickers,))
                 
                 if len(sample_tickers) >= 2:
-                    charts['correlation_heatmap'] = self.generate_ticker_correlation_heatmap(sample_tickers)
+                    tasks['correlation_heatmap'] = (self.generate_ticker_correlation_heatmap, (sample_tickers,))
+            
+            with ThreadPoolExecutor(max_workers=DASHBOARD_WORKERS) as executor:
+                futures = {
+                    name: executor.submit(func, *args)
+                    for name, (func, args) in tasks.items()
+                }
+                for name, future in futures.items():
+                    charts[name] = future.result()
             
         except Exception as e:
             print(f"Error generating dashboard charts: {e}")
@@ -781,7 +927,48 @@ class InteractiveChartGenerator:
         """
         output_path = self.charts_dir / f"{filename}.json"
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(chart_data.to_dict(), f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            datasets = chart_data.data.get('datasets', [])
+            point_count = sum(len(ds.get('data', [])) for ds in datasets)
+            with open(output_path, 'wb') as f:
+                if point_count > STREAM_EXPORT_POINTS:
+                    self._stream_export(chart_data, f)
+                else:
+                    f.write(orjson.dumps(
+                        chart_data.to_dict(),
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                    ))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(chart_data.to_dict(), f, indent=2, ensure_ascii=False)
+        
+        return output_path
+    
+    def _stream_export(self, chart_data: ChartData, f) -> None:
+        """Write chart JSON one dataset at a time.
+        
+        Avoids serializing the whole chart into a single buffer, so peak
+        memory stays around the size of the largest dataset.
+        
+        Args:
+            chart_data: ChartData object to export
+            f: Binary file handle to write to
+        """
+        option = orjson.OPT_SERIALIZE_NUMPY
+        chart_dict = chart_data.to_dict()
+        data = chart_dict.pop('data')
+        datasets = data.get('datasets', [])
         
-        return output_path
\ No newline at end of file
+        f.write(b'{"data":{')
+        for key, value in data.items():
+            if key != 'datasets':
+                f.write(orjson.dumps(key) + b':' + orjson.dumps(value, option=option) + b',')
+        f.write(b'"datasets":[')
+        for i, dataset in enumerate(datasets):
+            if i:
+                f.write(b',')
+            f.write(orjson.dumps(dataset, option=option))
+        f.write(b']}')
+        for key, value in chart_dict.items():
+            f.write(b',' + orjson.dumps(key) + b':' + orjson.dumps(value, option=option))
+        f.write(b'}')
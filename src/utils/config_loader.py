@@ -1,12 +1,28 @@
 """Configuration loading utilities."""
 
+import copy
 import json
 import os
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Parsed config files by path, stored with the (mtime_ns, size) they were read at
+_FILE_CACHE: dict[str, tuple[int, int, Any]] = {}
+
 
 class ConfigLoader:
     """Loads and manages configuration files."""
@@ -17,28 +33,56 @@ class ConfigLoader:
         else:
             self.config_dir = config_dir
 
-    def load_json(self, filename: str) -> dict[str, Any]:
-        """Load a JSON configuration file."""
+    def _load_cached(self, filename: str, parse: Callable[[Any], Any]) -> Any:
+        """Load a config file, reusing the parsed result until the file changes.
+
+        Returns a deep copy so callers may mutate it, or {} if the file is missing.
+        """
         filepath = self.config_dir / filename
-        if not filepath.exists():
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
             return {}
-        with open(filepath, "r") as f:
-            return json.load(f)
+
+        cache_key = str(filepath)
+        cached = _FILE_CACHE.get(cache_key)
+        if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+            with open(filepath, "rb") as f:
+                cached = (stat.st_mtime_ns, stat.st_size, parse(f))
+            _FILE_CACHE[cache_key] = cached
+        return copy.deepcopy(cached[2])
+
+    def load_json(self, filename: str) -> dict[str, Any]:
+        """Load a JSON configuration file."""
+        if orjson is not None:
+            return self._load_cached(filename, lambda f: orjson.loads(f.read()))
+        return self._load_cached(filename, json.load)
 
     def load_yaml(self, filename: str) -> dict[str, Any]:
         """Load a YAML configuration file."""
-        filepath = self.config_dir / filename
-        if not filepath.exists():
-            return {}
-        with open(filepath, "r") as f:
-            return yaml.safe_load(f)
+        return self._load_cached(filename, lambda f: yaml.load(f, Loader=_SafeLoader))
 
     def save_json(self, filename: str, data: dict[str, Any]) -> None:
-        """Save data to a JSON configuration file."""
+        """Save data to a JSON configuration file.
+
+        The file is written to a temporary sibling and renamed into place, so
+        readers never see a partially written file.
+        """
         filepath = self.config_dir / filename
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(data, indent=2).encode("utf-8")
+
+        tmp_path = filepath.with_suffix(filepath.suffix + ".tmp")
+        try:
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        _FILE_CACHE.pop(str(filepath), None)
 
     def get_sources(self) -> dict[str, list[str]]:
         """Get the news sources configuration."""
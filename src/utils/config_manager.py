@@ -1,16 +1,126 @@
 """Advanced configuration management system."""
 
+import copy
+import functools
 import json
 import yaml
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List
-from dataclasses import dataclass, asdict, field
+from typing import Callable, Dict, Any, Optional, Tuple, Union, List
+from dataclasses import dataclass, asdict, field, is_dataclass, replace
 from datetime import datetime
 import logging
+import time
+from collections import defaultdict
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
 
-@dataclass
+
+@functools.lru_cache(maxsize=256)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Split a dot-notation config path into its keys."""
+    return tuple(path.split('.'))
+
+
+# Process environment snapshot; call refresh_env() after changing os.environ
+_ENV: Dict[str, str] = dict(os.environ)
+
+
+def refresh_env():
+    """Re-read os.environ into the snapshot used for configuration overrides."""
+    global _ENV
+    _ENV = dict(os.environ)
+
+
+def _dump_yaml(data: Dict[str, Any]) -> bytes:
+    """Serialize config data to UTF-8 YAML bytes in block style."""
+    return yaml.dump(data, Dumper=_SafeDumper, default_flow_style=False, indent=2, encoding='utf-8')
+
+
+# Sample files written by create_sample_config; the content is static
+_SAMPLE_CONFIG_BYTES = b"""\
+alerts:
+  check_interval: 300
+  enabled: true
+api:
+  rate_limit_requests: 100
+  timeout_seconds: 30
+data_dir: ./data
+debug: false
+environment: development
+logging:
+  enable_console: true
+  enable_file: true
+  file_path: ./logs/supply_chain_intel.log
+  level: INFO
+performance:
+  cache_enabled: true
+  cache_ttl: 3600
+version: 1.0.0
+webhooks:
+  default_timeout: 30
+  enabled_platforms:
+  - slack
+  - discord
+"""
+
+_SAMPLE_SECRETS_BYTES = b"""\
+api:
+  anthropic_key: your_anthropic_api_key_here
+  finnhub_key: your_finnhub_api_key_here
+  openai_key: your_openai_api_key_here
+  tavily_key: your_tavily_api_key_here
+"""
+
+
+def _to_bool(value: str) -> bool:
+    """Interpret an environment variable string as a boolean."""
+    return value.lower() in ('true', '1', 'yes', 'on')
+
+
+# Environment variable overrides: (variable, config keys, converter)
+_ENV_MAPPINGS: Tuple[Tuple[str, Tuple[str, ...], Callable[[str], Any]], ...] = tuple(
+    (env_var, tuple(config_path.split('.')), convert)
+    for env_var, config_path, convert in (
+        ('SCI_DEBUG', 'debug', _to_bool),
+        ('SCI_DATA_DIR', 'data_dir', str),
+        ('SCI_LOG_LEVEL', 'logging.level', str),
+        ('SCI_API_TIMEOUT', 'api.timeout_seconds', int),
+        ('SCI_CACHE_ENABLED', 'performance.cache_enabled', _to_bool),
+        ('SCI_WEBHOOK_TIMEOUT', 'webhooks.default_timeout', int),
+        ('SCI_ALERT_INTERVAL', 'alerts.check_interval', int),
+        ('FINNHUB_API_KEY', 'api.finnhub_key', str),
+        ('TAVILY_API_KEY', 'api.tavily_key', str),
+        ('OPENAI_API_KEY', 'api.openai_key', str),
+        ('ANTHROPIC_API_KEY', 'api.anthropic_key', str),
+    )
+)
+
+
+# APIConfig fields that hold credentials
+API_KEY_FIELDS = ('finnhub_key', 'tavily_key', 'openai_key', 'anthropic_key')
+
+# Declarative config checks: (section, predicate, message format)
+_VALID_LOG_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'})
+_VALIDATORS: Tuple[Tuple[str, Callable[['SystemConfig'], bool], str], ...] = (
+    ('api', lambda config: bool(config.api.finnhub_key), "Finnhub API key is missing"),
+    ('api', lambda config: bool(config.api.tavily_key), "Tavily API key is missing"),
+    ('logging', lambda config: config.logging.level in _VALID_LOG_LEVELS,
+     "Invalid log level: {config.logging.level}"),
+)
+
+# Merged SystemConfig per (config dir, environment, file stats, env overrides)
+_MERGED_CACHE: Dict[Tuple, 'SystemConfig'] = {}
+
+# Parsed YAML files by path, stored with the (mtime_ns, size) they were read at
+_YAML_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+@dataclass(slots=True)
 class DatabaseConfig:
     """Database configuration."""
     host: str = "localhost"
@@ -21,7 +131,7 @@ class DatabaseConfig:
     ssl_mode: str = "prefer"
 
 
-@dataclass
+@dataclass(slots=True)
 class APIConfig:
     """API service configuration."""
     finnhub_key: str = ""
@@ -33,7 +143,7 @@ class APIConfig:
     timeout_seconds: int = 30
 
 
-@dataclass 
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging configuration."""
     level: str = "INFO"
@@ -45,7 +155,7 @@ class LoggingConfig:
     enable_file: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class WebhookConfig:
     """Webhook configuration."""
     default_timeout: int = 30
@@ -54,7 +164,7 @@ class WebhookConfig:
     enabled_platforms: List[str] = field(default_factory=lambda: ["slack", "discord", "teams"])
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceConfig:
     """Performance and caching configuration."""
     cache_enabled: bool = True
@@ -64,7 +174,7 @@ class PerformanceConfig:
     request_batch_size: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertConfig:
     """Alert system configuration."""
     enabled: bool = True
@@ -74,7 +184,7 @@ class AlertConfig:
     webhook_enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class SecurityConfig:
     """Security configuration."""
     api_key_length: int = 32
@@ -84,7 +194,7 @@ class SecurityConfig:
     encryption_enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemConfig:
     """Complete system configuration."""
     version: str = "1.0.0"
@@ -105,7 +215,28 @@ class SystemConfig:
     
     # Runtime tracking
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    updated_at_ns: int = field(default_factory=time.time_ns)
+    
+    @property
+    def updated_at(self) -> str:
+        """Last update time as an ISO 8601 string."""
+        return datetime.fromtimestamp(self.updated_at_ns / 1e9).isoformat()
+
+
+class _DeferredLoggingHandler(logging.Handler):
+    """Root handler that configures logging on the first record it receives."""
+    
+    def __init__(self, manager: 'ConfigurationManager'):
+        super().__init__()
+        self._manager = manager
+    
+    def emit(self, record: logging.LogRecord):
+        # _setup_logging swaps in a new handler list, so the dispatch loop that
+        # called us only ever sees this handler; deliver the record ourselves
+        self._manager._setup_logging()
+        for handler in logging.getLogger().handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
 
 
 class ConfigurationManager:
@@ -125,7 +256,7 @@ class ConfigurationManager:
         self.config_dir.mkdir(exist_ok=True)
         
         # Determine environment
-        self.environment = environment or os.getenv('SUPPLY_CHAIN_ENV', 'development')
+        self.environment = environment or _ENV.get('SUPPLY_CHAIN_ENV', 'development')
         
         # Configuration files
         self.base_config_file = self.config_dir / 'config.yml'
@@ -135,24 +266,57 @@ class ConfigurationManager:
         
         # Load configuration
         self._config = self._load_config()
+        self._data_dir_created: Optional[str] = None
         
-        # Setup logging if configured
-        self._setup_logging()
+        # Setup logging when the first record is emitted
+        self._defer_logging_setup()
     
     def _load_config(self) -> SystemConfig:
-        """Load configuration from multiple sources with precedence."""
-        # Start with default configuration
-        config_dict = asdict(SystemConfig())
+        """Load configuration from multiple sources with precedence.
         
+        The merged result is cached per config directory and reused while
+        the config files and environment overrides are unchanged.
+        """
         # Layer on configurations in order of precedence
         configs_to_load = [
             self.base_config_file,
             self.env_config_file,
             self.local_config_file
         ]
+        wanted = {path.name for path in configs_to_load}
+        wanted.add(self.secrets_file.name)
+        
+        # One directory listing instead of a stat per candidate file
+        with os.scandir(self.config_dir) as entries:
+            file_stats = {
+                entry.name: entry.stat()
+                for entry in entries if entry.name in wanted
+            }
+        
+        cache_key = (
+            str(self.config_dir),
+            self.environment,
+            tuple(sorted(
+                (name, stat.st_mtime_ns, stat.st_size)
+                for name, stat in file_stats.items()
+            )),
+            tuple(_ENV.get(env_var) for env_var, _, _ in _ENV_MAPPINGS)
+        )
+        cached = _MERGED_CACHE.get(cache_key)
+        if cached is None:
+            cached = self._build_config(configs_to_load, file_stats.keys())
+            _MERGED_CACHE[cache_key] = cached
+        
+        # Callers may mutate their config, so never hand out the cached one
+        return copy.deepcopy(cached)
+    
+    def _build_config(self, configs_to_load: List[Path], present) -> SystemConfig:
+        """Merge defaults, config files, secrets and environment overrides."""
+        # Start with default configuration
+        config_dict = asdict(SystemConfig())
         
         for config_file in configs_to_load:
-            if config_file.exists():
+            if config_file.name in present:
                 try:
                     file_config = self._load_yaml_file(config_file)
                     config_dict = self._deep_merge(config_dict, file_config)
@@ -160,7 +324,7 @@ class ConfigurationManager:
                     logging.warning(f"Failed to load config file {config_file}: {e}")
         
         # Load secrets separately (not merged, just API keys)
-        if self.secrets_file.exists():
+        if self.secrets_file.name in present:
             try:
                 secrets = self._load_yaml_file(self.secrets_file)
                 if 'api' in secrets:
@@ -174,56 +338,63 @@ class ConfigurationManager:
         # Convert back to dataclass
         return self._dict_to_config(config_dict)
     
+    def refresh(self):
+        """Reload configuration from disk, bypassing the merged-config cache."""
+        config_dir = str(self.config_dir)
+        for key in [key for key in _MERGED_CACHE if key[0] == config_dir]:
+            del _MERGED_CACHE[key]
+        self._config = self._load_config()
+    
     def _load_yaml_file(self, file_path: Path) -> Dict[str, Any]:
-        """Load YAML configuration file."""
+        """Load YAML configuration file.
+        
+        Parsed files are cached in-process and only re-read when their
+        modification time or size changes. Callers get a deep copy, so they
+        may mutate the result freely.
+        """
         try:
+            stat = os.stat(file_path)
+            cache_key = str(file_path)
+            cached = _YAML_CACHE.get(cache_key)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return copy.deepcopy(cached[2])
+            
             with open(file_path, 'r') as f:
-                return yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_SafeLoader) or {}
+            _YAML_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, data)
+            return copy.deepcopy(data)
         except Exception as e:
             logging.error(f"Error loading YAML file {file_path}: {e}")
             return {}
     
     def _deep_merge(self, base: Dict, overlay: Dict) -> Dict:
-        """Deep merge two dictionaries."""
-        result = base.copy()
+        """Deep merge two dictionaries.
         
-        for key, value in overlay.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
+        Walks the overlay with an explicit stack, copying only the levels of
+        base that are merged into so base itself is never modified.
+        """
+        result = dict(base)
+        stack = [(result, overlay)]
+        
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    target[key] = merged = dict(current)
+                    stack.append((merged, value))
+                else:
+                    target[key] = value
         
         return result
     
     def _apply_environment_overrides(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Apply environment variable overrides."""
-        env_mappings = {
-            'SCI_DEBUG': ('debug', bool),
-            'SCI_DATA_DIR': ('data_dir', str),
-            'SCI_LOG_LEVEL': ('logging.level', str),
-            'SCI_API_TIMEOUT': ('api.timeout_seconds', int),
-            'SCI_CACHE_ENABLED': ('performance.cache_enabled', bool),
-            'SCI_WEBHOOK_TIMEOUT': ('webhooks.default_timeout', int),
-            'SCI_ALERT_INTERVAL': ('alerts.check_interval', int),
-            'FINNHUB_API_KEY': ('api.finnhub_key', str),
-            'TAVILY_API_KEY': ('api.tavily_key', str),
-            'OPENAI_API_KEY': ('api.openai_key', str),
-            'ANTHROPIC_API_KEY': ('api.anthropic_key', str),
-        }
-        
-        for env_var, (config_path, data_type) in env_mappings.items():
-            value = os.getenv(env_var)
+        for env_var, keys, convert in _ENV_MAPPINGS:
+            value = _ENV.get(env_var)
             if value is not None:
                 try:
-                    # Convert value to appropriate type
-                    if data_type == bool:
-                        value = value.lower() in ('true', '1', 'yes', 'on')
-                    elif data_type == int:
-                        value = int(value)
-                    
-                    # Set nested config value
-                    self._set_nested_value(config, config_path, value)
-                    
+                    self._set_nested_keys(config, keys, convert(value))
                 except (ValueError, TypeError) as e:
                     logging.warning(f"Invalid environment variable {env_var}={value}: {e}")
         
@@ -231,7 +402,10 @@ class ConfigurationManager:
     
     def _set_nested_value(self, config: Dict, path: str, value: Any):
         """Set a nested dictionary value using dot notation."""
-        keys = path.split('.')
+        self._set_nested_keys(config, _split_path(path), value)
+    
+    def _set_nested_keys(self, config: Dict, keys: Tuple[str, ...], value: Any):
+        """Set a nested dictionary value from a sequence of keys."""
         current = config
         
         for key in keys[:-1]:
@@ -243,6 +417,14 @@ class ConfigurationManager:
     
     def _dict_to_config(self, config_dict: Dict[str, Any]) -> SystemConfig:
         """Convert dictionary to SystemConfig dataclass."""
+        # Saved files carry the update time as an ISO string
+        updated_at = config_dict.pop('updated_at', None)
+        if isinstance(updated_at, str):
+            try:
+                config_dict['updated_at_ns'] = int(datetime.fromisoformat(updated_at).timestamp() * 1e9)
+            except ValueError:
+                logging.warning(f"Ignoring invalid updated_at timestamp: {updated_at}")
+        
         try:
             # Handle nested dataclasses
             if 'database' in config_dict:
@@ -266,6 +448,18 @@ class ConfigurationManager:
             logging.error(f"Error converting config dict to dataclass: {e}")
             return SystemConfig()
     
+    def _defer_logging_setup(self):
+        """Install a placeholder root handler that runs _setup_logging on first use.
+        
+        The root level is applied immediately so records are filtered as
+        configured; formatters and console/file handlers are only built once
+        something is actually logged.
+        """
+        logger = logging.getLogger()
+        logger.setLevel(getattr(logging, self._config.logging.level.upper()))
+        logger.handlers.clear()
+        logger.addHandler(_DeferredLoggingHandler(self))
+    
     def _setup_logging(self):
         """Setup logging based on configuration."""
         log_config = self._config.logging
@@ -274,8 +468,9 @@ class ConfigurationManager:
         logger = logging.getLogger()
         logger.setLevel(getattr(logging, log_config.level.upper()))
         
-        # Clear existing handlers
-        logger.handlers.clear()
+        # Build a fresh handler list rather than clearing the current one in
+        # place: this may run while the root logger is iterating its handlers
+        handlers = []
         
         # Create formatter
         formatter = logging.Formatter(log_config.format)
@@ -284,7 +479,7 @@ class ConfigurationManager:
         if log_config.enable_console:
             console_handler = logging.StreamHandler()
             console_handler.setFormatter(formatter)
-            logger.addHandler(console_handler)
+            handlers.append(console_handler)
         
         # File handler
         if log_config.enable_file and log_config.file_path:
@@ -299,7 +494,9 @@ class ConfigurationManager:
                 backupCount=log_config.backup_count
             )
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
+        
+        logger.handlers = handlers
     
     @property
     def config(self) -> SystemConfig:
@@ -316,13 +513,24 @@ class ConfigurationManager:
         Returns:
             Configuration value or default
         """
-        try:
-            current = asdict(self._config)
-            for key in path.split('.'):
+        current = self._config
+        for key in _split_path(path):
+            if is_dataclass(current):
+                if (key not in current.__dataclass_fields__
+                        and not isinstance(getattr(type(current), key, None), property)):
+                    return default
+                current = getattr(current, key)
+            elif isinstance(current, dict) and key in current:
                 current = current[key]
-            return current
-        except (KeyError, TypeError):
-            return default
+            else:
+                return default
+        
+        # Hand out copies so callers can't mutate the live configuration
+        if is_dataclass(current):
+            return asdict(current)
+        if isinstance(current, (dict, list)):
+            return copy.deepcopy(current)
+        return current
     
     def set(self, path: str, value: Any):
         """Set configuration value using dot notation.
@@ -331,10 +539,49 @@ class ConfigurationManager:
             path: Dot-separated path
             value: Value to set
         """
-        config_dict = asdict(self._config)
-        self._set_nested_value(config_dict, path, value)
-        config_dict['updated_at'] = datetime.now().isoformat()
-        self._config = self._dict_to_config(config_dict)
+        updated_at_ns = time.time_ns()
+        try:
+            self._config = self._replace_path(
+                self._config, _split_path(path), value, updated_at_ns=updated_at_ns
+            )
+        except (KeyError, TypeError):
+            # Whole sections and unknown paths go through the dict round trip
+            config_dict = asdict(self._config)
+            self._set_nested_value(config_dict, path, value)
+            config_dict.pop('updated_at', None)
+            config_dict['updated_at_ns'] = updated_at_ns
+            self._config = self._dict_to_config(config_dict)
+    
+    def _replace_path(self, obj: Any, keys: Tuple[str, ...], value: Any, **changes) -> Any:
+        """Copy a dataclass tree with one leaf field replaced.
+        
+        Only the dataclasses along the path are rebuilt; every other section
+        is shared with the original.
+        
+        Args:
+            obj: Dataclass to copy
+            keys: Field names leading to the leaf
+            value: New leaf value
+            **changes: Extra fields to replace on obj itself
+            
+        Returns:
+            Updated copy of obj
+            
+        Raises:
+            KeyError: If a key is not a field of its dataclass
+            TypeError: If the path ends on a nested section
+        """
+        key, rest = keys[0], keys[1:]
+        if not is_dataclass(obj) or key not in obj.__dataclass_fields__:
+            raise KeyError(key)
+        
+        if rest:
+            value = self._replace_path(getattr(obj, key), rest, value)
+        elif is_dataclass(getattr(obj, key)):
+            raise TypeError(f"{key} is a configuration section")
+        
+        changes[key] = value
+        return replace(obj, **changes)
     
     def save_config(self, include_secrets: bool = False):
         """Save current configuration to file.
@@ -344,30 +591,33 @@ class ConfigurationManager:
         """
         try:
             config_dict = asdict(self._config)
+            config_dict['updated_at'] = self._config.updated_at
+            del config_dict['updated_at_ns']
             
-            # Remove sensitive data for main config
-            safe_config = config_dict.copy()
-            if 'api' in safe_config and not include_secrets:
-                api_keys = ['finnhub_key', 'tavily_key', 'openai_key', 'anthropic_key']
-                for key in api_keys:
-                    if key in safe_config['api']:
-                        safe_config['api'][key] = '[REDACTED]'
+            # Remove sensitive data for main config; only the api section is rebuilt
+            safe_config = config_dict
+            if 'api' in config_dict and not include_secrets:
+                api_section = config_dict['api']
+                safe_config = {
+                    **config_dict,
+                    'api': {
+                        **api_section,
+                        **{key: '[REDACTED]' for key in API_KEY_FIELDS if key in api_section}
+                    }
+                }
             
             # Save main config
-            with open(self.env_config_file, 'w') as f:
-                yaml.dump(safe_config, f, default_flow_style=False, indent=2)
+            self.env_config_file.write_bytes(_dump_yaml(safe_config))
             
             # Save secrets separately if requested
             if include_secrets and 'api' in config_dict:
                 secrets = {'api': {}}
-                api_keys = ['finnhub_key', 'tavily_key', 'openai_key', 'anthropic_key']
-                for key in api_keys:
+                for key in API_KEY_FIELDS:
                     if key in config_dict['api'] and config_dict['api'][key]:
                         secrets['api'][key] = config_dict['api'][key]
                 
                 if secrets['api']:
-                    with open(self.secrets_file, 'w') as f:
-                        yaml.dump(secrets, f, default_flow_style=False, indent=2)
+                    self.secrets_file.write_bytes(_dump_yaml(secrets))
                     
                     # Secure the secrets file
                     os.chmod(self.secrets_file, 0o600)
@@ -383,91 +633,44 @@ class ConfigurationManager:
         Returns:
             Dictionary of validation errors by section
         """
-        errors = {}
-        
-        # Validate API keys
-        api_errors = []
-        if not self._config.api.finnhub_key:
-            api_errors.append("Finnhub API key is missing")
-        if not self._config.api.tavily_key:
-            api_errors.append("Tavily API key is missing")
-        
-        if api_errors:
-            errors['api'] = api_errors
+        errors = defaultdict(list)
+        for section, is_valid, message in _VALIDATORS:
+            if not is_valid(self._config):
+                errors[section].append(message.format(config=self._config))
         
         # Validate data directories
-        data_errors = []
-        data_dir = Path(self._config.data_dir)
-        if not data_dir.exists():
-            try:
-                data_dir.mkdir(parents=True, exist_ok=True)
-            except Exception as e:
-                data_errors.append(f"Cannot create data directory: {e}")
+        data_error = self._ensure_data_dir()
+        if data_error:
+            errors['data'].append(data_error)
         
-        if data_errors:
-            errors['data'] = data_errors
+        return dict(errors)
+    
+    def _ensure_data_dir(self) -> Optional[str]:
+        """Create the configured data directory once per configured path.
         
-        # Validate logging configuration
-        log_errors = []
-        if self._config.logging.level not in ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']:
-            log_errors.append(f"Invalid log level: {self._config.logging.level}")
+        Returns:
+            Error message if the directory cannot be created, else None
+        """
+        data_dir = self._config.data_dir
+        if data_dir == self._data_dir_created:
+            return None
         
-        if log_errors:
-            errors['logging'] = log_errors
+        try:
+            Path(data_dir).mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            return f"Cannot create data directory: {e}"
         
-        return errors
+        self._data_dir_created = data_dir
+        return None
     
     def create_sample_config(self):
         """Create sample configuration files."""
-        # Base config
-        sample_config = {
-            'version': '1.0.0',
-            'environment': 'development',
-            'debug': False,
-            'data_dir': './data',
-            'logging': {
-                'level': 'INFO',
-                'enable_console': True,
-                'enable_file': True,
-                'file_path': './logs/supply_chain_intel.log'
-            },
-            'api': {
-                'rate_limit_requests': 100,
-                'timeout_seconds': 30
-            },
-            'performance': {
-                'cache_enabled': True,
-                'cache_ttl': 3600
-            },
-            'alerts': {
-                'enabled': True,
-                'check_interval': 300
-            },
-            'webhooks': {
-                'default_timeout': 30,
-                'enabled_platforms': ['slack', 'discord']
-            }
-        }
-        
-        # Sample secrets
-        sample_secrets = {
-            'api': {
-                'finnhub_key': 'your_finnhub_api_key_here',
-                'tavily_key': 'your_tavily_api_key_here',
-                'openai_key': 'your_openai_api_key_here',
-                'anthropic_key': 'your_anthropic_api_key_here'
-            }
-        }
-        
         # Write sample files
         sample_config_file = self.config_dir / 'config.sample.yml'
         sample_secrets_file = self.config_dir / '.secrets.sample.yml'
         
-        with open(sample_config_file, 'w') as f:
-            yaml.dump(sample_config, f, default_flow_style=False, indent=2)
-        
-        with open(sample_secrets_file, 'w') as f:
-            yaml.dump(sample_secrets, f, default_flow_style=False, indent=2)
+        sample_config_file.write_bytes(_SAMPLE_CONFIG_BYTES)
+        sample_secrets_file.write_bytes(_SAMPLE_SECRETS_BYTES)
         
         print(f"Sample configuration files created:")
         print(f"  Config: {sample_config_file}")
@@ -477,18 +680,30 @@ class ConfigurationManager:
         print(f"  cp {sample_secrets_file} {self.secrets_file}")
 
 
-# Global configuration manager instance
-_config_manager = None
+@functools.cache
+def _cached_config_manager(config_dir: Optional[Path], environment: Optional[str]) -> ConfigurationManager:
+    """Configuration manager for normalised (config_dir, environment) arguments."""
+    return ConfigurationManager(config_dir, environment)
+
+# Manager returned when no arguments are given: the first one requested
+_default_config_manager: Optional[ConfigurationManager] = None
 
 def get_config_manager(config_dir: Optional[Path] = None, environment: str = None) -> ConfigurationManager:
-    """Get global configuration manager instance."""
-    global _config_manager
+    """Get the shared configuration manager for a config directory and environment.
+    
+    Called without arguments (as get_config() does), returns the first manager
+    requested, so an app that configured a custom directory keeps using it.
+    """
+    global _default_config_manager
     
-    if _config_manager is None:
-        _config_manager = ConfigurationManager(config_dir, environment)
+    if config_dir is None and environment is None and _default_config_manager is not None:
+        return _default_config_manager
     
-    return _config_manager
+    manager = _cached_config_manager(Path(config_dir) if config_dir else None, environment or None)
+    if _default_config_manager is None:
+        _default_config_manager = manager
+    return manager
 
 def get_config() -> SystemConfig:
     """Get current system configuration."""
-    return get_config_manager().config
\ No newline at end of file
+    return get_config_manager().config
@@ -1,16 +1,133 @@
 """Multi-theme correlation analyzer for identifying cross-theme opportunities and conflicts."""
 
+import functools
+import mmap
+import os
 import re
+import sys
 import json
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional, Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from collections import defaultdict, Counter
 import math
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-@dataclass
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Research corpora at least this large are parsed across worker processes
+PARALLEL_PARSE_MIN_FILES = 8
+
+# Upper bound on parse worker processes, shared by every analyzer in the process
+PARSE_POOL_MAX_WORKERS = 4
+
+# Fixed patterns used while parsing research documents
+_TITLE_RE = re.compile(r'# Investment Research:\s*([^\n]+)')
+_THEME_FM_RE = re.compile(r'theme:\s*([^\n]+)')
+_TABLE_RE = re.compile(r'\|[^|]*([A-Z]{1,5})[^|]*\|([^|]*)\|([^|]*)\|([^|]*)\|[^|]*\|')
+_TICKER_RE = re.compile(r'\b([A-Z]{2,5})\b')
+_CLEAN_RE = re.compile(r'^[\*\s]+|[\*\s]+$')
+
+# Exposure keywords by level, matched as substrings; a lookahead scan finds
+# every occurrence, including ones overlapping another keyword
+_HIGH_EXPOSURE = frozenset({'high', '9/10', '10/10', '8/10'})
+_MEDIUM_EXPOSURE = frozenset({'medium', '5/10', '6/10', '7/10'})
+_LOW_EXPOSURE = frozenset({'low', '1/10', '2/10', '3/10', '4/10'})
+_EXPOSURE_RE = re.compile('(?=({}))'.format('|'.join(
+    re.escape(word) for word in sorted(_HIGH_EXPOSURE | _MEDIUM_EXPOSURE | _LOW_EXPOSURE, key=len, reverse=True)
+)))
+
+# Byte-level counterparts used to read a theme without decoding the file
+_TITLE_BYTES_RE = re.compile(rb'# Investment Research:\s*([^\n]+)')
+_THEME_FM_BYTES_RE = re.compile(rb'theme:\s*([^\n]+)')
+
+# Recommendation sections scanned for narrative ticker mentions, in priority
+# order; each runs from its ##/### heading up to the next heading. One
+# alternation finds them all in a single pass, group N marking section N.
+_RECOMMENDATION_SECTIONS = ('Investment Opportunities', 'Top Picks', 'Key Plays', 'Recommendations')
+_RECOMMENDATION_SECTION_RE = re.compile(
+    r'#{{2,3}}\s*(?:{})'.format('|'.join(f'({section})' for section in _RECOMMENDATION_SECTIONS))
+    + r'.*?(?=#{2,3}|$)',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Uppercase tokens that look like tickers but are not
+_TABLE_NON_TICKERS = frozenset({'PE', 'YOY', 'USD', 'CEO'})
+_NARRATIVE_NON_TICKERS = frozenset({'THE', 'AND', 'FOR', 'API', 'CEO', 'IPO', 'ETF'})
+
+
+# Sentiment keywords and their polarity; counted as substrings of the
+# lowercased context, like str.count
+_POSITIVE_WORDS = ('buy', 'strong', 'outperform', 'undervalued', 'opportunity',
+                   'growth', 'bullish', 'upside', 'compelling', 'attractive',
+                   'winner', 'leader', 'dominant', 'benefit', 'gain')
+_NEGATIVE_WORDS = ('sell', 'weak', 'underperform', 'overvalued', 'risk',
+                   'decline', 'bearish', 'downside', 'concern', 'threat',
+                   'lose', 'vulnerable', 'challenged', 'disrupted', 'avoid')
+_SENTIMENT_POLARITY = {
+    **{word: 1 for word in _POSITIVE_WORDS},
+    **{word: -1 for word in _NEGATIVE_WORDS},
+}
+
+# One pass over the text finds every keyword: an Aho-Corasick automaton when
+# pyahocorasick is installed, otherwise a single alternation regex
+if ahocorasick is not None:
+    _SENTIMENT_AUTOMATON = ahocorasick.Automaton()
+    for _word, _polarity in _SENTIMENT_POLARITY.items():
+        _SENTIMENT_AUTOMATON.add_word(_word, _polarity)
+    _SENTIMENT_AUTOMATON.make_automaton()
+else:
+    _SENTIMENT_AUTOMATON = None
+_SENTIMENT_RE = re.compile('|'.join(map(re.escape, _SENTIMENT_POLARITY)))
+
+
+@functools.lru_cache(maxsize=4096)
+def _ticker_context_re(ticker: str) -> re.Pattern:
+    """Pattern for a ticker mention and up to 200 characters after it."""
+    return re.compile(rf'\b{re.escape(ticker)}\b.{{0,200}}', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _company_name_res(ticker: str) -> Tuple[re.Pattern, ...]:
+    """Patterns like "Apple (AAPL)", "AAPL (Apple Inc)" and "| AAPL | Apple |"."""
+    escaped = re.escape(ticker)
+    return (
+        re.compile(rf'([^|(),\n]{{5,50}})\s*\(\s*{escaped}\s*\)', re.IGNORECASE),
+        re.compile(rf'{escaped}\s*\(([^)]+)\)', re.IGNORECASE),
+        re.compile(rf'\|\s*{escaped}\s*\|\s*([^|]+?)\s*\|', re.IGNORECASE),
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _ticker_sentence_re(ticker: str) -> re.Pattern:
+    """Pattern for the rest of the sentence starting at a ticker."""
+    return re.compile(rf'{re.escape(ticker)}[^.]*\.')
+
+
+@functools.cache
+def _field_names(cls) -> Tuple[str, ...]:
+    """Field names of a result dataclass, resolved once per class."""
+    return tuple(f.name for f in fields(cls))
+
+
+@dataclass(slots=True)
 class ThemeCompany:
     """A company identified in a research theme."""
     ticker: str
@@ -23,19 +140,10 @@ class ThemeCompany:
     research_file: Optional[str] = None
     
     def to_dict(self) -> Dict:
-        return {
-            'ticker': self.ticker,
-            'company_name': self.company_name,
-            'theme': self.theme,
-            'exposure_level': self.exposure_level,
-            'sentiment': self.sentiment,
-            'role': self.role,
-            'rationale': self.rationale,
-            'research_file': self.research_file
-        }
+        return {name: getattr(self, name) for name in _field_names(type(self))}
 
 
-@dataclass 
+@dataclass(slots=True)
 class ThemeOverlap:
     """Overlap analysis between two themes."""
     theme1: str
@@ -46,17 +154,10 @@ class ThemeOverlap:
     insights: List[str] = field(default_factory=list)
     
     def to_dict(self) -> Dict:
-        return {
-            'theme1': self.theme1,
-            'theme2': self.theme2,
-            'common_tickers': self.common_tickers,
-            'overlap_score': self.overlap_score,
-            'correlation_type': self.correlation_type,
-            'insights': self.insights
-        }
+        return {name: getattr(self, name) for name in _field_names(type(self))}
 
 
-@dataclass
+@dataclass(slots=True)
 class CrossThemeOpportunity:
     """A cross-theme investment opportunity."""
     ticker: str
@@ -70,17 +171,21 @@ class CrossThemeOpportunity:
     risk_factors: List[str] = field(default_factory=list)
     
     def to_dict(self) -> Dict:
-        return {
-            'ticker': self.ticker,
-            'company_name': self.company_name,
-            'themes': self.themes,
-            'opportunity_type': self.opportunity_type,
-            'confidence_score': self.confidence_score,
-            'description': self.description,
-            'supporting_themes': self.supporting_themes,
-            'conflicting_themes': self.conflicting_themes,
-            'risk_factors': self.risk_factors
-        }
+        return {name: getattr(self, name) for name in _field_names(type(self))}
+
+
+def _intern_categorical_fields(company: ThemeCompany):
+    """Share one string object per distinct ticker, theme, label and source file.
+    
+    Cached companies repeat a handful of values across thousands of instances;
+    interning also turns most equality checks on them into identity checks.
+    """
+    company.ticker = sys.intern(company.ticker)
+    company.theme = sys.intern(company.theme)
+    company.exposure_level = sys.intern(company.exposure_level)
+    company.sentiment = sys.intern(company.sentiment)
+    if company.research_file is not None:
+        company.research_file = sys.intern(company.research_file)
 
 
 class MultiThemeCorrelationAnalyzer:
@@ -97,34 +202,51 @@ class MultiThemeCorrelationAnalyzer:
         self.correlation_dir = data_dir / 'correlations'
         self.correlation_dir.mkdir(parents=True, exist_ok=True)
         
-        # Cache for theme data
+        # Cache for theme data, keyed by lowercased theme name and rebuilt
+        # when the research directory changes
         self._theme_companies: Dict[str, List[ThemeCompany]] = {}
+        self._available_themes: List[str] = []
+        self._loaded_key: Optional[Tuple[int, int]] = None
         self._research_metadata: Dict[str, Dict] = {}
+        
+        # Analysis results for the currently loaded research, keyed by the
+        # themes compared / minimum theme count
+        self._overlaps_cache: Dict[Tuple[str, ...], List[ThemeOverlap]] = {}
+        self._opportunities_cache: Dict[int, List[CrossThemeOpportunity]] = {}
     
-    def extract_companies_from_research(self, research_content: str, research_filename: str) -> List[ThemeCompany]:
+    def refresh(self):
+        """Drop cached research and analysis results so the next call reloads them."""
+        self._loaded_key = None
+        self._overlaps_cache.clear()
+        self._opportunities_cache.clear()
+    
+    def extract_companies_from_research(self, research_content: str, research_filename: str,
+                                        theme: Optional[str] = None) -> List[ThemeCompany]:
         """Extract company mentions and sentiment from research content.
         
         Args:
             research_content: Full research document content
             research_filename: Name of research file
+            theme: Theme of the document, extracted from the content if None
             
         Returns:
             List of ThemeCompany objects
         """
-        companies = []
+        # Companies by ticker; the first mention of a ticker wins
+        companies: Dict[str, ThemeCompany] = {}
         
         # Extract theme from filename or content
-        theme = self._extract_theme_from_content(research_content, research_filename)
+        if theme is None:
+            theme = self._extract_theme_from_content(research_content, research_filename)
         
         # Look for markdown tables with ticker information
-        table_pattern = r'\|[^|]*([A-Z]{1,5})[^|]*\|([^|]*)\|([^|]*)\|([^|]*)\|[^|]*\|'
-        table_matches = re.findall(table_pattern, research_content)
+        table_matches = _TABLE_RE.findall(research_content)
         
         for match in table_matches:
             ticker, company_col, role_col, extra_col = match
             ticker = ticker.strip()
             
-            if len(ticker) < 2 or ticker in ['PE', 'YOY', 'USD', 'CEO']:
+            if len(ticker) < 2 or ticker in _TABLE_NON_TICKERS or ticker in companies:
                 continue
             
             # Determine sentiment from surrounding context
@@ -146,31 +268,23 @@ class MultiThemeCorrelationAnalyzer:
                 rationale=extra_col.strip()[:200] if extra_col.strip() else None,
                 research_file=research_filename
             )
-            companies.append(company)
+            companies[ticker] = company
         
         # Also look for ticker mentions in text with positive/negative context
-        text_tickers = self._extract_tickers_from_narrative(research_content, theme, research_filename)
-        companies.extend(text_tickers)
-        
-        # Deduplicate by ticker
-        seen_tickers = set()
-        unique_companies = []
-        for company in companies:
-            if company.ticker not in seen_tickers:
-                seen_tickers.add(company.ticker)
-                unique_companies.append(company)
-        
-        return unique_companies
+        for company in self._extract_tickers_from_narrative(research_content, theme, research_filename):
+            companies.setdefault(company.ticker, company)
+        
+        return list(companies.values())
     
     def _extract_theme_from_content(self, content: str, filename: str) -> str:
         """Extract theme name from content or filename."""
         # Try to extract from title
-        title_match = re.search(r'# Investment Research:\s*([^\n]+)', content)
+        title_match = _TITLE_RE.search(content)
         if title_match:
             return title_match.group(1).strip()
         
         # Try from YAML frontmatter
-        theme_match = re.search(r'theme:\s*([^\n]+)', content)
+        theme_match = _THEME_FM_RE.search(content)
         if theme_match:
             return theme_match.group(1).strip()
         
@@ -180,42 +294,30 @@ class MultiThemeCorrelationAnalyzer:
     
     def _analyze_sentiment_context(self, content: str, ticker: str) -> str:
         """Analyze sentiment around ticker mentions."""
-        # Look for ticker mentions and surrounding context
-        pattern = rf'\b{ticker}\b.{{0,200}}'
-        matches = re.findall(pattern, content, re.IGNORECASE)
-        
-        positive_words = ['buy', 'strong', 'outperform', 'undervalued', 'opportunity', 
-                         'growth', 'bullish', 'upside', 'compelling', 'attractive',
-                         'winner', 'leader', 'dominant', 'benefit', 'gain']
-        negative_words = ['sell', 'weak', 'underperform', 'overvalued', 'risk',
-                         'decline', 'bearish', 'downside', 'concern', 'threat',
-                         'lose', 'vulnerable', 'challenged', 'disrupted', 'avoid']
-        
-        positive_score = 0
-        negative_score = 0
-        
-        for match in matches:
-            match_lower = match.lower()
-            for word in positive_words:
-                positive_score += match_lower.count(word)
-            for word in negative_words:
-                negative_score += match_lower.count(word)
-        
-        if positive_score > negative_score:
+        # Score each ticker mention and its surrounding context as it is found
+        score = 0
+        for match in _ticker_context_re(ticker).finditer(content):
+            window = match.group(0).lower()
+            if _SENTIMENT_AUTOMATON is not None:
+                score += sum(polarity for _, polarity in _SENTIMENT_AUTOMATON.iter(window))
+            else:
+                score += sum(_SENTIMENT_POLARITY[word] for word in _SENTIMENT_RE.findall(window))
+        
+        if score > 0:
             return "positive"
-        elif negative_score > positive_score:
+        elif score < 0:
             return "negative"
         else:
             return "neutral"
     
     def _extract_exposure_level(self, text: str) -> str:
         """Extract exposure level from text."""
-        text_lower = text.lower()
-        if any(word in text_lower for word in ['high', '9/10', '10/10', '8/10']):
+        found = set(_EXPOSURE_RE.findall(text.lower()))
+        if found & _HIGH_EXPOSURE:
             return "high"
-        elif any(word in text_lower for word in ['medium', '5/10', '6/10', '7/10']):
+        elif found & _MEDIUM_EXPOSURE:
             return "medium"
-        elif any(word in text_lower for word in ['low', '1/10', '2/10', '3/10', '4/10']):
+        elif found & _LOW_EXPOSURE:
             return "low"
         else:
             return "medium"  # default
@@ -223,18 +325,12 @@ class MultiThemeCorrelationAnalyzer:
     def _extract_company_name_from_context(self, content: str, ticker: str) -> str:
         """Extract company name from context around ticker."""
         # Look for patterns like "Apple (AAPL)" or "AAPL (Apple Inc)"
-        patterns = [
-            rf'([^|(),\n]{{5,50}})\s*\(\s*{ticker}\s*\)',
-            rf'{ticker}\s*\(([^)]+)\)',
-            rf'\|\s*{ticker}\s*\|\s*([^|]+?)\s*\|'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        for pattern in _company_name_res(ticker):
+            match = pattern.search(content)
             if match:
                 name = match.group(1).strip()
                 # Clean up common artifacts
-                name = re.sub(r'^[\*\s]+|[\*\s]+$', '', name)
+                name = _CLEAN_RE.sub('', name)
                 if len(name) > 3 and not name.isupper():
                     return name
         
@@ -244,25 +340,32 @@ class MultiThemeCorrelationAnalyzer:
         """Extract tickers mentioned in narrative text with sentiment."""
         companies = []
         
-        # Look for ticker patterns in investment recommendations sections
-        sections = ['Investment Opportunities', 'Top Picks', 'Key Plays', 'Recommendations']
+        # First occurrence of each recommendation section
+        section_matches = [None] * len(_RECOMMENDATION_SECTIONS)
+        remaining = len(section_matches)
+        for match in _RECOMMENDATION_SECTION_RE.finditer(content):
+            index = match.lastindex - 1
+            if section_matches[index] is None:
+                section_matches[index] = match
+                remaining -= 1
+                if not remaining:
+                    break
         
-        for section in sections:
-            section_match = re.search(f'#{2,3}\\s*{section}.*?(?=#{2,3}|$)', content, re.DOTALL | re.IGNORECASE)
+        # Look for ticker patterns in investment recommendations sections
+        for section_match in section_matches:
             if section_match:
                 section_content = section_match.group(0)
                 
                 # Find ticker mentions with context
-                ticker_pattern = r'\b([A-Z]{2,5})\b'
-                tickers = re.findall(ticker_pattern, section_content)
+                tickers = _TICKER_RE.findall(section_content)
                 
                 for ticker in set(tickers):
-                    if len(ticker) >= 2 and ticker not in ['THE', 'AND', 'FOR', 'API', 'CEO', 'IPO', 'ETF']:
+                    if len(ticker) >= 2 and ticker not in _NARRATIVE_NON_TICKERS:
                         sentiment = self._analyze_sentiment_context(section_content, ticker)
                         company_name = self._extract_company_name_from_context(content, ticker)
                         
                         # Extract surrounding context for rationale
-                        context_match = re.search(f'{ticker}[^.]*\\.', section_content)
+                        context_match = _ticker_sentence_re(ticker).search(section_content)
                         rationale = context_match.group(0) if context_match else None
                         
                         company = ThemeCompany(
@@ -291,49 +394,105 @@ class MultiThemeCorrelationAnalyzer:
         # Load theme data
         if themes is None:
             themes = self._get_available_themes()
+        else:
+            self._load_all()
         
-        theme_data = {}
-        for theme in themes:
-            theme_data[theme] = self._get_or_load_theme_companies(theme)
+        cached = self._overlaps_cache.get(tuple(themes))
+        if cached is not None:
+            return list(cached)
         
-        overlaps = []
+        # Later mentions of a ticker within a theme take precedence
+        theme_data = [
+            {c.ticker: c for c in self._get_or_load_theme_companies(theme)}
+            for theme in themes
+        ]
         
-        # Compare each pair of themes
-        for i, theme1 in enumerate(themes):
-            for theme2 in themes[i+1:]:
-                companies1 = {c.ticker: c for c in theme_data[theme1]}
-                companies2 = {c.ticker: c for c in theme_data[theme2]}
-                
-                common_tickers = set(companies1.keys()) & set(companies2.keys())
-                
-                if common_tickers:
-                    # Calculate overlap score
-                    total_unique = len(set(companies1.keys()) | set(companies2.keys()))
-                    overlap_score = len(common_tickers) / total_unique if total_unique > 0 else 0.0
-                    
-                    # Determine correlation type
-                    correlation_type = self._determine_correlation_type(
-                        common_tickers, companies1, companies2
-                    )
-                    
-                    # Generate insights
-                    insights = self._generate_correlation_insights(
-                        theme1, theme2, common_tickers, companies1, companies2
-                    )
-                    
-                    overlap = ThemeOverlap(
-                        theme1=theme1,
-                        theme2=theme2,
-                        common_tickers=sorted(list(common_tickers)),
-                        overlap_score=overlap_score,
-                        correlation_type=correlation_type,
-                        insights=insights
-                    )
-                    overlaps.append(overlap)
+        if np is not None:
+            pair_stats = self._pair_stats_vectorized(theme_data)
+        else:
+            pair_stats = self._pair_stats_python(theme_data)
+        
+        overlaps = []
+        for i, j, overlap_score, matches, conflicts in pair_stats:
+            companies1, companies2 = theme_data[i], theme_data[j]
+            common_tickers = set(companies1.keys()) & set(companies2.keys())
+            
+            overlap = ThemeOverlap(
+                theme1=themes[i],
+                theme2=themes[j],
+                common_tickers=sorted(list(common_tickers)),
+                overlap_score=overlap_score,
+                correlation_type=self._correlation_type(matches, conflicts),
+                insights=self._generate_correlation_insights(
+                    themes[i], themes[j], common_tickers, companies1, companies2
+                )
+            )
+            overlaps.append(overlap)
         
         # Sort by overlap score descending
         overlaps.sort(key=lambda x: x.overlap_score, reverse=True)
-        return overlaps
+        self._overlaps_cache[tuple(themes)] = overlaps
+        return list(overlaps)
+    
+    @staticmethod
+    def _pair_stats_vectorized(theme_data: List[Dict[str, ThemeCompany]]) -> List[Tuple[int, int, float, int, int]]:
+        """Compute overlap statistics for every overlapping theme pair at once.
+        
+        Builds positive/negative sentiment matrices over the ticker universe so
+        intersections, agreements and conflicts for all pairs come from a few
+        matrix products.
+        
+        Returns:
+            (i, j, overlap_score, sentiment_matches, sentiment_conflicts) for
+            each pair i < j sharing at least one ticker, in pair order
+        """
+        ticker_idx = {ticker: k for k, ticker in enumerate(sorted(set().union(*theme_data)))}
+        presence = np.zeros((len(theme_data), len(ticker_idx)), dtype=np.int32)
+        positive = np.zeros_like(presence)
+        negative = np.zeros_like(presence)
+        for i, companies in enumerate(theme_data):
+            for ticker, company in companies.items():
+                k = ticker_idx[ticker]
+                presence[i, k] = 1
+                if company.sentiment == "positive":
+                    positive[i, k] = 1
+                elif company.sentiment == "negative":
+                    negative[i, k] = 1
+        
+        common = presence @ presence.T
+        counts = presence.sum(axis=1)
+        union = counts[:, None] + counts[None, :] - common
+        matches = positive @ positive.T + negative @ negative.T
+        conflicts = positive @ negative.T + negative @ positive.T
+        
+        rows, cols = np.nonzero(np.triu(common, k=1))
+        return [
+            (int(i), int(j), int(common[i, j]) / int(union[i, j]), int(matches[i, j]), int(conflicts[i, j]))
+            for i, j in zip(rows, cols)
+        ]
+    
+    @staticmethod
+    def _pair_stats_python(theme_data: List[Dict[str, ThemeCompany]]) -> List[Tuple[int, int, float, int, int]]:
+        """Pure-Python equivalent of _pair_stats_vectorized."""
+        stats = []
+        for i, companies1 in enumerate(theme_data):
+            for j in range(i + 1, len(theme_data)):
+                companies2 = theme_data[j]
+                common_tickers = companies1.keys() & companies2.keys()
+                if not common_tickers:
+                    continue
+                
+                total_unique = len(companies1.keys() | companies2.keys())
+                matches = conflicts = 0
+                for ticker in common_tickers:
+                    sentiment1 = companies1[ticker].sentiment
+                    sentiment2 = companies2[ticker].sentiment
+                    if sentiment1 == sentiment2 and sentiment1 != "neutral":
+                        matches += 1
+                    elif {sentiment1, sentiment2} == {"positive", "negative"}:
+                        conflicts += 1
+                stats.append((i, j, len(common_tickers) / total_unique, matches, conflicts))
+        return stats
     
     def _determine_correlation_type(self, common_tickers: Set[str], 
                                   companies1: Dict[str, ThemeCompany], 
@@ -352,6 +511,11 @@ class MultiThemeCorrelationAnalyzer:
                  (c1.sentiment == "negative" and c2.sentiment == "positive"):
                 sentiment_conflicts += 1
         
+        return self._correlation_type(sentiment_matches, sentiment_conflicts)
+    
+    @staticmethod
+    def _correlation_type(sentiment_matches: int, sentiment_conflicts: int) -> str:
+        """Classify a theme pair from its sentiment agreement and conflict counts."""
         if sentiment_conflicts > sentiment_matches:
             return "conflicting"
         elif sentiment_matches > 0:
@@ -405,16 +569,28 @@ class MultiThemeCorrelationAnalyzer:
         Returns:
             List of CrossThemeOpportunity objects
         """
-        # Build ticker to themes mapping
+        themes = self._get_available_themes()
+        cached = self._opportunities_cache.get(min_themes)
+        if cached is not None:
+            return list(cached)
+        
+        # Build ticker to themes mapping, splitting out supporting and
+        # conflicting themes as we go
         ticker_themes = defaultdict(list)
+        ticker_supporting = defaultdict(list)
+        ticker_conflicting = defaultdict(list)
         all_companies = {}
         
-        themes = self._get_available_themes()
         for theme in themes:
             companies = self._get_or_load_theme_companies(theme)
             for company in companies:
-                ticker_themes[company.ticker].append(company)
-                all_companies[company.ticker] = company  # Keep one instance for name
+                ticker = company.ticker
+                ticker_themes[ticker].append(company)
+                all_companies[ticker] = company  # Keep one instance for name
+                if company.sentiment == "positive":
+                    ticker_supporting[ticker].append(company.theme)
+                elif company.sentiment == "negative":
+                    ticker_conflicting[ticker].append(company.theme)
         
         opportunities = []
         
@@ -423,9 +599,10 @@ class MultiThemeCorrelationAnalyzer:
                 themes_list = [c.theme for c in theme_companies]
                 
                 # Analyze sentiment consistency
-                sentiments = [c.sentiment for c in theme_companies]
-                positive_count = sentiments.count("positive")
-                negative_count = sentiments.count("negative")
+                supporting_themes = ticker_supporting[ticker]
+                conflicting_themes = ticker_conflicting[ticker]
+                positive_count = len(supporting_themes)
+                negative_count = len(conflicting_themes)
                 
                 # Determine opportunity type and confidence
                 if positive_count >= len(theme_companies) * 0.8:
@@ -446,10 +623,6 @@ class MultiThemeCorrelationAnalyzer:
                     ticker, theme_companies, opportunity_type
                 )
                 
-                # Categorize themes
-                supporting_themes = [c.theme for c in theme_companies if c.sentiment == "positive"]
-                conflicting_themes = [c.theme for c in theme_companies if c.sentiment == "negative"]
-                
                 # Generate risk factors
                 risk_factors = self._generate_risk_factors(theme_companies, opportunity_type)
                 
@@ -468,7 +641,8 @@ class MultiThemeCorrelationAnalyzer:
         
         # Sort by confidence score and number of themes
         opportunities.sort(key=lambda x: (x.confidence_score, len(x.themes)), reverse=True)
-        return opportunities
+        self._opportunities_cache[min_themes] = opportunities
+        return list(opportunities)
     
     def _generate_opportunity_description(self, ticker: str, theme_companies: List[ThemeCompany], 
                                         opportunity_type: str) -> str:
@@ -507,38 +681,84 @@ class MultiThemeCorrelationAnalyzer:
         
         return risks
     
-    def _get_available_themes(self) -> List[str]:
-        """Get list of available themes from research files."""
-        if not self.research_dir.exists():
-            return []
+    def _load_all(self):
+        """Read every research file once and group its companies by theme.
+        
+        Skipped while the research directory's file count and newest
+        modification time are unchanged since the last load.
+        """
+        research_files = list(self.research_dir.glob('*.md')) if self.research_dir.exists() else []
+        mtimes = [research_file.stat().st_mtime_ns for research_file in research_files]
+        key = (len(mtimes), max(mtimes, default=0))
+        if key == self._loaded_key:
+            return
+        
+        parsed = None
+        if len(research_files) >= PARALLEL_PARSE_MIN_FILES:
+            try:
+                parsed = list(_get_parse_pool().map(_parse_research_file, research_files, chunksize=4))
+            except BrokenProcessPool:
+                _discard_parse_pool()
+        if parsed is None:
+            parsed = [self._parse_research_file(research_file) for research_file in research_files]
         
         themes = set()
-        for research_file in self.research_dir.glob('*.md'):
-            with open(research_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                theme = self._extract_theme_from_content(content, research_file.name)
-                themes.add(theme)
+        theme_companies = defaultdict(list)
+        for theme, companies in parsed:
+            themes.add(theme)
+            for company in companies:
+                _intern_categorical_fields(company)
+            theme_companies[theme.lower()].extend(companies)
+        
+        self._available_themes = sorted(themes)
+        self._theme_companies = dict(theme_companies)
+        self._overlaps_cache.clear()
+        self._opportunities_cache.clear()
+        self._loaded_key = key
+    
+    def _parse_research_file(self, research_file: Path) -> Tuple[str, List[ThemeCompany]]:
+        """Parse one research file into its theme and extracted companies."""
+        theme, content = self._read_research_file(research_file)
+        if content is None:
+            return theme, []
+        return theme, self.extract_companies_from_research(content, research_file.name, theme)
+    
+    def _read_research_file(self, research_file: Path) -> Tuple[str, Optional[str]]:
+        """Read a research file's theme and, if it can name companies, its text.
+        
+        The file is memory-mapped and only decoded when it contains a table or
+        a ## heading, the two places companies are extracted from; otherwise
+        the theme is read straight from the bytes.
         
-        return sorted(list(themes))
+        Returns:
+            Tuple of (theme, decoded content or None)
+        """
+        with open(research_file, 'rb') as f:
+            if research_file.stat().st_size == 0:
+                return self._extract_theme_from_content('', research_file.name), ''
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b'|') == -1 and mm.find(b'##') == -1:
+                    match = _TITLE_BYTES_RE.search(mm) or _THEME_FM_BYTES_RE.search(mm)
+                    if match:
+                        return match.group(1).decode('utf-8').strip(), None
+                    return self._extract_theme_from_content('', research_file.name), None
+                raw = mm[:]
+        
+        content = raw.decode('utf-8')
+        if '\r' in content:
+            # Match text-mode universal newline handling
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return self._extract_theme_from_content(content, research_file.name), content
+    
+    def _get_available_themes(self) -> List[str]:
+        """Get list of available themes from research files."""
+        self._load_all()
+        return list(self._available_themes)
     
     def _get_or_load_theme_companies(self, theme: str) -> List[ThemeCompany]:
-        """Get companies for a theme, loading from cache or files as needed."""
-        if theme in self._theme_companies:
-            return self._theme_companies[theme]
-        
-        companies = []
-        if self.research_dir.exists():
-            for research_file in self.research_dir.glob('*.md'):
-                with open(research_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    file_theme = self._extract_theme_from_content(content, research_file.name)
-                    
-                    if file_theme.lower() == theme.lower():
-                        file_companies = self.extract_companies_from_research(content, research_file.name)
-                        companies.extend(file_companies)
-        
-        self._theme_companies[theme] = companies
-        return companies
+        """Get companies for a theme (matched case-insensitively)."""
+        self._load_all()
+        return self._theme_companies.get(theme.lower(), [])
     
     def generate_correlation_report(self) -> str:
         """Generate a markdown report of theme correlations and opportunities.
@@ -546,13 +766,14 @@ class MultiThemeCorrelationAnalyzer:
         Returns:
             Markdown formatted correlation report
         """
-        overlaps = self.analyze_theme_correlations()
+        themes = self._get_available_themes()
+        overlaps = self.analyze_theme_correlations(themes)
         opportunities = self.identify_cross_theme_opportunities()
         
         lines = [
             "\n---",
             "\n## Multi-Theme Correlation Analysis",
-            f"*Analysis of {len(self._get_available_themes())} investment themes*\n"
+            f"*Analysis of {len(themes)} investment themes*\n"
         ]
         
         if overlaps:
@@ -640,16 +861,20 @@ class MultiThemeCorrelationAnalyzer:
         
         output_path = self.correlation_dir / output_filename
         
-        overlaps = self.analyze_theme_correlations()
+        themes = self._get_available_themes()
+        overlaps = self.analyze_theme_correlations(themes)
         opportunities = self.identify_cross_theme_opportunities()
         
         correlation_data = {
             'generated_at': datetime.now().isoformat(),
-            'themes_analyzed': self._get_available_themes(),
-            'theme_overlaps': [o.to_dict() for o in overlaps],
-            'cross_theme_opportunities': [o.to_dict() for o in opportunities],
+            'themes_analyzed': themes,
+            # orjson serializes the dataclasses natively; json needs plain dicts
+            'theme_overlaps': overlaps if orjson is not None else [o.to_dict() for o in overlaps],
+            'cross_theme_opportunities': (
+                opportunities if orjson is not None else [o.to_dict() for o in opportunities]
+            ),
             'summary_stats': {
-                'total_themes': len(self._get_available_themes()),
+                'total_themes': len(themes),
                 'theme_pairs_analyzed': len(overlaps),
                 'cross_theme_opportunities_found': len(opportunities),
                 'multi_theme_winners': len([o for o in opportunities if o.opportunity_type == "multi_theme_winner"]),
@@ -657,7 +882,47 @@ class MultiThemeCorrelationAnalyzer:
             }
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(correlation_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(correlation_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(correlation_data, f, indent=2, ensure_ascii=False)
         
-        return output_path
\ No newline at end of file
+        return output_path
+
+
+# Created on the first large load and reused, so repeated reloads (e.g. from
+# web requests) do not spawn a fresh set of worker processes each time
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Get the shared research parse pool, creating it on first use."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=min(os.cpu_count() or 1, PARSE_POOL_MAX_WORKERS)
+            )
+        return _parse_pool
+
+
+def _discard_parse_pool():
+    """Drop a broken parse pool so the next large load starts a new one."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown(wait=False, cancel_futures=True)
+            _parse_pool = None
+
+
+@functools.lru_cache(maxsize=None)
+def _worker_analyzer(data_dir: Path) -> MultiThemeCorrelationAnalyzer:
+    """Analyzer reused by a parse worker process for every file it handles."""
+    return MultiThemeCorrelationAnalyzer(data_dir)
+
+
+def _parse_research_file(research_file: Path) -> Tuple[str, List[ThemeCompany]]:
+    """Process pool entry point for MultiThemeCorrelationAnalyzer._parse_research_file."""
+    return _worker_analyzer(research_file.parent.parent)._parse_research_file(research_file)
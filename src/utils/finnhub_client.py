@@ -9,21 +9,28 @@ try:
 except ImportError:
     finnhub = None
 
+from .http_session import get_session
+
 logger = logging.getLogger(__name__)
 
+FINNHUB_API_URL = "https://finnhub.io/api/v1"
+
 
 class FinnhubClient:
     """Client for fetching market data from Finnhub API."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, session=None):
         """
         Initialize Finnhub client.
 
         Args:
             api_key: Finnhub API key. If not provided, reads from FINNHUB_API_KEY env var.
+            session: Optional aiohttp session for async requests. Defaults to
+                the shared pooled session of the running event loop.
         """
         self.api_key = api_key or os.getenv("FINNHUB_API_KEY")
         self.client = None
+        self.session = session
 
         if self.api_key and finnhub:
             try:
@@ -84,6 +91,55 @@ class FinnhubClient:
             logger.warning(f"Failed to fetch profile for {ticker}: {e}")
             return None
 
+    async def _aget(self, endpoint: str, params: dict) -> Optional[dict]:
+        """Make an async GET request against the Finnhub REST API."""
+        session = self.session or get_session()
+        async with session.get(
+            f"{FINNHUB_API_URL}/{endpoint}",
+            params={**params, "token": self.api_key}
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def aget_quote(self, ticker: str) -> Optional[dict]:
+        """
+        Async variant of get_quote using the pooled aiohttp session.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            dict with quote data or None if unavailable
+        """
+        if not self.api_key:
+            return None
+
+        try:
+            return await self._aget("quote", {"symbol": ticker})
+        except Exception as e:
+            logger.warning(f"Failed to fetch quote for {ticker}: {e}")
+            return None
+
+    async def aget_company_profile(self, ticker: str) -> Optional[dict]:
+        """
+        Async variant of get_company_profile using the pooled aiohttp session.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            dict with company profile or None if unavailable
+        """
+        if not self.api_key:
+            return None
+
+        try:
+            profile = await self._aget("stock/profile2", {"symbol": ticker})
+            return profile if profile else None
+        except Exception as e:
+            logger.warning(f"Failed to fetch profile for {ticker}: {e}")
+            return None
+
     def get_basic_financials(self, ticker: str) -> Optional[dict]:
         """
         Get basic financial metrics including P/E ratio, 52-week high/low.
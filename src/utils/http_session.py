@@ -0,0 +1,63 @@
+"""Shared aiohttp session for async API clients."""
+
+import asyncio
+import logging
+import weakref
+from typing import Optional
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+# Connection pool limits for the shared session
+POOL_LIMIT = 100
+POOL_LIMIT_PER_HOST = 10
+REQUEST_TIMEOUT = 60
+
+# Sessions are bound to the event loop they were created on, so keep one per loop
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_session() -> "aiohttp.ClientSession":
+    """Get the pooled aiohttp session for the running event loop.
+
+    Must be called from within a coroutine. The session is created lazily and
+    reused for every request made on the same loop.
+
+    Returns:
+        Shared aiohttp ClientSession
+
+    Raises:
+        ImportError: If aiohttp is not installed
+    """
+    if aiohttp is None:
+        raise ImportError("aiohttp is required for async HTTP requests")
+
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=POOL_LIMIT,
+                limit_per_host=POOL_LIMIT_PER_HOST,
+                enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        )
+        _sessions[loop] = session
+        logger.debug("Created shared aiohttp session")
+    return session
+
+
+async def close_session() -> None:
+    """Close the shared session for the running event loop, if any."""
+    session: Optional["aiohttp.ClientSession"] = _sessions.pop(
+        asyncio.get_running_loop(), None
+    )
+    if session is not None and not session.closed:
+        await session.close()
@@ -478,15 +478,31 @@ class DiskCache:
 class AsyncExecutor:
     """Asynchronous execution utilities for performance optimization."""
     
-    def __init__(self, max_workers: int = 4):
+    def __init__(self, max_workers: int = 4, process_workers: Optional[int] = None):
         """Initialize async executor.
         
         Args:
             max_workers: Maximum number of worker threads
+            process_workers: Worker processes for CPU-bound work
+                (defaults to min(max_workers, 2))
         """
         self.max_workers = max_workers
+        self.process_workers = process_workers or min(max_workers, 2)
         self.thread_executor = ThreadPoolExecutor(max_workers=max_workers)
-        self.process_executor = ProcessPoolExecutor(max_workers=min(max_workers, 2))
+        # Spawned on first CPU-bound call; most executors never need worker processes
+        self._process_executor: Optional[ProcessPoolExecutor] = None
+        self._process_lock = threading.Lock()
+    
+    @property
+    def process_executor(self) -> ProcessPoolExecutor:
+        """Process pool for CPU-bound work, created on first use."""
+        if self._process_executor is None:
+            with self._process_lock:
+                if self._process_executor is None:
+                    self._process_executor = ProcessPoolExecutor(
+                        max_workers=self.process_workers
+                    )
+        return self._process_executor
     
     async def run_in_thread(self, func: Callable, *args, **kwargs) -> Any:
         """Run function in thread pool.
@@ -551,7 +567,10 @@ class AsyncExecutor:
     def close(self) -> None:
         """Close executor pools."""
         self.thread_executor.shutdown(wait=True)
-        self.process_executor.shutdown(wait=True)
+        with self._process_lock:
+            if self._process_executor is not None:
+                self._process_executor.shutdown(wait=True)
+                self._process_executor = None
 
 
 def cached(cache_key_func: Callable = None, ttl_seconds: int = 3600, 
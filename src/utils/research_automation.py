@@ -571,7 +571,7 @@ class ResearchAutomationEngine:
 automated: true
 rule_id: {rule.rule_id}
 rule_name: {rule.name}
-generated_at: {result.generated_at}
+generated_at: {datetime.fromtimestamp(result.generated_at).isoformat()}
 quality_score: {decision['quality_score']:.2f}
 approval_decision: {decision['auto_decision']}
 gate_used: {decision['gate_used']}
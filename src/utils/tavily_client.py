@@ -9,21 +9,28 @@ try:
 except ImportError:
     TavilySDK = None
 
+from .http_session import get_session
+
 logger = logging.getLogger(__name__)
 
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+
 
 class TavilyClient:
     """Client for enhanced web search using Tavily API."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, session=None):
         """
         Initialize Tavily client.
 
         Args:
             api_key: Tavily API key. If not provided, reads from TAVILY_API_KEY env var.
+            session: Optional aiohttp session for async requests. Defaults to
+                the shared pooled session of the running event loop.
         """
         self.api_key = api_key or os.getenv("TAVILY_API_KEY")
         self.client = None
+        self.session = session
 
         if self.api_key and TavilySDK:
             try:
@@ -93,6 +100,53 @@ class TavilyClient:
             logger.warning(f"Failed to perform Tavily search for '{query}': {e}")
             return None
 
+    async def asearch(
+        self,
+        query: str,
+        search_depth: str = "advanced",
+        max_results: int = 10,
+        include_domains: Optional[list[str]] = None,
+        exclude_domains: Optional[list[str]] = None
+    ) -> Optional[dict]:
+        """
+        Async variant of search using the pooled aiohttp session.
+
+        Args:
+            query: Search query
+            search_depth: "basic" or "advanced" (default: "advanced")
+            max_results: Maximum number of results to return (default: 10)
+            include_domains: List of domains to include in results
+            exclude_domains: List of domains to exclude from results
+
+        Returns:
+            dict with search results or None if unavailable
+        """
+        if not self.api_key:
+            return None
+
+        payload = {
+            "query": query,
+            "search_depth": search_depth,
+            "max_results": max_results
+        }
+        if include_domains:
+            payload["include_domains"] = include_domains
+        if exclude_domains:
+            payload["exclude_domains"] = exclude_domains
+
+        try:
+            session = self.session or get_session()
+            async with session.post(
+                TAVILY_SEARCH_URL,
+                json=payload,
+                headers={"Authorization": f"Bearer {self.api_key}"}
+            ) as response:
+                response.raise_for_status()
+                return await response.json()
+        except Exception as e:
+            logger.warning(f"Failed to perform Tavily search for '{query}': {e}")
+            return None
+
     def search_financial_news(
         self,
         query: str,
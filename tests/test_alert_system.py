@@ -5,6 +5,7 @@ import json
 import tempfile
 import threading
 import time
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -41,7 +42,9 @@ def mock_finnhub_client():
 @pytest.fixture
 def alert_manager(temp_data_dir, mock_finnhub_client):
     """Create an AlertManager instance for testing."""
-    return AlertManager(temp_data_dir, mock_finnhub_client)
+    manager = AlertManager(temp_data_dir, mock_finnhub_client)
+    yield manager
+    manager.close()
 
 
 @pytest.fixture
@@ -108,6 +111,49 @@ class TestAlertRule:
         assert restored.condition_value == original.condition_value
 
 
+    def test_alert_rule_to_dict_cache_invalidated(self):
+        """Test that the cached dict is rebuilt after a field changes."""
+        rule = AlertRule(
+            id='cached-rule',
+            name='Cached Rule',
+            alert_type=AlertType.PRICE_ALERT,
+            trigger=AlertTrigger.PRICE_ABOVE,
+            condition_value=100.0
+        )
+
+        first = rule.to_dict()
+        assert rule.to_dict() == first
+
+        rule.trigger_count += 1
+        updated = rule.to_dict()
+        assert updated['trigger_count'] == 1
+
+        rule.email_recipients.append('late@test.com')
+        assert rule.to_dict()['email_recipients'] == ['late@test.com']
+
+    def test_alert_rule_to_dict_returns_copies(self):
+        """Test that mutating a serialized rule does not leak into later calls."""
+        rule = AlertRule(
+            id='copied-rule',
+            name='Copied Rule',
+            alert_type=AlertType.PRICE_ALERT,
+            trigger=AlertTrigger.PRICE_ABOVE,
+            condition_value=100.0,
+            email_recipients=['a@test.com']
+        )
+
+        data = rule.to_dict()
+        data['extra'] = True
+        data['email_recipients'].append('b@test.com')
+        AlertRule.from_dict(rule.to_dict())
+
+        again = rule.to_dict()
+        assert 'extra' not in again
+        assert again['email_recipients'] == ['a@test.com']
+        assert again['alert_type'] == 'price_alert'
+        assert rule.email_recipients == ['a@test.com']
+
+
 class TestAlertEvent:
     """Test AlertEvent functionality."""
     
@@ -244,6 +290,43 @@ class TestAlertNotificationEngine:
         assert call_args[1]['json']['event']['trigger_reason'] == 'Investment thesis downgraded'
 
 
+    def test_batch_alerts_send_single_notification(self, email_config):
+        """Test that batched events for one rule produce one message per channel."""
+        engine = AlertNotificationEngine(email_config)
+
+        rule = AlertRule(
+            id='batch-test',
+            name='AAPL Above 150',
+            alert_type=AlertType.PRICE_ALERT,
+            trigger=AlertTrigger.PRICE_ABOVE,
+            condition_value=150.0,
+            ticker='AAPL',
+            email_recipients=['investor@example.com'],
+            webhook_url='https://hooks.test.com/alert'
+        )
+        events = [
+            AlertEvent(
+                alert_rule_id='batch-test',
+                timestamp=f'2024-02-03T12:0{i}:00',
+                trigger_reason=f'Price rose above $150.00 ({i})',
+                current_value=151.0 + i,
+                threshold_value=150.0,
+                ticker='AAPL'
+            )
+            for i in range(3)
+        ]
+
+        with patch.object(engine, 'send_email_alert', return_value=True) as mock_email, \
+             patch.object(engine.webhook_integrations, 'send_message', return_value=True) as mock_send:
+            assert engine.send_email_alert_batch(rule, events) is True
+            assert engine.send_webhook_alert_batch(rule, events) is True
+
+        assert mock_email.call_count == 1
+        assert 'Price rose above $150.00 (2)' in mock_email.call_args.kwargs['custom_message']
+        assert mock_send.call_count == 1
+        assert mock_send.call_args.args[1].title.startswith('🚨 3 Alerts')
+
+
 class TestAlertManager:
     """Test AlertManager functionality."""
     
@@ -453,6 +536,33 @@ class TestAlertManager:
         assert isinstance(stats['events_by_type'], dict)
         assert stats['monitoring_active'] is False  # Not started in test
     
+    def test_alert_statistics_rolling_window(self, alert_manager):
+        """Test that statistics count only recorded events inside the window."""
+        rule = alert_manager.create_price_alert('AAPL', AlertTrigger.PRICE_ABOVE, 150.0)
+
+        old_event = AlertEvent(
+            alert_rule_id=rule.id,
+            timestamp=(datetime.now() - timedelta(days=45)).isoformat(),
+            trigger_reason='Old event',
+            current_value=155.0,
+            threshold_value=150.0
+        )
+        new_event = AlertEvent(
+            alert_rule_id=rule.id,
+            timestamp=datetime.now().isoformat(),
+            trigger_reason='New event',
+            current_value=156.0,
+            threshold_value=150.0
+        )
+        alert_manager._record_alert_event(old_event)
+        alert_manager._record_alert_event(new_event)
+
+        stats = alert_manager.get_alert_statistics()
+
+        assert stats['total_events'] == 2
+        assert stats['events_last_30_days'] == 1
+        assert stats['events_by_type'] == {'price_alert': 1}
+
     def test_email_configuration(self, alert_manager):
         """Test email configuration functionality."""
         success = alert_manager.configure_email(
@@ -467,6 +577,9 @@ class TestAlertManager:
         assert alert_manager.email_config is not None
         assert alert_manager.email_config.smtp_server == 'smtp.gmail.com'
         assert alert_manager.email_config.smtp_port == 587
+
+        saved = json.loads(alert_manager.config_file.read_text())
+        assert saved['email']['smtp_server'] == 'smtp.gmail.com'
     
     def test_persistence(self, temp_data_dir, mock_finnhub_client):
         """Test alert rules and events persistence."""
@@ -498,7 +611,211 @@ class TestAlertManager:
         loaded_rules = list(manager2.alert_rules.values())
         tickers = [rule.ticker for rule in loaded_rules if rule.ticker]
         assert 'AAPL' in tickers
+        manager1.close()
+        manager2.close()
     
+    def test_rule_statistics_saved_by_flush(self, temp_data_dir, mock_finnhub_client):
+        """Test that triggered rule statistics are debounced until flushed."""
+        manager = AlertManager(temp_data_dir, mock_finnhub_client, rules_flush_interval=60)
+        rule = manager.create_price_alert('AAPL', AlertTrigger.PRICE_ABOVE, 100.0)
+
+        events = manager.check_all_alerts()
+        assert len(events) == 1
+
+        # Trigger count is not written until the pending save is flushed
+        saved = json.loads(manager.rules_file.read_text())
+        assert saved[rule.id]['trigger_count'] == 0
+
+        manager.close()
+
+        saved = json.loads(manager.rules_file.read_text())
+        assert saved[rule.id]['trigger_count'] == 1
+
+    def test_closed_manager_not_flushed_at_exit(self, temp_data_dir, mock_finnhub_client):
+        """Test that only managers left open are flushed by the exit hook."""
+        from src.utils import alert_system
+
+        open_manager = AlertManager(temp_data_dir / 'open', mock_finnhub_client)
+        closed_manager = AlertManager(temp_data_dir / 'closed', mock_finnhub_client)
+        closed_manager.close()
+
+        assert open_manager in alert_system._open_managers
+        assert closed_manager not in alert_system._open_managers
+
+        with patch.object(AlertManager, 'flush') as flush:
+            alert_system._flush_open_managers()
+        assert flush.call_count == len(alert_system._open_managers)
+        open_manager.close()
+
+    def test_triggered_events_appended_to_log(self, temp_data_dir, mock_finnhub_client):
+        """Test that triggered events are appended to the JSON Lines event log."""
+        manager1 = AlertManager(temp_data_dir, mock_finnhub_client)
+        manager1.create_price_alert('AAPL', AlertTrigger.PRICE_ABOVE, 100.0)
+        manager1.check_all_alerts()
+        manager1.check_all_alerts()
+        manager1.close()
+
+        lines = manager1.events_file.read_bytes().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])['ticker'] == 'AAPL'
+
+        manager2 = AlertManager(temp_data_dir, mock_finnhub_client)
+        assert len(manager2.alert_events) == 2
+        manager2.close()
+
+    def test_event_log_opened_on_first_append(self, temp_data_dir, mock_finnhub_client):
+        """Test that creating a manager does not create the event log file."""
+        manager = AlertManager(temp_data_dir, mock_finnhub_client)
+        assert not manager.events_file.exists()
+
+        manager.create_price_alert('AAPL', AlertTrigger.PRICE_ABOVE, 100.0)
+        manager.check_all_alerts()
+        manager.close()
+
+        assert len(manager.events_file.read_bytes().splitlines()) == 1
+
+    def test_get_alert_events_by_rule(self, alert_manager):
+        """Test filtering alert events by rule returns newest first."""
+        rule1 = alert_manager.create_price_alert('AAPL', AlertTrigger.PRICE_ABOVE, 100.0)
+        rule2 = alert_manager.create_price_alert('MSFT', AlertTrigger.PRICE_BELOW, 200.0)
+
+        for i in range(3):
+            alert_manager.check_all_alerts()
+
+        rule1_events = alert_manager.get_alert_events(rule_id=rule1.id)
+        assert len(rule1_events) == 3
+        assert all(e.alert_rule_id == rule1.id for e in rule1_events)
+        assert rule1_events[0] is alert_manager._events_by_rule[rule1.id][-1]
+
+        assert len(alert_manager.get_alert_events(rule_id=rule2.id, limit=2)) == 2
+        assert alert_manager.get_alert_events(rule_id='missing') == []
+
+    def test_load_keeps_newest_events(self, temp_data_dir, mock_finnhub_client):
+        """Test that only the newest events are loaded while iter_events streams all."""
+        events_file = temp_data_dir / 'alerts' / 'alert_events.jsonl'
+        events_file.parent.mkdir(parents=True)
+        start = datetime(2024, 1, 1)
+        with open(events_file, 'w') as f:
+            for i in range(AlertManager.MAX_EVENTS + 200):
+                event = AlertEvent(
+                    alert_rule_id='rule-a' if i % 2 else 'rule-b',
+                    timestamp=(start + timedelta(minutes=i)).isoformat(),
+                    trigger_reason=f'Event {i}',
+                    current_value=float(i),
+                    threshold_value=0.0
+                )
+                f.write(json.dumps(event.to_dict()) + '\n')
+
+        manager = AlertManager(temp_data_dir, mock_finnhub_client)
+
+        assert len(manager.alert_events) == AlertManager.MAX_EVENTS
+        assert manager.alert_events[0].trigger_reason == 'Event 200'
+        assert len(list(manager.iter_events())) == AlertManager.MAX_EVENTS + 200
+        assert len(list(manager.iter_events(rule_id='rule-a'))) == (AlertManager.MAX_EVENTS + 200) // 2
+        manager.close()
+
+    def test_event_log_compacted_by_saver(self, temp_data_dir, mock_finnhub_client):
+        """Test that the event log is compacted in the background once it grows."""
+        manager = AlertManager(temp_data_dir, mock_finnhub_client)
+        manager.alert_events = deque(maxlen=5)
+        manager.EVENTS_COMPACT_THRESHOLD = 9
+
+        for i in range(10):
+            manager._record_alert_event(AlertEvent(
+                alert_rule_id='rule-a',
+                timestamp=datetime.now().isoformat(),
+                trigger_reason=f'Event {i}',
+                current_value=float(i),
+                threshold_value=0.0
+            ))
+
+        manager.close()
+
+        events = list(manager.iter_events())
+        assert len(events) == 5
+        assert events[-1].trigger_reason == 'Event 9'
+
+    def test_compaction_during_record_does_not_duplicate(self, temp_data_dir, mock_finnhub_client):
+        """Test that a compaction racing an event append logs each event once."""
+        manager = AlertManager(temp_data_dir, mock_finnhub_client)
+        append = manager._append_alert_events
+        compactions = []
+
+        def append_after_compaction_attempt(events):
+            # Compact from another thread in the middle of recording
+            compactor = threading.Thread(target=manager._save_alert_events)
+            compactor.start()
+            compactor.join(timeout=0.2)
+            compactions.append(compactor)
+            return append(events)
+
+        with patch.object(manager, '_append_alert_events', side_effect=append_after_compaction_attempt):
+            manager._record_alert_event(AlertEvent(
+                alert_rule_id='rule-a',
+                timestamp=datetime.now().isoformat(),
+                trigger_reason='Racing event',
+                current_value=1.0,
+                threshold_value=0.0
+            ))
+        for compactor in compactions:
+            compactor.join()
+        manager.close()
+
+        assert [e.trigger_reason for e in manager.iter_events()] == ['Racing event']
+
+    def test_compaction_writes_compressed_snapshot(self, temp_data_dir, mock_finnhub_client):
+        """Test that compaction moves retained events into the zstd snapshot."""
+        pytest.importorskip('zstandard')
+        manager1 = AlertManager(temp_data_dir, mock_finnhub_client)
+        for i in range(3):
+            manager1._record_alert_event(AlertEvent(
+                alert_rule_id='rule-a',
+                timestamp=f'2024-02-03T12:0{i}:00',
+                trigger_reason=f'Event {i}',
+                current_value=float(i),
+                threshold_value=0.0
+            ))
+        manager1._save_alert_events()
+        manager1._record_alert_event(AlertEvent(
+            alert_rule_id='rule-a',
+            timestamp='2024-02-03T12:05:00',
+            trigger_reason='Event 3',
+            current_value=3.0,
+            threshold_value=0.0
+        ))
+        manager1.close()
+
+        assert manager1.events_snapshot_file.exists()
+        assert len(manager1.events_file.read_bytes().splitlines()) == 1
+
+        manager2 = AlertManager(temp_data_dir, mock_finnhub_client)
+        assert [e.trigger_reason for e in manager2.alert_events] == [f'Event {i}' for i in range(4)]
+        manager2.close()
+
+    def test_legacy_events_file_migrated(self, temp_data_dir, mock_finnhub_client):
+        """Test that a JSON array events file from older versions is migrated."""
+        alerts_dir = temp_data_dir / 'alerts'
+        alerts_dir.mkdir(parents=True)
+        legacy_events = [
+            AlertEvent(
+                alert_rule_id='rule-a',
+                timestamp=f'2024-02-03T12:0{i}:00',
+                trigger_reason=f'Event {i}',
+                current_value=150.5 + i,
+                threshold_value=150.0
+            ).to_dict()
+            for i in range(3)
+        ]
+        (alerts_dir / 'alert_events.json').write_text(json.dumps(legacy_events, indent=2))
+
+        manager = AlertManager(temp_data_dir, mock_finnhub_client)
+
+        assert len(manager.alert_events) == 3
+        assert manager.alert_events[-1].current_value == 152.5
+        assert not (alerts_dir / 'alert_events.json').exists()
+        assert len(manager.events_file.read_bytes().splitlines()) == 3
+        manager.close()
+
     def test_monitoring_lifecycle(self, alert_manager):
         """Test starting and stopping alert monitoring."""
         # Verify monitoring is initially stopped
@@ -568,7 +885,94 @@ class TestAlertIntegration:
             updated_rule = manager.alert_rules[rule.id]
             assert updated_rule.trigger_count == 1
             assert updated_rule.last_triggered is not None
+        
+        manager.close()
     
+    def test_email_and_webhook_delivered_together(self, temp_data_dir, mock_finnhub_client):
+        """Test that rules with email and webhook deliver through both channels."""
+        manager = AlertManager(temp_data_dir, mock_finnhub_client)
+        rule = manager.create_alert_rule(
+            name='AAPL Above 100',
+            alert_type=AlertType.PRICE_ALERT,
+            trigger=AlertTrigger.PRICE_ABOVE,
+            condition_value=100.0,
+            ticker='AAPL',
+            email_recipients=['investor@test.com'],
+            webhook_url='https://hooks.test.com/alert'
+        )
+
+        with patch.object(manager.notification_engine, 'send_email_alert', return_value=True), \
+             patch.object(manager.notification_engine, 'send_webhook_alert', return_value=False):
+            events = manager.check_all_alerts()
+
+        manager.close()
+
+        assert len(events) == 1
+        assert events[0].delivered is True
+        assert events[0].delivery_methods == ['email']
+        assert manager.alert_rules[rule.id].trigger_count == 1
+
+    def test_alert_storm_batched_per_delivery_window(self, temp_data_dir, mock_finnhub_client):
+        """Test that repeated triggers within the window are sent as one batch."""
+        manager = AlertManager(temp_data_dir, mock_finnhub_client)
+        manager.DELIVERY_BATCH_WINDOW = 0.2
+        manager.configure_email('smtp.test.com', 587, 'test@test.com', 'testpass')
+        rule = manager.create_price_alert('AAPL', AlertTrigger.PRICE_ABOVE, 100.0,
+                                          emails=['investor@test.com'])
+
+        # Set once the saver has sent and recorded the queued batch
+        batch_recorded = threading.Event()
+        record = manager._record_alert_events
+
+        def record_and_signal(events):
+            record(events)
+            if len(events) > 1:
+                batch_recorded.set()
+
+        with patch.object(manager.notification_engine, 'send_email_alert',
+                          return_value=True) as send_email, \
+                patch.object(manager, '_record_alert_events', side_effect=record_and_signal):
+            events = [event for _ in range(3) for event in manager.check_all_alerts()]
+
+            # The first trigger goes out immediately; the rest wait for the window
+            assert send_email.call_count == 1
+            assert events[0].delivered is True
+            assert events[1].delivered is False
+            assert len(manager.get_alert_events(rule.id)) == 1
+
+            assert batch_recorded.wait(timeout=5)
+            assert send_email.call_count == 2
+            assert '2 Alerts Triggered' in send_email.call_args.kwargs['custom_message']
+            assert all(event.delivered for event in events)
+
+        manager.close()
+        assert manager._pending_deliveries == {}
+
+        # The log was written after delivery, so a restart sees the final status
+        reloaded = AlertManager(temp_data_dir, mock_finnhub_client)
+        assert [event.delivered for event in reloaded.get_alert_events(rule.id)] == [True] * 3
+        reloaded.close()
+
+    def test_queued_alerts_for_deleted_rule_logged(self, temp_data_dir, mock_finnhub_client, caplog):
+        """Test that a queued batch whose rule was deleted is recorded and reported, not sent."""
+        manager = AlertManager(temp_data_dir, mock_finnhub_client)
+        manager.DELIVERY_BATCH_WINDOW = 60
+        manager.configure_email('smtp.test.com', 587, 'test@test.com', 'testpass')
+        rule = manager.create_price_alert('AAPL', AlertTrigger.PRICE_ABOVE, 100.0,
+                                          emails=['investor@test.com'])
+
+        with patch.object(manager.notification_engine, 'send_email_alert',
+                          return_value=True) as send_email:
+            manager.check_all_alerts()
+            queued = manager.check_all_alerts()
+            manager.delete_alert_rule(rule.id)
+            manager.close()
+
+        assert send_email.call_count == 1
+        assert f'Not sending 1 queued alerts for deleted rule {rule.id}' in caplog.text
+        assert queued[0].delivered is False
+        assert len(manager.get_alert_events(rule.id)) == 2
+
     def test_multiple_alerts_different_types(self, temp_data_dir):
         """Test handling multiple different alert types."""
         mock_client = Mock(spec=FinnhubClient)
@@ -608,6 +1012,7 @@ class TestAlertIntegration:
         rule_types = [rule.alert_type for rule in manager.alert_rules.values()]
         assert AlertType.PRICE_ALERT in rule_types
         assert AlertType.DAILY_DIGEST in rule_types
+        manager.close()
     
     def test_error_handling(self, temp_data_dir):
         """Test error handling in alert system."""
@@ -629,4 +1034,5 @@ class TestAlertIntegration:
         
         # Rule should still exist
         assert len(manager.alert_rules) == 1
-        assert rule.trigger_count == 0  # Not incremented due to error
\ No newline at end of file
+        assert rule.trigger_count == 0  # Not incremented due to error
+        manager.close()
\ No newline at end of file
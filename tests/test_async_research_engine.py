@@ -0,0 +1,167 @@
+"""Tests for the asynchronous research engine."""
+
+import asyncio
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.async_research_engine import AsyncResearchEngine
+
+
+EXPLORE_SECONDS = 0.3
+
+
+class SlowExploreAgent:
+    """Explore agent stub whose explore call blocks like a real research run."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def explore(self, query, depth=2, use_cache=True):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(EXPLORE_SECONDS)
+        with self.lock:
+            self.running -= 1
+        return f"report for {query}"
+
+
+class BatchExploreAgent(SlowExploreAgent):
+    """Explore agent stub that also supports batched exploration."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def batch_explore(self, queries, depth=2, use_cache=True):
+        self.batches.append(list(queries))
+        return [f"report for {query}" for query in queries]
+
+
+def count_words(content, path):
+    """Module-level analyzer so it can be pickled into the process pool."""
+    return {'path': path, 'words': len(content.split())}
+
+
+@pytest.fixture
+def temp_data_dir():
+    """Create a temporary data directory for testing."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+def run_bulk(agent, data_dir, queries, max_workers=8):
+    """Submit queries as bulk research and wait for every result."""
+    async def scenario():
+        with patch('src.utils.async_research_engine.ExploreAgent', return_value=agent):
+            engine = AsyncResearchEngine(data_dir, max_workers=max_workers)
+        try:
+            task_ids = await engine.submit_bulk_research(queries)
+            results = await engine.wait_for_all_tasks(timeout=30)
+        finally:
+            await engine.shutdown()
+        return task_ids, results
+
+    return asyncio.run(scenario())
+
+
+class TestBulkResearch:
+    """Tests for bulk research submission."""
+
+    def test_bulk_tasks_explore_concurrently(self, temp_data_dir):
+        """Test that agents without batch_explore still explore tasks in parallel."""
+        agent = SlowExploreAgent()
+        queries = [f"theme {i}" for i in range(8)]
+
+        start = time.monotonic()
+        task_ids, results = run_bulk(agent, temp_data_dir, queries)
+        elapsed = time.monotonic() - start
+
+        assert all(results[task_id].success for task_id in task_ids)
+        assert agent.max_running > 1
+        assert elapsed < EXPLORE_SECONDS * len(queries) / 2
+
+    def test_bulk_tasks_coalesced_with_batch_explore(self, temp_data_dir):
+        """Test that agents with batch_explore receive concurrent tasks together."""
+        agent = BatchExploreAgent()
+        queries = [f"theme {i}" for i in range(4)]
+
+        task_ids, results = run_bulk(agent, temp_data_dir, queries)
+
+        assert [results[task_id].result['content'] for task_id in task_ids] == [
+            f"report for {query}" for query in queries
+        ]
+        assert sorted(q for batch in agent.batches for q in batch) == sorted(queries)
+        assert len(agent.batches) < len(queries)
+
+    def test_wait_ignores_completions_from_earlier_rounds(self, temp_data_dir):
+        """Test that a later wait still blocks until the newly submitted tasks finish."""
+        agent = SlowExploreAgent()
+
+        async def scenario():
+            with patch('src.utils.async_research_engine.ExploreAgent', return_value=agent):
+                engine = AsyncResearchEngine(temp_data_dir, max_workers=4)
+            try:
+                first = await engine.submit_bulk_research(["round one a", "round one b"])
+                await engine.wait_for_all_tasks(timeout=30)
+                second = await engine.submit_bulk_research(["round two a", "round two b"])
+                results = await engine.wait_for_all_tasks(timeout=30)
+            finally:
+                await engine.shutdown()
+            return first + second, results
+
+        task_ids, results = asyncio.run(scenario())
+
+        assert all(results[task_id].success for task_id in task_ids)
+
+
+class TestDocumentAnalysis:
+    """Tests for batched document analysis."""
+
+    def test_process_pool_created_only_for_cpu_bound_work(self, temp_data_dir):
+        """Test that the worker processes are spawned lazily and capped by default."""
+        doc = temp_data_dir / "doc.md"
+        doc.write_text("one two three", encoding="utf-8")
+
+        async def scenario():
+            with patch('src.utils.async_research_engine.ExploreAgent', return_value=SlowExploreAgent()):
+                engine = AsyncResearchEngine(temp_data_dir, max_workers=8)
+            try:
+                await engine.batch_analyze_documents([doc], count_words)
+                assert engine.executor._process_executor is None
+
+                results = await engine.batch_analyze_documents([doc], count_words, cpu_bound=True)
+                assert engine.executor._process_executor is not None
+                assert engine.executor.process_workers == 2
+            finally:
+                await engine.shutdown()
+            assert engine.executor._process_executor is None
+            return results
+
+        assert asyncio.run(scenario()) == [{'path': str(doc), 'words': 3}]
+
+    def test_engine_reused_across_event_loops(self, temp_data_dir):
+        """Test that one engine can submit and wait under successive asyncio.run calls."""
+        with patch('src.utils.async_research_engine.ExploreAgent', return_value=SlowExploreAgent()):
+            engine = AsyncResearchEngine(temp_data_dir, max_workers=4)
+
+        async def run_round(queries):
+            task_ids = await engine.submit_bulk_research(queries)
+            return task_ids, await engine.wait_for_all_tasks(timeout=30)
+
+        try:
+            first_ids, first = asyncio.run(run_round(["loop one a", "loop one b", "loop one c"]))
+            second_ids, second = asyncio.run(run_round(["loop two a", "loop two b", "loop two c"]))
+        finally:
+            asyncio.run(engine.shutdown())
+
+        assert len(first) == 3
+        assert len(second) == 6
+        assert all(second[task_id].success for task_id in first_ids + second_ids)
@@ -251,6 +251,22 @@ class TestInteractiveChartGenerator:
             assert len(datasets) == 1
             assert 'Research Documents' in datasets[0]['label']
     
+    def test_research_metrics_reused_until_files_change(self, chart_generator, sample_research_metrics):
+        """Test that research metrics are only re-analyzed when documents change."""
+        research_dir = chart_generator.research_dir
+        research_dir.mkdir(parents=True)
+        (research_dir / 'first.md').write_text('# First')
+        
+        with patch.object(chart_generator.analytics_engine, 'analyze_all_documents',
+                         return_value=sample_research_metrics) as analyze:
+            chart_generator.generate_sector_distribution_chart()
+            chart_generator.generate_research_volume_chart()
+            assert analyze.call_count == 1
+            
+            (research_dir / 'second.md').write_text('# Second')
+            chart_generator.generate_research_volume_chart()
+            assert analyze.call_count == 2
+    
     def test_ticker_correlation_heatmap(self, chart_generator):
         """Test generating correlation heatmap."""
         tickers = ['AAPL', 'MSFT', 'GOOGL']
@@ -303,7 +319,16 @@ class TestInteractiveChartGenerator:
         assert point1['x'] == 80.0  # 0.8 * 100
         assert point1['y'] == 15.5
         assert point1['label'] == 'AAPL'
-    
+
+    def test_sample_performance_scatter_plot(self, chart_generator):
+        """Test that the sample scatter plot builds instead of hitting the error chart."""
+        chart_data = chart_generator.generate_performance_scatter_plot()
+
+        assert chart_data.chart_type == 'scatter'
+        assert len(chart_data.data['datasets'][0]['data']) == 50
+        assert isinstance(chart_data.options['scales']['y']['grid']['color'], str)
+        json.dumps(chart_data.to_dict())
+
     def test_multi_ticker_comparison(self, chart_generator):
         """Test generating multi-ticker comparison chart."""
         tickers = ['AAPL', 'MSFT', 'GOOGL']
@@ -376,7 +401,20 @@ class TestInteractiveChartGenerator:
         assert exported_data['title'] == chart_data.title
         assert 'data' in exported_data
         assert 'options' in exported_data
-    
+
+    def test_chart_export_streams_large_datasets(self, chart_generator):
+        """Test that streamed exports produce the same JSON document."""
+        pytest.importorskip('orjson')
+        chart_data = chart_generator.generate_price_chart('AAPL')
+
+        with patch('src.utils.chart_generator.STREAM_EXPORT_POINTS', 0):
+            output_path = chart_generator.export_chart_data(chart_data, 'streamed_chart')
+
+        with open(output_path, 'r') as f:
+            exported_data = json.load(f)
+
+        assert exported_data == json.loads(json.dumps(chart_data.to_dict()))
+
     def test_error_handling_in_chart_generation(self, chart_generator):
         """Test error handling when chart generation fails."""
         # Mock analytics engine to raise exception
@@ -399,7 +437,23 @@ class TestInteractiveChartGenerator:
         assert chart_data.chart_type == 'bar'
         assert chart_data.data['labels'] == ['No Data']
         assert chart_data.data['datasets'][0]['data'] == [0]
-    
+
+    def test_empty_charts_do_not_share_options(self, chart_generator):
+        """Test that editing one chart's data or options leaves later charts intact."""
+        first = chart_generator._create_empty_chart("first")
+        first.data['datasets'][0]['data'].append(5)
+        first.options['plugins']['title']['font']['size'] = 30
+        first.options['plugins']['legend']['display'] = True
+        first.options['scales']['x']['display'] = True
+
+        second = chart_generator._create_empty_chart("second")
+
+        assert second.data['datasets'][0]['data'] == [0]
+        assert second.options['plugins']['title']['font']['size'] == 16
+        assert second.options['plugins']['legend'] == {'display': False}
+        assert second.options['scales'] == {'y': {'display': False}, 'x': {'display': False}}
+        json.dumps(second.to_dict())
+
     def test_create_error_chart(self, chart_generator):
         """Test creating error chart."""
         error_message = "API connection failed"
@@ -559,7 +613,29 @@ class TestChartIntegration:
         # Verify data structure is correct
         data_points = chart_data.data['datasets'][0]['data']
         assert all('x' in point and 'y' in point and 'label' in point for point in data_points)
-    
+
+    def test_large_datasets_are_downsampled(self, temp_data_dir):
+        """Test that oversized series are reduced to max_points."""
+        pytest.importorskip('numpy')
+        performance_data = [
+            {'confidence': (i % 97) / 100.0, 'return_pct': (i * 7) % 80 - 30, 'ticker': f'S{i}'}
+            for i in range(5000)
+        ]
+
+        mock_client = Mock(spec=FinnhubClient)
+        generator = InteractiveChartGenerator(temp_data_dir, mock_client)
+
+        scatter = generator.generate_performance_scatter_plot(performance_data, max_points=500)
+        points = scatter.data['datasets'][0]['data']
+        assert len(points) == 500
+        assert min(p['x'] for p in points) == 0.0
+        assert max(p['x'] for p in points) == 96.0
+
+        price = generator.generate_price_chart('AAPL', period_days=3000, max_points=400)
+        assert len(price.data['labels']) == 400
+        assert len(price.data['datasets'][0]['data']) == 400
+        assert price.data['labels'] == sorted(price.data['labels'])
+
     def test_multiple_chart_export(self, temp_data_dir):
         """Test exporting multiple charts."""
         mock_client = Mock(spec=FinnhubClient)
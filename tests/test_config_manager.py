@@ -0,0 +1,87 @@
+"""Tests for the configuration manager."""
+
+import logging
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.utils import config_manager
+from src.utils.config_manager import ConfigurationManager, get_config, get_config_manager
+
+
+@pytest.fixture
+def root_logger():
+    """Restore the root logger's handlers and level after the test."""
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    yield root
+    for handler in root.handlers:
+        if handler not in saved_handlers:
+            handler.close()
+    root.handlers[:] = saved_handlers
+    root.setLevel(saved_level)
+
+
+@pytest.fixture
+def shared_managers(root_logger):
+    """Reset the shared configuration managers around the test."""
+    saved = config_manager._default_config_manager
+    config_manager._cached_config_manager.cache_clear()
+    config_manager._default_config_manager = None
+    yield
+    config_manager._cached_config_manager.cache_clear()
+    config_manager._default_config_manager = saved
+
+
+class TestSharedManager:
+    """Tests for the shared configuration manager."""
+
+    def test_first_manager_shared_however_called(self, shared_managers):
+        """Test that positional, keyword and argument-less calls share one manager."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = get_config_manager(Path(temp_dir))
+
+            assert get_config_manager(config_dir=Path(temp_dir)) is manager
+            assert get_config_manager(temp_dir) is manager
+            assert get_config_manager() is manager
+            assert get_config() is manager.config
+
+    def test_other_directories_get_their_own_manager(self, shared_managers):
+        """Test that an explicit different directory does not replace the shared manager."""
+        with tempfile.TemporaryDirectory() as first_dir, tempfile.TemporaryDirectory() as second_dir:
+            first = get_config_manager(Path(first_dir))
+            second = get_config_manager(Path(second_dir), environment="test")
+
+            assert second is not first
+            assert get_config_manager(Path(second_dir), "test") is second
+            assert get_config_manager() is first
+
+
+class TestLoggingSetup:
+    """Tests for deferred logging setup."""
+
+    def test_first_record_written_once(self, root_logger):
+        """Test that the record triggering setup reaches each handler exactly once."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_dir = Path(temp_dir)
+            log_file = config_dir / "logs" / "app.log"
+            (config_dir / "config.yml").write_text(
+                "logging:\n"
+                "  enable_console: true\n"
+                "  enable_file: true\n"
+                f"  file_path: {log_file}\n"
+                "  format: '%(message)s'\n",
+                encoding="utf-8",
+            )
+
+            ConfigurationManager(config_dir=config_dir, environment="test")
+            assert not log_file.exists()
+
+            logger = logging.getLogger("supply_chain_intel.test")
+            logger.info("first")
+            logger.info("second")
+            for handler in root_logger.handlers:
+                handler.flush()
+
+            assert log_file.read_text(encoding="utf-8").splitlines() == ["first", "second"]
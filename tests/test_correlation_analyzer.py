@@ -0,0 +1,131 @@
+"""Tests for the multi-theme correlation analyzer."""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.utils import correlation_analyzer
+from src.utils.correlation_analyzer import MultiThemeCorrelationAnalyzer
+
+
+AI_RESEARCH = """# Investment Research: AI Infrastructure
+
+## Top Picks
+
+NVIDIA (NVDA) is a strong buy with clear outperform potential.
+Micron Technology (MU) looks undervalued as memory demand grows.
+THE ETF sleeve stays small.
+
+## Risks
+
+INTC faces weak demand.
+"""
+
+POWER_RESEARCH = """# Investment Research: Power Grid
+
+### Top Picks
+
+Micron Technology (MU) is a strong opportunity as data center power draw grows.
+Vistra (VST) remains a buy.
+"""
+
+
+@pytest.fixture
+def temp_data_dir():
+    """Create a temporary data directory with research files."""
+    temp_dir = Path(tempfile.mkdtemp())
+    research_dir = temp_dir / "research"
+    research_dir.mkdir()
+    (research_dir / "ai_infrastructure_2026.md").write_text(AI_RESEARCH, encoding="utf-8")
+    (research_dir / "power_grid_2026.md").write_text(POWER_RESEARCH, encoding="utf-8")
+    yield temp_dir
+    shutil.rmtree(temp_dir)
+
+
+class TestNarrativeExtraction:
+    """Tests for tickers extracted from recommendation sections."""
+
+    def test_top_picks_section_extracted(self, temp_data_dir):
+        """Test that tickers under ## Top Picks are extracted up to the next heading."""
+        analyzer = MultiThemeCorrelationAnalyzer(temp_data_dir)
+        companies = {
+            company.ticker: company
+            for company in analyzer.extract_companies_from_research(AI_RESEARCH, "ai_infrastructure_2026.md")
+        }
+
+        assert set(companies) == {"NVDA", "MU"}
+
+        nvda = companies["NVDA"]
+        assert nvda.theme == "AI Infrastructure"
+        assert nvda.sentiment == "positive"
+        assert nvda.role == "Mentioned in investment recommendations"
+        assert nvda.rationale == "NVDA) is a strong buy with clear outperform potential."
+        assert nvda.research_file == "ai_infrastructure_2026.md"
+        assert companies["MU"].company_name == "Micron Technology"
+
+    def test_no_recommendation_section(self, temp_data_dir):
+        """Test that tickers outside recommendation sections are ignored."""
+        analyzer = MultiThemeCorrelationAnalyzer(temp_data_dir)
+        content = "# Investment Research: Batteries\n\n## Overview\n\nALB and LTHM both report soon.\n"
+
+        assert analyzer.extract_companies_from_research(content, "batteries.md") == []
+
+
+class TestCrossThemeAnalysis:
+    """Tests for overlaps and opportunities built from research files."""
+
+    def test_theme_overlap_from_top_picks(self, temp_data_dir):
+        """Test that a ticker picked in two themes produces an overlap."""
+        analyzer = MultiThemeCorrelationAnalyzer(temp_data_dir)
+        overlaps = analyzer.analyze_theme_correlations()
+
+        assert len(overlaps) == 1
+        overlap = overlaps[0]
+        assert {overlap.theme1, overlap.theme2} == {"AI Infrastructure", "Power Grid"}
+        assert overlap.common_tickers == ["MU"]
+        assert overlap.correlation_type == "complementary"
+
+    def test_cross_theme_opportunity_from_top_picks(self, temp_data_dir):
+        """Test that a ticker picked positively in two themes is a multi-theme winner."""
+        analyzer = MultiThemeCorrelationAnalyzer(temp_data_dir)
+        opportunities = analyzer.identify_cross_theme_opportunities()
+
+        assert [opportunity.ticker for opportunity in opportunities] == ["MU"]
+        opportunity = opportunities[0]
+        assert opportunity.opportunity_type == "multi_theme_winner"
+        assert sorted(opportunity.themes) == ["AI Infrastructure", "Power Grid"]
+        assert opportunity.conflicting_themes == []
+
+
+class TestResearchLoading:
+    """Tests for loading research corpora."""
+
+    def test_large_corpus_reuses_parse_pool(self, temp_data_dir):
+        """Test that parallel loads share one bounded pool and match serial parsing."""
+        research_dir = temp_data_dir / "research"
+        for i in range(correlation_analyzer.PARALLEL_PARSE_MIN_FILES):
+            (research_dir / f"extra_{i}.md").write_text(
+                f"# Investment Research: Theme {i}\n\n## Top Picks\n\nMicron (MU) is a buy.\n",
+                encoding="utf-8",
+            )
+
+        first = MultiThemeCorrelationAnalyzer(temp_data_dir)
+        themes = first._get_available_themes()
+        pool = correlation_analyzer._parse_pool
+        assert pool is not None
+
+        second = MultiThemeCorrelationAnalyzer(temp_data_dir)
+        assert second._get_available_themes() == themes
+        assert correlation_analyzer._parse_pool is pool
+        assert pool._max_workers <= correlation_analyzer.PARSE_POOL_MAX_WORKERS
+
+        serial = {
+            research_file.name: second._parse_research_file(research_file)[1]
+            for research_file in research_dir.glob("*.md")
+        }
+        assert sorted(c.ticker for cs in serial.values() for c in cs) == sorted(
+            c.ticker for cs in second._theme_companies.values() for c in cs
+        )
+        assert len(themes) == correlation_analyzer.PARALLEL_PARSE_MIN_FILES + 2
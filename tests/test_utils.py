@@ -52,6 +52,27 @@ class TestConfigLoader:
             loaded = json.load(f)
         assert loaded == test_data
 
+    def test_load_json_cache_tracks_file_changes(self, temp_config_dir):
+        """Test cached loads return copies and pick up rewritten files."""
+        loader = ConfigLoader(config_dir=temp_config_dir)
+        loader.save_json("cached.json", {"count": 1})
+
+        first = loader.load_json("cached.json")
+        first["count"] = 99
+        assert loader.load_json("cached.json") == {"count": 1}
+
+        loader.save_json("cached.json", {"count": 2, "extra": True})
+        assert loader.load_json("cached.json") == {"count": 2, "extra": True}
+
+    def test_save_json_replaces_file_atomically(self, temp_config_dir):
+        """Test saving goes through a temp file that does not linger."""
+        loader = ConfigLoader(config_dir=temp_config_dir)
+        loader.save_json("atomic.json", {"version": 1})
+        loader.save_json("atomic.json", {"version": 2})
+
+        assert loader.load_json("atomic.json") == {"version": 2}
+        assert [p.name for p in temp_config_dir.iterdir()] == ["atomic.json"]
+
     def test_get_api_config_defaults(self, temp_config_dir):
         """Test API config returns defaults when no file exists."""
         loader = ConfigLoader(config_dir=temp_config_dir)